@@ -0,0 +1,85 @@
+"""Compare JSON backends on a representative product list payload.
+
+Times decoding (as done for API responses and cache reads) and encoding
+(as done for cache writes) with every installed backend. Each measurement
+is repeated and the median is reported.
+
+Usage:
+    python benchmarks/bench_json.py [--products 20000] [--runs 7]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from villa_ecommerce_sdk import serialization  # noqa: E402
+
+CATEGORIES = ["Fresh Produce", "Bakery", "Dairy", "Beverages", "Snacks", "Household", "Imported"]
+
+
+def product_payload(count: int) -> dict:
+    """Build a product list shaped like /api/product/productlist/onlineData/{branch}."""
+    rng = random.Random(42)
+    products = []
+    for i in range(count):
+        products.append({
+            "productId": f"P{i:08d}",
+            "sku": f"{8850000000000 + i}",
+            "name": f"Product {i} สินค้า",
+            "category": rng.choice(CATEGORIES),
+            "price": round(rng.uniform(5, 2500), 2),
+            "salePrice": round(rng.uniform(5, 2500), 2) if rng.random() < 0.2 else None,
+            "unit": rng.choice(["ea", "kg", "pack"]),
+            "isActive": rng.random() > 0.05,
+            "stock": rng.randint(0, 500),
+            "tags": rng.sample(["organic", "promo", "new", "imported", "frozen"], k=2),
+            "updatedAt": "2026-10-01T08:00:00Z",
+        })
+    return {"status": "success", "count": count, "products": products}
+
+
+def median_ms(fn, runs: int) -> float:
+    """Median wall time of fn in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000, help="products in the payload")
+    parser.add_argument("--runs", type=int, default=7, help="repetitions per measurement")
+    args = parser.parse_args()
+
+    data = product_payload(args.products)
+    serialization.set_json_backend("json")
+    payload = serialization.json_dumps(data)
+    print(f"payload: {args.products} products, {len(payload) / 1e6:.1f} MB\n")
+    print(f"{'backend':<10}{'decode ms':>12}{'encode ms':>12}{'decode x':>10}{'encode x':>10}")
+
+    baseline = None
+    for name in serialization.JSON_BACKENDS[::-1]:
+        try:
+            serialization.set_json_backend(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>24}")
+            continue
+        assert serialization.json_loads(payload) == data
+        decode = median_ms(lambda: serialization.json_loads(payload), args.runs)
+        encode = median_ms(lambda: serialization.json_dumps(data), args.runs)
+        if baseline is None:
+            baseline = (decode, encode)
+        print(f"{name:<10}{decode:>12.1f}{encode:>12.1f}"
+              f"{baseline[0] / decode:>9.1f}x{baseline[1] / encode:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Measure SDK import and client construction cost in fresh interpreters.
+
+Each scenario runs in a new Python process (so nothing is already
+imported) and is repeated several times; the median is reported.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 7]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Each snippet must leave its measured duration in `elapsed` (seconds)
+SCENARIOS = {
+    "import villa_ecommerce_sdk": """
+start = time.perf_counter()
+import villa_ecommerce_sdk
+elapsed = time.perf_counter() - start
+""",
+    "import + VillaClient()": """
+start = time.perf_counter()
+from villa_ecommerce_sdk import VillaClient
+client = VillaClient()
+elapsed = time.perf_counter() - start
+""",
+    "VillaClient() + payment service": """
+start = time.perf_counter()
+from villa_ecommerce_sdk import VillaClient
+client = VillaClient()
+client.payment_service
+elapsed = time.perf_counter() - start
+""",
+    "VillaClient() + all services + S3 client": """
+start = time.perf_counter()
+from villa_ecommerce_sdk import VillaClient
+client = VillaClient()
+client.products_service, client.inventory_service, client.payment_service
+client.s3_cache.s3_client
+elapsed = time.perf_counter() - start
+""",
+}
+
+RUNNER = """
+import json, sys, time
+{body}
+print(json.dumps({{
+    "elapsed": elapsed,
+    "pandas": "pandas" in sys.modules,
+    "boto3": "boto3" in sys.modules,
+}}))
+"""
+
+
+def run_scenario(body: str, runs: int) -> dict:
+    """Run one scenario in fresh interpreters and summarize the timings."""
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    # Region is needed by boto3.client; credentials are never resolved here
+    env.setdefault("AWS_DEFAULT_REGION", "ap-southeast-1")
+    samples = []
+    result = {}
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", RUNNER.format(body=body)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["elapsed"])
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "pandas": result["pandas"],
+        "boto3": result["boto3"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="runs per scenario (default: 7)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<44}{'median ms':>11}{'min ms':>9}  pandas  boto3")
+    for name, body in SCENARIOS.items():
+        stats = run_scenario(body, args.runs)
+        print(
+            f"{name:<44}{stats['median_ms']:>11.1f}{stats['min_ms']:>9.1f}"
+            f"  {'yes' if stats['pandas'] else 'no':<6}  {'yes' if stats['boto3'] else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,145 @@
 """Villa Ecommerce SDK for Python."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from villa_ecommerce_sdk.client import VillaClient
-from villa_ecommerce_sdk.base import BaseService
-from villa_ecommerce_sdk.payments import PaymentService
-from villa_ecommerce_sdk.products import ProductsService
-from villa_ecommerce_sdk.inventory import InventoryService
+# Public names are imported on first attribute access (PEP 562) so that
+# `import villa_ecommerce_sdk` does not pay for pandas, boto3 or httpx.
+_LAZY_IMPORTS = {
+    'VillaClient': 'villa_ecommerce_sdk.client',
+    'BaseService': 'villa_ecommerce_sdk.base',
+    'PaymentService': 'villa_ecommerce_sdk.payments',
+    'ProductsService': 'villa_ecommerce_sdk.products',
+    'InventoryService': 'villa_ecommerce_sdk.inventory',
+    'CacheBackend': 'villa_ecommerce_sdk.cache',
+    'CacheEntry': 'villa_ecommerce_sdk.cache',
+    'S3Cache': 'villa_ecommerce_sdk.cache',
+    'HTTPTransport': 'villa_ecommerce_sdk.transport',
+    'TransportStats': 'villa_ecommerce_sdk.transport',
+    'BulkResult': 'villa_ecommerce_sdk.bulk',
+    'MemoryCache': 'villa_ecommerce_sdk.memory_cache',
+    'MemoryCacheStats': 'villa_ecommerce_sdk.memory_cache',
+    'TieredCache': 'villa_ecommerce_sdk.tiered_cache',
+    'DiskCache': 'villa_ecommerce_sdk.disk_cache',
+    'DiskCacheStats': 'villa_ecommerce_sdk.disk_cache',
+    'RedisCache': 'villa_ecommerce_sdk.redis_cache',
+    'ParquetFrameCache': 'villa_ecommerce_sdk.frame_cache',
+    'Filter': 'villa_ecommerce_sdk.filters',
+    'compile_filter': 'villa_ecommerce_sdk.filters',
+    'Codec': 'villa_ecommerce_sdk.serialization',
+    'get_codec': 'villa_ecommerce_sdk.serialization',
+    'SingleFlight': 'villa_ecommerce_sdk.singleflight',
+    'SingleFlightStats': 'villa_ecommerce_sdk.singleflight',
+    'AsyncSingleFlight': 'villa_ecommerce_sdk.singleflight',
+    'RetryPolicy': 'villa_ecommerce_sdk.resilience',
+    'CircuitBreaker': 'villa_ecommerce_sdk.resilience',
+    'CircuitOpenError': 'villa_ecommerce_sdk.resilience',
+    'Hedger': 'villa_ecommerce_sdk.hedging',
+    'HedgingStats': 'villa_ecommerce_sdk.hedging',
+    'RecordSchema': 'villa_ecommerce_sdk.schema',
+    'MemoryReport': 'villa_ecommerce_sdk.schema',
+    'StatusTTL': 'villa_ecommerce_sdk.status',
+    'SubmissionJournal': 'villa_ecommerce_sdk.submissions',
+    'SubmissionResult': 'villa_ecommerce_sdk.submissions',
+    'AsyncVillaClient': 'villa_ecommerce_sdk.async_client',
+    'AsyncBaseService': 'villa_ecommerce_sdk.async_base',
+    'AsyncCacheAdapter': 'villa_ecommerce_sdk.async_cache',
+    'AsyncS3Cache': 'villa_ecommerce_sdk.async_cache',
+    'AsyncProductsService': 'villa_ecommerce_sdk.async_services',
+    'AsyncInventoryService': 'villa_ecommerce_sdk.async_services',
+    'AsyncPaymentService': 'villa_ecommerce_sdk.async_services',
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from villa_ecommerce_sdk.client import VillaClient
+    from villa_ecommerce_sdk.base import BaseService
+    from villa_ecommerce_sdk.payments import PaymentService
+    from villa_ecommerce_sdk.products import ProductsService
+    from villa_ecommerce_sdk.inventory import InventoryService
+    from villa_ecommerce_sdk.cache import CacheBackend, CacheEntry, S3Cache
+    from villa_ecommerce_sdk.transport import HTTPTransport, TransportStats
+    from villa_ecommerce_sdk.bulk import BulkResult
+    from villa_ecommerce_sdk.memory_cache import MemoryCache, MemoryCacheStats
+    from villa_ecommerce_sdk.tiered_cache import TieredCache
+    from villa_ecommerce_sdk.disk_cache import DiskCache, DiskCacheStats
+    from villa_ecommerce_sdk.redis_cache import RedisCache
+    from villa_ecommerce_sdk.frame_cache import ParquetFrameCache
+    from villa_ecommerce_sdk.filters import Filter, compile_filter
+    from villa_ecommerce_sdk.serialization import Codec, get_codec
+    from villa_ecommerce_sdk.singleflight import AsyncSingleFlight, SingleFlight, SingleFlightStats
+    from villa_ecommerce_sdk.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+    from villa_ecommerce_sdk.hedging import Hedger, HedgingStats
+    from villa_ecommerce_sdk.schema import MemoryReport, RecordSchema
+    from villa_ecommerce_sdk.status import StatusTTL
+    from villa_ecommerce_sdk.submissions import SubmissionJournal, SubmissionResult
+    from villa_ecommerce_sdk.async_client import AsyncVillaClient
+    from villa_ecommerce_sdk.async_base import AsyncBaseService
+    from villa_ecommerce_sdk.async_cache import AsyncCacheAdapter, AsyncS3Cache
+    from villa_ecommerce_sdk.async_services import (
+        AsyncProductsService,
+        AsyncInventoryService,
+        AsyncPaymentService
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List public names, including ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'VillaClient',
     'BaseService',
     'PaymentService',
     'ProductsService',
-    'InventoryService'
+    'InventoryService',
+    'CacheBackend',
+    'CacheEntry',
+    'S3Cache',
+    'HTTPTransport',
+    'TransportStats',
+    'BulkResult',
+    'MemoryCache',
+    'MemoryCacheStats',
+    'TieredCache',
+    'DiskCache',
+    'DiskCacheStats',
+    'RedisCache',
+    'ParquetFrameCache',
+    'Filter',
+    'compile_filter',
+    'Codec',
+    'get_codec',
+    'SingleFlight',
+    'SingleFlightStats',
+    'AsyncSingleFlight',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'Hedger',
+    'HedgingStats',
+    'RecordSchema',
+    'MemoryReport',
+    'StatusTTL',
+    'SubmissionJournal',
+    'SubmissionResult',
+    'AsyncVillaClient',
+    'AsyncBaseService',
+    'AsyncCacheAdapter',
+    'AsyncS3Cache',
+    'AsyncProductsService',
+    'AsyncInventoryService',
+    'AsyncPaymentService'
 ]
-
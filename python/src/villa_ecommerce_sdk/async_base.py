@@ -0,0 +1,513 @@
+"""Asyncio base class for Villa Ecommerce SDK services."""
+
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Dict, Any, Set
+from villa_ecommerce_sdk.async_cache import AsyncCacheAdapter
+from villa_ecommerce_sdk.base import (
+    CacheTTL,
+    _attempt_outcome,
+    _is_upstream_error,
+    _judged_entry,
+    _max_age,
+    _renewed_entry,
+    _response_entry,
+    request_cache_key
+)
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_route
+)
+from villa_ecommerce_sdk.schema import RecordSchema
+from villa_ecommerce_sdk.serialization import decode_json_response
+from villa_ecommerce_sdk.singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported only when DataFrames are built
+    import pandas as pd
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None
+
+
+def _require_httpx() -> None:
+    """Raise a helpful ImportError when the async extra is not installed."""
+    if httpx is None:
+        raise ImportError(
+            "The async client requires httpx. Install it with: "
+            "pip install 'villa-ecommerce-sdk[async]'"
+        )
+
+
+def create_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0
+) -> "httpx.AsyncClient":
+    """
+    Create a pooled httpx.AsyncClient.
+
+    Args:
+        max_connections: Maximum concurrent connections (default: 100)
+        max_keepalive_connections: Idle connections kept open (default: 20)
+        keepalive_expiry: Seconds an idle connection is kept (default: 30)
+
+    Returns:
+        httpx.AsyncClient instance
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    _require_httpx()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+    )
+
+
+class AsyncBaseService(ABC):
+    """
+    Base class for all asyncio Villa SDK services.
+
+    Requests follow the same rules as BaseService: the same freshness
+    checks, stale-while-revalidate, conditional revalidation, coalescing of
+    concurrent misses, retries, circuit breaking and stale-if-error, built
+    on the same helpers. Not available here: hedging, the Parquet frame
+    cache, streamed record parsing and memory reports.
+    """
+
+    # TTL in seconds for cached GET responses; None keeps entries forever
+    default_cache_ttl: Optional[float] = None
+
+    # Declared dtypes for DataFrames built by _build_frame; None keeps inferred dtypes
+    schema: Optional[RecordSchema] = None
+
+    def __init__(
+        self,
+        base_url: str,
+        cache: Optional[AsyncCacheAdapter] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        cache_ttl: Optional[float] = None,
+        stale_while_revalidate: float = 0.0,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        stale_if_error: float = 0.0,
+        typed_frames: bool = True
+    ):
+        """
+        Initialize async base service.
+
+        Args:
+            base_url: Base URL for Villa API
+            cache: Optional async cache instance for caching
+            http_client: Optional shared httpx.AsyncClient (a private one is created if omitted)
+            cache_ttl: TTL in seconds for cached responses (default: default_cache_ttl)
+            stale_while_revalidate: Seconds past expiry during which a stale entry is
+                                    returned immediately while it is refreshed in the
+                                    background (default: 0, disabled)
+            single_flight: Optional AsyncSingleFlight group used to coalesce concurrent
+                           identical GETs (a private one is created if omitted)
+            retry_policy: Optional RetryPolicy for transient upstream failures
+                          (default: no retries)
+            circuit_breaker: Optional CircuitBreaker (possibly shared) that fails
+                             fast while an endpoint is unhealthy
+            stale_if_error: Seconds past expiry during which a stale cache entry is
+                            served when the upstream fails or its circuit is open
+                            (default: 0, disabled)
+            typed_frames: Whether to convert DataFrames to the service's declared
+                          schema dtypes (default: True)
+
+        Raises:
+            ImportError: If httpx is not installed, even with an explicit http_client
+        """
+        # Request errors are told apart by httpx's exception types
+        _require_httpx()
+        self.base_url = base_url.rstrip('/')
+        self.cache = cache
+        self.http_client = http_client or create_http_client()
+        self.cache_ttl = cache_ttl if cache_ttl is not None else self.default_cache_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.single_flight = single_flight or AsyncSingleFlight()
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.stale_if_error = stale_if_error
+        self.typed_frames = typed_frames
+        self._refreshing: Set[str] = set()
+        # Strong references keep background refreshes from being garbage collected
+        self._refresh_tasks: Set["asyncio.Task[None]"] = set()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        cache_ttl: CacheTTL = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request with caching support.
+
+        Behaves like BaseService._make_request: fresh entries are returned
+        directly, entries inside the stale-while-revalidate window are
+        returned while a background task refreshes them, and concurrent
+        misses for the same cache key share one upstream fetch.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            cache_key: Optional base cache key for GET requests; the request
+                       fingerprint is appended when params are sent (see
+                       request_cache_key)
+            params: Optional query parameters
+            json_data: Optional JSON body for POST/PUT requests
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+            cache_ttl: Optional TTL override for this response (default: self.cache_ttl),
+                       or a callable deriving the TTL from the response data; a
+                       callable also decides the freshness of cached entries
+            refresh: Skip the cache lookup and fetch from upstream; the response
+                     is still cached (default: False)
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            Exception: If request fails
+        """
+        if cache_key:
+            cache_key = request_cache_key(cache_key, method, endpoint, params)
+        ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
+
+        # Check cache for GET requests
+        entry = None
+        if method.upper() == 'GET' and cache_key and self.cache and not refresh:
+            entry = await self.cache.get_entry(cache_key)
+            if entry is not None:
+                entry = _judged_entry(entry, ttl)
+                if entry.is_fresh(max_age=_max_age(ttl)):
+                    return entry.data
+                if entry.is_stale_servable(self.stale_while_revalidate):
+                    self._refresh_in_background(
+                        endpoint, cache_key, params, headers, timeout, cache_ttl, entry
+                    )
+                    return entry.data
+
+        fetch = functools.partial(
+            self._fetch_entry,
+            method, endpoint,
+            cache_key=cache_key,
+            params=params,
+            json_data=json_data,
+            headers=headers,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            stale_entry=entry
+        )
+
+        # Concurrent misses for the same key share one upstream fetch and cache write
+        if method.upper() == 'GET' and cache_key:
+            entry = await self.single_flight.do(cache_key, fetch)
+        else:
+            entry = await fetch()
+        return entry.data
+
+    async def _fetch_entry(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        cache_ttl: CacheTTL = None,
+        stale_entry: Optional[CacheEntry] = None
+    ) -> CacheEntry:
+        """
+        Send the request upstream and cache a successful GET response.
+
+        See BaseService._fetch_entry.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            cache_key: Optional cache key for GET requests
+            params: Optional query parameters
+            json_data: Optional JSON body for POST/PUT requests
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+            cache_ttl: Optional TTL override (or TTL policy) for this response
+            stale_entry: Optional expired cache entry to revalidate
+
+        Returns:
+            CacheEntry holding the response data
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open and no stale
+                              entry can be served
+            Exception: If request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        use_cache = method.upper() == 'GET' and cache_key and self.cache
+        ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
+
+        # Prepare request
+        request_headers = dict(headers or {})
+        if use_cache and stale_entry is not None:
+            request_headers.update(stale_entry.conditional_headers())
+        request_kwargs = {
+            'timeout': timeout,
+            'headers': request_headers
+        }
+
+        if params:
+            request_kwargs['params'] = params
+        if json_data:
+            request_kwargs['json'] = json_data
+
+        # Fail fast while the endpoint is unhealthy
+        route = endpoint_route(endpoint)
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(route):
+            if self._can_serve_stale(stale_entry):
+                return stale_entry
+            raise CircuitOpenError(f"Circuit open for {method} {endpoint}; not sending request")
+
+        try:
+            # Make request
+            response = await self._send(method, url, route, request_kwargs)
+
+            # Unchanged upstream: renew the cached entry without touching its body
+            if use_cache and stale_entry is not None and response.status_code == 304:
+                renewed = _renewed_entry(stale_entry, ttl)
+                await self.cache.touch(cache_key, renewed)
+                return renewed
+
+            response.raise_for_status()
+            data = decode_json_response(response)
+
+            # Cache GET responses
+            entry = _response_entry(response, data, ttl) if use_cache else None
+            if entry is not None:
+                await self.cache.set_entry(cache_key, entry)
+                return entry
+
+            return CacheEntry(data=data)
+
+        except httpx.HTTPError as e:
+            if _is_upstream_error(e) and self._can_serve_stale(stale_entry):
+                return stale_entry
+            raise Exception(f"Failed to {method} {endpoint}: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error processing response from {endpoint}: {str(e)}")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        request_kwargs: Dict[str, Any]
+    ) -> "httpx.Response":
+        """
+        Send a request, retrying transient failures and feeding the circuit breaker.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            route: Circuit breaker key for the endpoint
+            request_kwargs: Keyword arguments for httpx.AsyncClient.request
+
+        Returns:
+            The last response received (callers check its status)
+
+        Raises:
+            httpx.RequestError: If no response was received
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            response = None
+            error = None
+            try:
+                response = await self.http_client.request(method, url, **request_kwargs)
+            except httpx.RequestError as e:
+                error = e
+            except BaseException:
+                # As in BaseService._send: a half-open probe left unrecorded
+                # would keep the circuit open for good
+                if breaker is not None:
+                    breaker.record_failure(route)
+                raise
+
+            failed, delay = _attempt_outcome(
+                policy, breaker, method, route, request_kwargs.get('headers'),
+                attempt, response, error
+            )
+            if not failed:
+                return response
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _can_serve_stale(self, entry: Optional[CacheEntry]) -> bool:
+        """Check whether a stale entry may stand in for a failed upstream request."""
+        return entry is not None and entry.is_stale_servable(self.stale_if_error)
+
+    def _refresh_in_background(
+        self,
+        endpoint: str,
+        cache_key: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: int,
+        cache_ttl: CacheTTL,
+        stale_entry: Optional[CacheEntry] = None
+    ) -> None:
+        """Schedule one background refresh task per cache key."""
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+
+        async def refresh() -> None:
+            try:
+                await self.single_flight.do(cache_key, functools.partial(
+                    self._fetch_entry,
+                    'GET', endpoint,
+                    cache_key=cache_key,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                    cache_ttl=cache_ttl,
+                    stale_entry=stale_entry
+                ))
+            except Exception:
+                # Keep serving the stale entry; the next read will retry
+                pass
+            finally:
+                self._refreshing.discard(cache_key)
+
+        task = asyncio.ensure_future(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _build_frame(self, records: Any) -> "pd.DataFrame":
+        """
+        Build a DataFrame from records in the service schema's dtypes (when enabled).
+
+        Args:
+            records: Decoded records
+
+        Returns:
+            DataFrame
+        """
+        if self.schema is not None and self.typed_frames:
+            return self.schema.build(records)
+        import pandas as pd
+        return pd.DataFrame(records)
+
+    async def _get(
+        self,
+        endpoint: str,
+        cache_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: CacheTTL = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make GET request.
+
+        Args:
+            endpoint: API endpoint
+            cache_key: Optional cache key
+            params: Optional query parameters
+            cache_ttl: Optional TTL override (or TTL policy) for the cached response
+            refresh: Bypass the cache lookup and fetch from upstream (default: False)
+
+        Returns:
+            Response data
+        """
+        return await self._make_request(
+            'GET', endpoint, cache_key=cache_key, params=params, cache_ttl=cache_ttl,
+            refresh=refresh
+        )
+
+    async def _post(
+        self,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make POST request.
+
+        Args:
+            endpoint: API endpoint
+            json_data: Optional JSON body
+            headers: Optional HTTP headers
+
+        Returns:
+            Response data
+        """
+        return await self._make_request('POST', endpoint, json_data=json_data, headers=headers)
+
+    async def _put(
+        self,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make PUT request.
+
+        Args:
+            endpoint: API endpoint
+            json_data: Optional JSON body
+            headers: Optional HTTP headers
+
+        Returns:
+            Response data
+        """
+        return await self._make_request('PUT', endpoint, json_data=json_data, headers=headers)
+
+    async def _delete(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make DELETE request.
+
+        Args:
+            endpoint: API endpoint
+            headers: Optional HTTP headers
+
+        Returns:
+            Response data
+        """
+        return await self._make_request('DELETE', endpoint, headers=headers)
+
+    @abstractmethod
+    def get_service_name(self) -> str:
+        """
+        Get service name for logging/debugging.
+
+        Returns:
+            Service name string
+        """
+        pass
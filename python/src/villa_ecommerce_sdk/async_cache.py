@@ -0,0 +1,147 @@
+"""Asyncio cache backends for Villa Ecommerce SDK."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+from villa_ecommerce_sdk.cache import CacheEntry, S3Cache
+from villa_ecommerce_sdk.serialization import Codec, DEFAULT_CODEC
+
+
+class AsyncCacheAdapter:
+    """
+    Async wrapper around a synchronous cache backend.
+
+    This is not non-blocking I/O: blocking cache calls (e.g. boto3
+    get_object) run on a bounded worker pool so they never stall the event
+    loop, and at most max_workers of them are in flight at once.
+    """
+
+    def __init__(self, cache: Any, max_workers: int = 16):
+        """
+        Initialize async cache adapter.
+
+        Args:
+            cache: Synchronous cache backend (e.g. S3Cache)
+            max_workers: Maximum concurrent blocking cache operations (default: 16)
+        """
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="villa-cache"
+        )
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking cache call on the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry with its freshness metadata, even if expired.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+
+        Returns:
+            CacheEntry, or None if not found
+        """
+        return await self._run(self.cache.get_entry, key)
+
+    async def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve fresh cached data.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Cached data, or None if not found or expired
+        """
+        if max_age is None:
+            return await self._run(self.cache.get_cached, key)
+        return await self._run(self.cache.get_cached, key, max_age=max_age)
+
+    async def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry with its freshness metadata.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+        """
+        await self._run(self.cache.set_entry, key, entry)
+
+    async def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Renew an entry's freshness metadata without rewriting its data where possible.
+
+        Args:
+            key: Cache key
+            entry: Entry with the renewed metadata
+        """
+        await self._run(self.cache.touch, key, entry)
+
+    async def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store data in the cache.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            data: Data to cache
+            ttl: Optional time-to-live in seconds
+        """
+        await self._run(self.cache.set_cached, key, data, ttl=ttl)
+
+    async def is_cached(self, key: str) -> bool:
+        """
+        Check if a key exists in cache.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        return await self._run(self.cache.is_cached, key)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Remove cached data.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        await self._run(self.cache.invalidate, key)
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._executor.shutdown(wait=False)
+
+
+class AsyncS3Cache(AsyncCacheAdapter):
+    """Async S3-based cache for storing API responses."""
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "villa-sdk",
+        max_workers: int = 16,
+        codec: Union[str, Codec] = DEFAULT_CODEC
+    ):
+        """
+        Initialize async S3 cache.
+
+        Args:
+            bucket_name: Name of the S3 bucket to use for caching
+            prefix: Prefix for cache keys (default: "villa-sdk")
+            max_workers: Maximum concurrent S3 operations (default: 16)
+            codec: Codec name or instance for new entries (default: "json")
+        """
+        super().__init__(
+            S3Cache(bucket_name=bucket_name, prefix=prefix, codec=codec),
+            max_workers=max_workers
+        )
+        self.bucket_name = bucket_name
+        self.prefix = prefix
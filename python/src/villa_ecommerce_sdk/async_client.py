@@ -0,0 +1,392 @@
+"""Asyncio API client for Villa Ecommerce SDK."""
+
+import asyncio
+from typing import Optional, Dict, Any, Iterable, List, Union
+import pandas as pd
+from villa_ecommerce_sdk.bulk import BulkResult, fetch_many_async
+from villa_ecommerce_sdk.async_base import create_http_client, httpx
+from villa_ecommerce_sdk.async_cache import AsyncCacheAdapter, AsyncS3Cache
+from villa_ecommerce_sdk.async_services import (
+    AsyncProductsService,
+    AsyncInventoryService,
+    AsyncPaymentService
+)
+from villa_ecommerce_sdk.filters import Filter
+from villa_ecommerce_sdk.frames import JoinKey, merge_dataframes, filter_dataframe
+from villa_ecommerce_sdk.resilience import CircuitBreaker, RetryPolicy
+from villa_ecommerce_sdk.singleflight import AsyncSingleFlight, SingleFlightStats
+
+
+class AsyncVillaClient:
+    """
+    Asyncio client for interacting with Villa Ecommerce API.
+
+    Mirrors VillaClient method for method, but every API call is a
+    coroutine so many branches can be fetched concurrently on one loop.
+    Requests get the same caching and resilience behaviour (freshness
+    checks, stale-while-revalidate, request coalescing, retries, circuit
+    breaking, stale-if-error); hedging, the Parquet frame cache and memory
+    reports are only available on VillaClient. The cache is the blocking
+    backend run on a worker pool (see AsyncCacheAdapter).
+    """
+
+    def __init__(
+        self,
+        s3_bucket: Optional[str] = None,
+        base_url: str = "https://shop.villamarket.com",
+        cache: Optional[AsyncCacheAdapter] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        stale_while_revalidate: float = 0.0,
+        retry_policy: Union[RetryPolicy, bool, None] = None,
+        circuit_breaker: Union[CircuitBreaker, bool] = True,
+        stale_if_error: float = 0.0,
+        typed_frames: bool = True
+    ):
+        """
+        Initialize async Villa API client.
+
+        Args:
+            s3_bucket: S3 bucket name for caching (default: villa-ecommerce-sdk-cache)
+            base_url: Base URL for Villa API (default: https://shop.villamarket.com)
+            cache: Optional async cache backend (default: AsyncS3Cache on s3_bucket)
+            http_client: Optional shared httpx.AsyncClient (default: a new pooled client)
+            max_connections: Maximum concurrent HTTP connections (default: 100)
+            max_keepalive_connections: Idle HTTP connections kept open (default: 20)
+            stale_while_revalidate: Seconds past expiry during which stale cached data
+                                    is served while refreshed in the background
+                                    (default: 0, disabled)
+            retry_policy: RetryPolicy for transient upstream failures, or False to
+                          disable retries (default: 3 attempts with jittered
+                          exponential backoff)
+            circuit_breaker: CircuitBreaker shared by all services, True for a
+                             default one (5 failures, 30s recovery) or False to
+                             disable
+            stale_if_error: Seconds past expiry during which stale product and
+                            inventory data is served while the upstream is
+                            failing (default: 0, disabled); payment statuses
+                            are never served stale
+            typed_frames: Whether product and inventory DataFrames use the declared
+                          schema dtypes (default: True)
+        """
+        if s3_bucket is None:
+            s3_bucket = "villa-ecommerce-sdk-cache"
+        self.base_url = base_url.rstrip('/')
+        self.s3_bucket = s3_bucket
+
+        self.http_client = http_client or create_http_client(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self.cache = cache if cache is not None else AsyncS3Cache(bucket_name=s3_bucket)
+        self.single_flight = AsyncSingleFlight()
+        if retry_policy is None or retry_policy is True:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy or None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+
+        service_kwargs = {
+            'base_url': base_url,
+            'cache': self.cache,
+            'http_client': self.http_client,
+            'stale_while_revalidate': stale_while_revalidate,
+            'single_flight': self.single_flight,
+            'retry_policy': self.retry_policy,
+            'circuit_breaker': self.circuit_breaker,
+            'stale_if_error': stale_if_error,
+            'typed_frames': typed_frames,
+        }
+        self.products_service = AsyncProductsService(**service_kwargs)
+        self.inventory_service = AsyncInventoryService(**service_kwargs)
+        # A payment status from before an outage may since have changed
+        self.payment_service = AsyncPaymentService(**dict(service_kwargs, stale_if_error=0.0))
+
+    def get_coalescing_stats(self) -> SingleFlightStats:
+        """
+        Get request coalescing counters shared by all services.
+
+        Returns:
+            SingleFlightStats snapshot (calls, upstream executions, coalesced calls)
+        """
+        return self.single_flight.stats()
+
+    def get_circuit_states(self) -> Dict[str, str]:
+        """
+        Get circuit breaker states for endpoints that have recorded failures.
+
+        Returns:
+            Dict of endpoint route to "closed", "open" or "half_open"
+            (empty when the circuit breaker is disabled)
+        """
+        if self.circuit_breaker is None:
+            return {}
+        return self.circuit_breaker.states()
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections and the cache worker pool."""
+        await self.http_client.aclose()
+        self.cache.close()
+
+    async def __aenter__(self) -> "AsyncVillaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get_product_list(self, branch: int = 1000) -> pd.DataFrame:
+        """
+        Get product list for a specific branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            DataFrame containing product data
+        """
+        return await self.products_service.get_product_list(branch=branch)
+
+    async def get_inventory(self, branch: int = 1000) -> pd.DataFrame:
+        """
+        Get inventory data for a specific branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            DataFrame containing inventory data
+        """
+        return await self.inventory_service.get_inventory(branch=branch)
+
+    async def get_product_list_many(
+        self,
+        branches: Iterable[int],
+        max_concurrency: int = 32
+    ) -> BulkResult:
+        """
+        Get product lists for several branches concurrently.
+
+        Args:
+            branches: Branch IDs to fetch
+            max_concurrency: Maximum in-flight fetches (default: 32)
+
+        Returns:
+            BulkResult keyed by branch
+        """
+        return await fetch_many_async(
+            lambda branch: self.get_product_list(branch=branch),
+            branches,
+            max_concurrency=max_concurrency
+        )
+
+    async def get_inventory_many(
+        self,
+        branches: Iterable[int],
+        max_concurrency: int = 32
+    ) -> BulkResult:
+        """
+        Get inventory data for several branches concurrently.
+
+        Args:
+            branches: Branch IDs to fetch
+            max_concurrency: Maximum in-flight fetches (default: 32)
+
+        Returns:
+            BulkResult keyed by branch
+        """
+        return await fetch_many_async(
+            lambda branch: self.get_inventory(branch=branch),
+            branches,
+            max_concurrency=max_concurrency
+        )
+
+    async def get_products_with_inventory(
+        self,
+        branch: int = 1000,
+        filters: Optional[Union[Dict[str, Any], Filter]] = None,
+        join_key: Optional[JoinKey] = None
+    ) -> pd.DataFrame:
+        """
+        Get merged products and inventory data with optional filtering.
+
+        Products and inventory are fetched concurrently.
+
+        Args:
+            branch: Branch ID (default: 1000)
+            filters: Optional dictionary of filters to apply to the merged DataFrame
+            join_key: Optional join column, or (products column, inventory
+                      column) when the names differ
+
+        Returns:
+            Merged and filtered DataFrame
+        """
+        products_df, inventory_df = await asyncio.gather(
+            self.get_product_list(branch=branch),
+            self.get_inventory(branch=branch)
+        )
+
+        merged_df = merge_dataframes(products_df, inventory_df, join_key=join_key)
+
+        if filters:
+            merged_df = filter_dataframe(merged_df, filters)
+
+        return merged_df
+
+    def filter_dataframe(
+        self,
+        df: pd.DataFrame,
+        filters: Union[Dict[str, Any], Filter]
+    ) -> pd.DataFrame:
+        """
+        Filter DataFrame based on provided criteria.
+
+        See villa_ecommerce_sdk.filters.Filter for supported criteria.
+
+        Args:
+            df: DataFrame to filter
+            filters: Dictionary where keys are column names and values are filter
+                     criteria, or a precompiled Filter
+
+        Returns:
+            Filtered DataFrame
+        """
+        return filter_dataframe(df, filters)
+
+    # Payment methods
+    async def create_payment(
+        self,
+        order_id: str,
+        amount: float,
+        currency: str = "THB",
+        payment_method: str = "credit_card",
+        customer_info: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new payment for an order.
+
+        Args:
+            order_id: Order identifier
+            amount: Payment amount
+            currency: Currency code (default: THB)
+            payment_method: Payment method (credit_card, bank_transfer, etc.)
+            customer_info: Optional customer information
+            metadata: Optional additional metadata
+
+        Returns:
+            Payment response data
+        """
+        return await self.payment_service.create_payment(
+            order_id=order_id,
+            amount=amount,
+            currency=currency,
+            payment_method=payment_method,
+            customer_info=customer_info,
+            metadata=metadata
+        )
+
+    async def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        """
+        Get payment status by payment ID.
+
+        Args:
+            payment_id: Payment identifier
+
+        Returns:
+            Payment status data
+        """
+        return await self.payment_service.get_payment_status(payment_id=payment_id)
+
+    async def get_payment_history(
+        self,
+        order_id: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 100
+    ) -> pd.DataFrame:
+        """
+        Get payment history with optional filters.
+
+        Args:
+            order_id: Optional order ID filter
+            customer_id: Optional customer ID filter
+            start_date: Optional start date (YYYY-MM-DD format)
+            end_date: Optional end date (YYYY-MM-DD format)
+            limit: Maximum number of records to return
+
+        Returns:
+            DataFrame containing payment history
+        """
+        return await self.payment_service.get_payment_history(
+            order_id=order_id,
+            customer_id=customer_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+
+    async def process_refund(
+        self,
+        payment_id: str,
+        amount: Optional[float] = None,
+        reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a refund for a payment.
+
+        Args:
+            payment_id: Payment identifier to refund
+            amount: Optional partial refund amount (if None, full refund)
+            reason: Optional refund reason
+
+        Returns:
+            Refund response data
+        """
+        return await self.payment_service.process_refund(
+            payment_id=payment_id,
+            amount=amount,
+            reason=reason
+        )
+
+    async def get_refund_status(self, refund_id: str) -> Dict[str, Any]:
+        """
+        Get refund status by refund ID.
+
+        Args:
+            refund_id: Refund identifier
+
+        Returns:
+            Refund status data
+        """
+        return await self.payment_service.get_refund_status(refund_id=refund_id)
+
+    async def get_available_payment_methods(self, branch: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Get available payment methods for a branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            List of available payment methods
+        """
+        return await self.payment_service.get_available_payment_methods(branch=branch)
+
+    async def verify_payment(self, payment_id: str, order_id: str) -> Dict[str, Any]:
+        """
+        Verify a payment matches an order.
+
+        Args:
+            payment_id: Payment identifier
+            order_id: Order identifier
+
+        Returns:
+            Verification result
+        """
+        return await self.payment_service.verify_payment(
+            payment_id=payment_id,
+            order_id=order_id
+        )
@@ -0,0 +1,262 @@
+"""Asyncio product, inventory and payment services for Villa Ecommerce SDK."""
+
+from typing import Optional, Dict, Any, List
+import pandas as pd
+from villa_ecommerce_sdk.async_base import AsyncBaseService
+from villa_ecommerce_sdk.base import extract_records
+from villa_ecommerce_sdk.inventory import InventoryService
+from villa_ecommerce_sdk.payments import PaymentService, extract_payment_methods
+from villa_ecommerce_sdk.products import ProductsService
+
+
+class AsyncProductsService(AsyncBaseService):
+    """Async service for fetching product list data."""
+
+    default_cache_ttl = ProductsService.default_cache_ttl
+    schema = ProductsService.schema
+
+    def get_service_name(self) -> str:
+        """Get service name."""
+        return "AsyncProductsService"
+
+    async def get_product_list(self, branch: int = 1000) -> pd.DataFrame:
+        """
+        Get product list for a specific branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            DataFrame containing product data (in the schema dtypes when typed_frames is set)
+        """
+        data = await self._get(
+            endpoint=f"/api/product/productlist/onlineData/{branch}",
+            cache_key=f"products/{branch}.json"
+        )
+        return self._build_frame(extract_records(data, 'products'))
+
+
+class AsyncInventoryService(AsyncBaseService):
+    """Async service for fetching inventory data."""
+
+    default_cache_ttl = InventoryService.default_cache_ttl
+    schema = InventoryService.schema
+
+    def get_service_name(self) -> str:
+        """Get service name."""
+        return "AsyncInventoryService"
+
+    async def get_inventory(self, branch: int = 1000) -> pd.DataFrame:
+        """
+        Get inventory data for a specific branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            DataFrame containing inventory data (in the schema dtypes when typed_frames is set)
+        """
+        data = await self._get(
+            endpoint=f"/api/inventory2/{branch}",
+            cache_key=f"inventory/{branch}.json"
+        )
+        return self._build_frame(extract_records(data, 'inventory'))
+
+
+class AsyncPaymentService(AsyncBaseService):
+    """Async service for handling payment operations."""
+
+    payment_methods_cache_ttl = PaymentService.payment_methods_cache_ttl
+    payment_history_cache_ttl = PaymentService.payment_history_cache_ttl
+    payment_status_cache_ttl = PaymentService.payment_status_cache_ttl
+    refund_status_cache_ttl = PaymentService.refund_status_cache_ttl
+
+    def get_service_name(self) -> str:
+        """Get service name."""
+        return "AsyncPaymentService"
+
+    async def create_payment(
+        self,
+        order_id: str,
+        amount: float,
+        currency: str = "THB",
+        payment_method: str = "credit_card",
+        customer_info: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new payment for an order.
+
+        Args:
+            order_id: Order identifier
+            amount: Payment amount
+            currency: Currency code (default: THB)
+            payment_method: Payment method (credit_card, bank_transfer, etc.)
+            customer_info: Optional customer information
+            metadata: Optional additional metadata
+
+        Returns:
+            Payment response data
+        """
+        payload = {
+            "orderId": order_id,
+            "amount": amount,
+            "currency": currency,
+            "paymentMethod": payment_method
+        }
+
+        if customer_info:
+            payload["customerInfo"] = customer_info
+
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._post(
+            endpoint="/api/payment/create",
+            json_data=payload,
+            headers={"Content-Type": "application/json"}
+        )
+
+    async def get_payment_status(self, payment_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get payment status by payment ID.
+
+        Args:
+            payment_id: Payment identifier
+            refresh: Bypass the cache and ask the API (default: False)
+
+        Returns:
+            Payment status data
+        """
+        return await self._get(
+            endpoint=f"/api/payment/status/{payment_id}",
+            cache_key=f"payments/{payment_id}.json",
+            cache_ttl=self.payment_status_cache_ttl,
+            refresh=refresh
+        )
+
+    async def get_payment_history(
+        self,
+        order_id: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 100
+    ) -> pd.DataFrame:
+        """
+        Get payment history with optional filters.
+
+        Args:
+            order_id: Optional order ID filter
+            customer_id: Optional customer ID filter
+            start_date: Optional start date (YYYY-MM-DD format)
+            end_date: Optional end date (YYYY-MM-DD format)
+            limit: Maximum number of records to return
+
+        Returns:
+            DataFrame containing payment history
+        """
+        params = {"limit": limit}
+
+        if order_id:
+            params["orderId"] = order_id
+        if customer_id:
+            params["customerId"] = customer_id
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+
+        data = await self._get(
+            endpoint="/api/payment/history",
+            cache_key=f"payments/history/{order_id or 'all'}.json",
+            params=params,
+            cache_ttl=self.payment_history_cache_ttl
+        )
+        return self._build_frame(extract_records(data, 'payments'))
+
+    async def process_refund(
+        self,
+        payment_id: str,
+        amount: Optional[float] = None,
+        reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a refund for a payment.
+
+        Args:
+            payment_id: Payment identifier to refund
+            amount: Optional partial refund amount (if None, full refund)
+            reason: Optional refund reason
+
+        Returns:
+            Refund response data
+        """
+        payload = {
+            "paymentId": payment_id
+        }
+
+        if amount is not None:
+            payload["amount"] = amount
+
+        if reason:
+            payload["reason"] = reason
+
+        return await self._post(
+            endpoint="/api/payment/refund",
+            json_data=payload,
+            headers={"Content-Type": "application/json"}
+        )
+
+    async def get_refund_status(self, refund_id: str) -> Dict[str, Any]:
+        """
+        Get refund status by refund ID.
+
+        Args:
+            refund_id: Refund identifier
+
+        Returns:
+            Refund status data
+        """
+        return await self._get(
+            endpoint=f"/api/payment/refund/status/{refund_id}",
+            cache_key=f"refunds/{refund_id}.json",
+            cache_ttl=self.refund_status_cache_ttl
+        )
+
+    async def get_available_payment_methods(self, branch: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Get available payment methods for a branch.
+
+        Args:
+            branch: Branch ID (default: 1000)
+
+        Returns:
+            List of available payment methods
+        """
+        data = await self._get(
+            endpoint=f"/api/payment/methods/{branch}",
+            cache_key=f"payment-methods/{branch}.json",
+            cache_ttl=self.payment_methods_cache_ttl
+        )
+        return extract_payment_methods(data)
+
+    async def verify_payment(self, payment_id: str, order_id: str) -> Dict[str, Any]:
+        """
+        Verify a payment matches an order.
+
+        Args:
+            payment_id: Payment identifier
+            order_id: Order identifier
+
+        Returns:
+            Verification result
+        """
+        return await self._post(
+            endpoint="/api/payment/verify",
+            json_data={
+                "paymentId": payment_id,
+                "orderId": order_id
+            },
+            headers={"Content-Type": "application/json"}
+        )
@@ -1,24 +1,321 @@
 """Base class for Villa Ecommerce SDK services."""
 
+import functools
+import hashlib
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Any, Iterator, List, Tuple, Union
+from urllib.parse import urlencode
 import requests
-from villa_ecommerce_sdk.cache import S3Cache
+from villa_ecommerce_sdk.cache import STORED_AT_METADATA, CacheBackend, CacheEntry
+from villa_ecommerce_sdk.hedging import Hedger
+from villa_ecommerce_sdk.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_route,
+    is_upstream_failure,
+    response_retry_after
+)
+from villa_ecommerce_sdk.schema import MemoryReport, RecordSchema, memory_report
+from villa_ecommerce_sdk.serialization import decode_json_response
+from villa_ecommerce_sdk.singleflight import SingleFlight
+from villa_ecommerce_sdk.streaming import chunked, iter_json_records
+from villa_ecommerce_sdk.transport import HTTPTransport
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported only when DataFrames are built
+    import pandas as pd
+    from villa_ecommerce_sdk.frame_cache import ParquetFrameCache
+
+
+# DataFrame.attrs key holding the version of the cache entry a frame was built from
+SOURCE_VERSION_ATTR = "villa-source-version"
+
+# A TTL in seconds (None: never expires) or a policy deriving one from the response data
+CacheTTL = Union[float, None, Callable[[Any], Optional[float]]]
+
+
+def extract_records(data: Any, list_key: str) -> Any:
+    """
+    Locate the list of records in an API response.
+    
+    Common patterns: data[list_key], data['data'], data['items'], or data itself.
+    
+    Args:
+        data: Decoded response payload
+        list_key: Preferred key holding the records (e.g. "products")
+        
+    Returns:
+        Records suitable for building a DataFrame
+    """
+    if isinstance(data, dict):
+        for key in (list_key, 'data', 'items'):
+            if key in data:
+                return data[key]
+        return [data]
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def entry_version(entry: CacheEntry) -> Optional[Any]:
+    """
+    Get a token identifying the content of a cache entry.
+    
+    Entries with the same token hold the same data: the upstream ETag or
+    Last-Modified validator when present, else the time the entry was
+    stored. Data that never went through the cache has no version.
+    
+    Args:
+        entry: Cache entry
+        
+    Returns:
+        Version token, or None if unknown
+    """
+    if entry.stored_at is None:
+        return None
+    return entry.etag or entry.last_modified or entry.stored_at
+
+
+def canonical_query(params: Optional[Dict[str, Any]]) -> str:
+    """
+    Encode query parameters in a canonical form.
+    
+    Parameters are sorted by name and None values are dropped, as requests
+    does not send them. Booleans are written as true/false and list values
+    become repeated parameters in their original order.
+    
+    Args:
+        params: Query parameters
+        
+    Returns:
+        URL-encoded query string ("" if no parameter is sent)
+    """
+    items: List[Tuple[str, str]] = []
+    for name in sorted(params or {}, key=str):
+        value = params[name]
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = 'true' if item else 'false'
+            items.append((str(name), str(item)))
+    return urlencode(items)
+
+
+def request_fingerprint(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Get a stable digest identifying a request.
+    
+    Requests that differ only in parameter order or in parameters set to
+    None share a fingerprint. The digest is the same across processes and
+    hosts, so it can name entries in shared caches.
+    
+    Args:
+        method: HTTP method
+        endpoint: API endpoint (relative to base_url)
+        params: Optional query parameters
+        
+    Returns:
+        16 hex digit SHA-256 prefix
+    """
+    request = f"{method.upper()} {endpoint}?{canonical_query(params)}"
+    return hashlib.sha256(request.encode('utf-8')).hexdigest()[:16]
+
+
+def request_cache_key(
+    cache_key: str,
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Derive the cache key of a request from a service's base key.
+    
+    Requests without query parameters keep the base key, so resource keys
+    such as "products/1000.json" stay readable and stable. Otherwise the
+    request fingerprint is appended before the extension, e.g.
+    "payments/history/all.json" becomes "payments/history/all-<digest>.json".
+    
+    Args:
+        cache_key: Base cache key naming the resource
+        method: HTTP method
+        endpoint: API endpoint (relative to base_url)
+        params: Optional query parameters
+        
+    Returns:
+        Cache key unique to the request
+    """
+    if not canonical_query(params):
+        return cache_key
+    digest = request_fingerprint(method, endpoint, params)
+    base, dot, ext = cache_key.rpartition('.')
+    if not dot or '/' in ext:
+        return f"{cache_key}-{digest}"
+    return f"{base}-{digest}.{ext}"
+
+
+def _data_ttl(ttl: CacheTTL, data: Any) -> Optional[float]:
+    """Resolve a TTL policy against response data."""
+    return ttl(data) if callable(ttl) else ttl
+
+
+def _max_age(ttl: CacheTTL) -> Optional[float]:
+    """Bound on the age of a cached entry implied by a fixed TTL (TTL policies judge entries)."""
+    return None if callable(ttl) else ttl
+
+
+def _judged_entry(entry: CacheEntry, ttl: CacheTTL) -> CacheEntry:
+    """Let a TTL policy, not the TTL stored with a cached entry, decide its freshness."""
+    return replace(entry, ttl=ttl(entry.data)) if callable(ttl) else entry
+
+
+def _renewed_entry(entry: CacheEntry, ttl: CacheTTL) -> CacheEntry:
+    """Renew a cached entry the upstream answered 304 Not Modified for."""
+    return replace(entry, stored_at=time.time(), ttl=_data_ttl(ttl, entry.data))
+
+
+def _response_entry(response: Any, data: Any, ttl: CacheTTL) -> Optional[CacheEntry]:
+    """Build the cache entry for a GET response (None if its TTL says not to cache it)."""
+    data_ttl = _data_ttl(ttl, data)
+    if data_ttl is not None and data_ttl <= 0:
+        return None
+    return CacheEntry(
+        data=data,
+        stored_at=time.time(),
+        ttl=data_ttl,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified')
+    )
+
+
+def _is_upstream_error(error: Exception) -> bool:
+    """Check whether a request error (requests or httpx) reflects upstream health."""
+    response = getattr(error, 'response', None)
+    return response is None or is_upstream_failure(response.status_code)
+
+
+def _attempt_outcome(
+    policy: Optional[RetryPolicy],
+    breaker: Optional[CircuitBreaker],
+    method: str,
+    route: str,
+    headers: Optional[Dict[str, str]],
+    attempt: int,
+    response: Any,
+    error: Optional[Exception]
+) -> Tuple[bool, Optional[float]]:
+    """
+    Record an attempt with the circuit breaker and decide whether to retry it.
+    
+    Args:
+        policy: Retry policy (None: no retries)
+        breaker: Circuit breaker (None: disabled)
+        method: HTTP method
+        route: Circuit breaker key for the endpoint
+        headers: Request headers
+        attempt: Zero-based attempt index
+        response: Response received (None if the transport raised)
+        error: Transport error, if any
+        
+    Returns:
+        (whether the attempt failed, delay before the next attempt or None to stop)
+    """
+    status_code = response.status_code if response is not None else None
+    failed = error is not None or is_upstream_failure(status_code)
+    if breaker is not None:
+        if failed:
+            breaker.record_failure(route)
+        else:
+            breaker.record_success(route)
+    if not failed:
+        return False, None
+    if policy is None or attempt + 1 >= policy.max_attempts:
+        return True, None
+    if not policy.is_retryable(method, headers, status_code, error):
+        return True, None
+    if breaker is not None and not breaker.allow(route):
+        return True, None
+    return True, policy.backoff(attempt, response_retry_after(response))
 
 
 class BaseService(ABC):
     """Base class for all Villa SDK services."""
     
-    def __init__(self, base_url: str, cache: Optional[S3Cache] = None):
+    # TTL in seconds for cached GET responses; None keeps entries forever
+    default_cache_ttl: Optional[float] = None
+    
+    # Declared dtypes for DataFrames built by _get_frame and friends; None keeps inferred dtypes
+    schema: Optional[RecordSchema] = None
+    
+    def __init__(
+        self,
+        base_url: str,
+        cache: Optional[CacheBackend] = None,
+        transport: Optional[HTTPTransport] = None,
+        cache_ttl: Optional[float] = None,
+        stale_while_revalidate: float = 0.0,
+        single_flight: Optional[SingleFlight] = None,
+        frame_cache: Optional["ParquetFrameCache"] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        stale_if_error: float = 0.0,
+        hedger: Optional[Hedger] = None,
+        typed_frames: bool = True,
+        report_memory: bool = False
+    ):
         """
         Initialize base service.
         
         Args:
             base_url: Base URL for Villa API
-            cache: Optional S3Cache instance for caching
+            cache: Optional cache backend (S3Cache, MemoryCache, DiskCache, RedisCache
+                   or a TieredCache of them)
+            transport: Optional shared HTTPTransport (a private one is created if omitted)
+            cache_ttl: TTL in seconds for cached responses (default: default_cache_ttl)
+            stale_while_revalidate: Seconds past expiry during which a stale entry is
+                                    returned immediately while it is refreshed in the
+                                    background (default: 0, disabled)
+            single_flight: Optional SingleFlight group used to coalesce concurrent
+                           identical GETs (a private one is created if omitted)
+            frame_cache: Optional ParquetFrameCache holding normalized DataFrames
+            retry_policy: Optional RetryPolicy for transient upstream failures
+                          (default: no retries)
+            circuit_breaker: Optional CircuitBreaker (possibly shared) that fails
+                             fast while an endpoint is unhealthy
+            stale_if_error: Seconds past expiry during which a stale cache entry is
+                            served when the upstream fails or its circuit is open
+                            (default: 0, disabled)
+            hedger: Optional Hedger that duplicates slow GETs to cut tail latency
+            typed_frames: Whether to convert DataFrames to the service's declared
+                          schema dtypes (default: True)
+            report_memory: Whether to record a MemoryReport per DataFrame built
+                           by get_* methods (default: False; measuring deep
+                           memory usage costs a pass over string columns)
         """
         self.base_url = base_url.rstrip('/')
         self.cache = cache
+        self.transport = transport or HTTPTransport()
+        self.cache_ttl = cache_ttl if cache_ttl is not None else self.default_cache_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.single_flight = single_flight or SingleFlight()
+        self.frame_cache = frame_cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.stale_if_error = stale_if_error
+        self.hedger = hedger
+        self.typed_frames = typed_frames
+        self.report_memory = report_memory
+        self.memory_reports: Dict[str, MemoryReport] = {}
+        # Cache entry behind the last response, per calling thread
+        self._source = threading.local()
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set = set()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
     
     def _make_request(
         self,
@@ -28,19 +325,38 @@ class BaseService(ABC):
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache_ttl: CacheTTL = None,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Make HTTP request with caching support.
         
+        Fresh cache entries are returned directly; concurrent misses for the
+        same cache key are coalesced into one upstream fetch. Entries inside the
+        stale-while-revalidate window are returned immediately while a
+        background refresh updates the cache. Other stale entries are
+        revalidated with a conditional request (If-None-Match /
+        If-Modified-Since) so an unchanged resource is not re-downloaded.
+        Transient upstream failures are retried according to retry_policy;
+        while the upstream is failing, stale entries inside the
+        stale_if_error window are served instead of raising.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (relative to base_url)
-            cache_key: Optional cache key for GET requests
+            cache_key: Optional base cache key for GET requests; the request
+                       fingerprint is appended when params are sent (see
+                       request_cache_key)
             params: Optional query parameters
             json_data: Optional JSON body for POST/PUT requests
             headers: Optional HTTP headers
             timeout: Request timeout in seconds
+            cache_ttl: Optional TTL override for this response (default: self.cache_ttl),
+                       or a callable deriving the TTL from the response data; a
+                       callable also decides the freshness of cached entries
+            refresh: Skip the cache lookup and fetch from upstream; the response
+                     is still cached (default: False)
             
         Returns:
             Response data as dictionary
@@ -48,18 +364,98 @@ class BaseService(ABC):
         Raises:
             Exception: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
+        if cache_key:
+            cache_key = request_cache_key(cache_key, method, endpoint, params)
+        ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
         
         # Check cache for GET requests
-        if method.upper() == 'GET' and cache_key and self.cache:
-            cached_data = self.cache.get_cached(cache_key)
-            if cached_data is not None:
-                return cached_data
+        entry = None
+        if method.upper() == 'GET' and cache_key and self.cache and not refresh:
+            entry = self.cache.get_entry(cache_key)
+            if entry is not None:
+                entry = _judged_entry(entry, ttl)
+                # The configured TTL also bounds entries stored with a longer
+                # TTL or none at all (e.g. written before TTLs were recorded)
+                if entry.is_fresh(max_age=_max_age(ttl)):
+                    self._source.entry = entry
+                    return entry.data
+                if entry.is_stale_servable(self.stale_while_revalidate):
+                    self._refresh_in_background(
+                        endpoint, cache_key, params, headers, timeout, cache_ttl, entry
+                    )
+                    self._source.entry = entry
+                    return entry.data
+        
+        fetch = functools.partial(
+            self._fetch_entry,
+            method, endpoint,
+            cache_key=cache_key,
+            params=params,
+            json_data=json_data,
+            headers=headers,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            stale_entry=entry
+        )
+        
+        # Concurrent misses for the same key share one upstream fetch and cache write
+        if method.upper() == 'GET' and cache_key:
+            entry = self.single_flight.do(cache_key, fetch)
+        else:
+            entry = fetch()
+        self._source.entry = entry
+        return entry.data
+    
+    def _fetch_entry(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        cache_ttl: CacheTTL = None,
+        stale_entry: Optional[CacheEntry] = None
+    ) -> CacheEntry:
+        """
+        Send the request upstream and cache a successful GET response.
+        
+        When a stale entry with upstream validators is given, the request is
+        made conditional; a 304 Not Modified renews the entry's freshness
+        without transferring or parsing the body.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            cache_key: Optional cache key for GET requests
+            params: Optional query parameters
+            json_data: Optional JSON body for POST/PUT requests
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+            cache_ttl: Optional TTL override (or TTL policy) for this response
+            stale_entry: Optional expired cache entry to revalidate
+            
+        Returns:
+            CacheEntry holding the response data (store time and validators
+            are only set when the data came from or went into the cache)
+            
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open and no stale
+                              entry can be served
+            Exception: If request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        use_cache = method.upper() == 'GET' and cache_key and self.cache
+        ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
         
         # Prepare request
+        request_headers = dict(headers or {})
+        if use_cache and stale_entry is not None:
+            request_headers.update(stale_entry.conditional_headers())
         request_kwargs = {
             'timeout': timeout,
-            'headers': headers or {}
+            'headers': request_headers
         }
         
         if params:
@@ -67,36 +463,415 @@ class BaseService(ABC):
         if json_data:
             request_kwargs['json'] = json_data
         
+        # Fail fast while the endpoint is unhealthy
+        route = endpoint_route(endpoint)
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(route):
+            if self._can_serve_stale(stale_entry):
+                return stale_entry
+            raise CircuitOpenError(f"Circuit open for {method} {endpoint}; not sending request")
+        
         try:
             # Make request
-            response = requests.request(method, url, **request_kwargs)
+            response = self._send(method, url, route, request_kwargs)
+            
+            # Unchanged upstream: renew the cached entry without touching its body
+            if use_cache and stale_entry is not None and response.status_code == 304:
+                renewed = _renewed_entry(stale_entry, ttl)
+                self.cache.touch(cache_key, renewed)
+                return renewed
+            
             response.raise_for_status()
-            data = response.json()
+            data = decode_json_response(response)
             
             # Cache GET responses
-            if method.upper() == 'GET' and cache_key and self.cache:
-                self.cache.set_cached(cache_key, data)
+            entry = _response_entry(response, data, ttl) if use_cache else None
+            if entry is not None:
+                self.cache.set_entry(cache_key, entry)
+                return entry
             
-            return data
+            return CacheEntry(data=data)
             
         except requests.exceptions.RequestException as e:
+            if _is_upstream_error(e) and self._can_serve_stale(stale_entry):
+                return stale_entry
             raise Exception(f"Failed to {method} {endpoint}: {str(e)}")
         except Exception as e:
             raise Exception(f"Error processing response from {endpoint}: {str(e)}")
     
-    def _get(self, endpoint: str, cache_key: Optional[str] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _send(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        request_kwargs: Dict[str, Any]
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures and feeding the circuit breaker.
+        
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            route: Circuit breaker key for the endpoint
+            request_kwargs: Keyword arguments for the transport
+            
+        Returns:
+            The last response received (callers check its status)
+            
+        Raises:
+            requests.exceptions.RequestException: If no response was received
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            response = None
+            error = None
+            try:
+                response = self._attempt(method, url, route, request_kwargs)
+            except requests.exceptions.RequestException as e:
+                error = e
+            except BaseException:
+                # Any other error still ends the attempt; a half-open probe left
+                # unrecorded would keep the circuit open for good
+                if breaker is not None:
+                    breaker.record_failure(route)
+                raise
+            
+            failed, delay = _attempt_outcome(
+                policy, breaker, method, route, request_kwargs.get('headers'),
+                attempt, response, error
+            )
+            if not failed:
+                return response
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            policy.sleep(delay)
+            attempt += 1
+    
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        request_kwargs: Dict[str, Any]
+    ) -> requests.Response:
+        """Send one attempt, hedging GETs when a hedger is configured."""
+        send = functools.partial(self.transport.request, method, url, **request_kwargs)
+        # Streamed bodies are never hedged: the losing response would hold its connection
+        hedged = method.upper() == 'GET' and not request_kwargs.get('stream')
+        if self.hedger is not None and hedged:
+            # An upstream failure is neither a winning answer nor a latency sample
+            return self.hedger.run(
+                route, send, is_failure=lambda response: is_upstream_failure(response.status_code)
+            )
+        return send()
+    
+    def _can_serve_stale(self, entry: Optional[CacheEntry]) -> bool:
+        """Check whether a stale entry may stand in for a failed upstream request."""
+        return entry is not None and entry.is_stale_servable(self.stale_if_error)
+    
+    def _refresh_in_background(
+        self,
+        endpoint: str,
+        cache_key: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: int,
+        cache_ttl: CacheTTL,
+        stale_entry: Optional[CacheEntry] = None
+    ) -> None:
+        """Schedule one background refresh per cache key."""
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix=f"villa-refresh-{self.get_service_name()}"
+                )
+        
+        def refresh() -> None:
+            try:
+                self.single_flight.do(cache_key, functools.partial(
+                    self._fetch_entry,
+                    'GET', endpoint,
+                    cache_key=cache_key,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                    cache_ttl=cache_ttl,
+                    stale_entry=stale_entry
+                ))
+            except Exception:
+                # Keep serving the stale entry; the next read will retry
+                pass
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(cache_key)
+        
+        self._refresh_executor.submit(refresh)
+    
+    def _get(
+        self,
+        endpoint: str,
+        cache_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: CacheTTL = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Make GET request.
         
         Args:
             endpoint: API endpoint
-            cache_key: Optional cache key
+            cache_key: Optional base cache key; distinct params get distinct
+                       entries (see request_cache_key)
             params: Optional query parameters
+            cache_ttl: Optional TTL override (or TTL policy) for the cached response
+            refresh: Bypass the cache lookup and fetch from upstream (default: False)
             
         Returns:
             Response data
         """
-        return self._make_request('GET', endpoint, cache_key=cache_key, params=params)
+        return self._make_request(
+            'GET', endpoint, cache_key=cache_key, params=params, cache_ttl=cache_ttl,
+            refresh=refresh
+        )
+    
+    def _get_frame(
+        self,
+        endpoint: str,
+        cache_key: str,
+        list_key: str,
+        columns: Optional[List[str]] = None
+    ) -> "pd.DataFrame":
+        """
+        GET a record list as a DataFrame, using the frame cache when configured.
+        
+        A frame cache hit loads the typed columns directly; a miss fetches the
+        JSON (through the regular cache) and stores the normalized DataFrame.
+        The version of the cache entry the frame came from, when known, is
+        kept in frame.attrs[SOURCE_VERSION_ATTR] so derived views can be
+        reused until the data changes.
+        
+        Args:
+            endpoint: API endpoint
+            cache_key: JSON cache key (e.g., "products/1000.json")
+            list_key: Preferred response key holding the records
+            columns: Optional columns to return; unknown columns are ignored
+            
+        Returns:
+            DataFrame containing the records, in the service schema's dtypes
+        """
+        from villa_ecommerce_sdk.frame_cache import frame_key
+        
+        key = frame_key(cache_key)
+        if self.frame_cache is not None:
+            frame = self.frame_cache.get_frame(
+                key, columns=columns, max_age=_max_age(self.cache_ttl)
+            )
+            if frame is not None:
+                frame = self._typed(frame)
+                stored_at = frame.attrs.pop(STORED_AT_METADATA, None)
+                frame.attrs[SOURCE_VERSION_ATTR] = ('frame', stored_at) if stored_at else None
+                return frame
+        
+        self._source.entry = None
+        data = self._get(endpoint=endpoint, cache_key=cache_key)
+        source = self._source.entry
+        frame = self._build_frame(extract_records(data, list_key), report_key=cache_key)
+        
+        if self.frame_cache is not None:
+            self._store_frame(key, frame, source)
+        
+        version = entry_version(source) if source is not None else None
+        if version is not None:
+            frame.attrs[SOURCE_VERSION_ATTR] = version
+        
+        if columns is not None:
+            frame = frame[[c for c in columns if c in frame.columns]]
+        return frame
+    
+    def _store_frame(self, key: str, frame: "pd.DataFrame", source: Optional[CacheEntry]) -> None:
+        """
+        Store a DataFrame in the frame cache with the freshness of the data it was built from.
+        
+        Data read from the cache keeps its store time and TTL, so the frame
+        expires with its source entry; stale entries served while they are
+        revalidated or while the upstream fails are not stored at all.
+        
+        Args:
+            key: Frame cache key
+            frame: DataFrame to store
+            source: Cache entry the data came from (None or without a store
+                    time if it was fetched without being cached)
+        """
+        ttl = self.cache_ttl
+        stored_at = None
+        if source is not None and source.stored_at is not None:
+            if not source.is_fresh(max_age=_max_age(ttl)):
+                return
+            stored_at = source.stored_at
+            if source.ttl is not None:
+                ttl = source.ttl
+        if ttl is None or ttl > 0:
+            self.frame_cache.set_frame(key, frame, ttl=ttl, stored_at=stored_at)
+    
+    def _stream_records(
+        self,
+        endpoint: str,
+        list_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        read_size: int = 65536
+    ) -> Iterator[Any]:
+        """
+        GET a record list and parse it incrementally from the response stream.
+        
+        The body is never buffered whole: records are decoded one at a time
+        as chunks arrive, so memory stays bounded by one record plus one
+        chunk. Streamed responses bypass the response cache.
+        
+        Args:
+            endpoint: API endpoint
+            list_key: Preferred response key holding the records
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+            read_size: Bytes read from the socket per chunk (default: 64 KiB)
+            
+        Yields:
+            Decoded records
+            
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            Exception: If the request or parsing fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        route = endpoint_route(endpoint)
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(route):
+            raise CircuitOpenError(f"Circuit open for GET {endpoint}; not sending request")
+        
+        request_kwargs = {'timeout': timeout, 'headers': {}, 'stream': True}
+        if params:
+            request_kwargs['params'] = params
+        
+        try:
+            response = self._send('GET', url, route, request_kwargs)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to GET {endpoint}: {str(e)}")
+        
+        try:
+            yield from iter_json_records(response.iter_content(chunk_size=read_size), list_key)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to GET {endpoint}: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"Error processing response from {endpoint}: {str(e)}")
+        finally:
+            response.close()
+    
+    def _stream_frames(
+        self,
+        endpoint: str,
+        list_key: str,
+        chunk_size: int,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        GET a record list as a stream of DataFrame chunks.
+        
+        Args:
+            endpoint: API endpoint
+            list_key: Preferred response key holding the records
+            chunk_size: Maximum rows per DataFrame
+            params: Optional query parameters
+            
+        Yields:
+            DataFrames of at most chunk_size rows
+        """
+        for batch in chunked(self._stream_records(endpoint, list_key, params=params), chunk_size):
+            yield self._build_frame(batch)
+    
+    def _iter_chunks(
+        self,
+        endpoint: str,
+        cache_key: str,
+        list_key: str,
+        chunk_size: int,
+        as_records: bool = False
+    ) -> Iterator[Union["pd.DataFrame", List[Dict[str, Any]]]]:
+        """
+        Yield a record list in fixed-size chunks from the cheapest source.
+        
+        Sources are tried in order: the frame cache (Parquet row batches,
+        decoded one chunk at a time), a fresh response cache entry, and
+        finally the incrementally parsed network stream. Chunks are yielded
+        as soon as they are available, so consumers can start before the
+        whole list is materialized.
+        
+        Args:
+            endpoint: API endpoint
+            cache_key: JSON cache key (e.g., "products/1000.json")
+            list_key: Preferred response key holding the records
+            chunk_size: Rows per chunk (the last chunk may be shorter)
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Yields:
+            DataFrames, or lists of record dicts, of at most chunk_size rows
+        """
+        from villa_ecommerce_sdk.frame_cache import frame_key
+        
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        if self.frame_cache is not None:
+            frames = self.frame_cache.iter_frames(
+                frame_key(cache_key), chunk_size, max_age=_max_age(self.cache_ttl)
+            )
+            if frames is not None:
+                for frame in frames:
+                    yield frame.to_dict('records') if as_records else self._typed(frame)
+                return
+        
+        entry = self.cache.get_entry(cache_key) if self.cache else None
+        if entry is not None and entry.is_fresh(max_age=_max_age(self.cache_ttl)):
+            records = extract_records(entry.data, list_key)
+            if not isinstance(records, list):
+                records = [records]
+        else:
+            records = self._stream_records(endpoint, list_key)
+        
+        for batch in chunked(records, chunk_size):
+            yield batch if as_records else self._build_frame(batch)
+    
+    def _typed(self, frame: "pd.DataFrame") -> "pd.DataFrame":
+        """Convert a DataFrame to the service schema's dtypes (when enabled)."""
+        if self.schema is None or not self.typed_frames:
+            return frame
+        return self.schema.apply(frame)
+    
+    def _build_frame(self, records: Any, report_key: Optional[str] = None) -> "pd.DataFrame":
+        """
+        Build a DataFrame from records in the service schema's dtypes.
+        
+        Args:
+            records: Decoded records
+            report_key: Key under which a MemoryReport is recorded when
+                        report_memory is enabled (e.g. "products/1000.json")
+            
+        Returns:
+            DataFrame
+        """
+        import pandas as pd
+        
+        frame = pd.DataFrame(records)
+        typed = self._typed(frame)
+        if self.report_memory and report_key is not None:
+            self.memory_reports[report_key.rsplit('.', 1)[0]] = memory_report(frame, typed)
+        return typed
     
     def _post(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -0,0 +1,113 @@
+"""Multi-branch bulk fetch helpers for Villa Ecommerce SDK."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List
+import pandas as pd
+
+
+@dataclass
+class BulkResult:
+    """Per-branch results and failures of a bulk fetch."""
+
+    results: Dict[int, pd.DataFrame] = field(default_factory=dict)
+    errors: Dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True when every branch was fetched successfully."""
+        return not self.errors
+
+    def to_frame(self, branch_column: str = "branch") -> pd.DataFrame:
+        """
+        Concatenate successful branches into one DataFrame.
+
+        Args:
+            branch_column: Name of the column holding the branch ID (default: "branch")
+
+        Returns:
+            DataFrame with one row per record and a branch column
+        """
+        if not self.results:
+            return pd.DataFrame(columns=[branch_column])
+        frames = [df.assign(**{branch_column: branch}) for branch, df in self.results.items()]
+        return pd.concat(frames, ignore_index=True)
+
+
+def _unique(branches: Iterable[int]) -> List[int]:
+    """De-duplicate branch IDs while keeping their order."""
+    return list(dict.fromkeys(branches))
+
+
+def fetch_many(
+    fetch: Callable[[int], pd.DataFrame],
+    branches: Iterable[int],
+    max_workers: int = 8
+) -> BulkResult:
+    """
+    Fetch several branches in parallel on a bounded thread pool.
+
+    A failing branch is recorded in BulkResult.errors and does not abort
+    the rest of the batch.
+
+    Args:
+        fetch: Callable returning the DataFrame for one branch
+        branches: Branch IDs to fetch
+        max_workers: Maximum concurrent fetches (default: 8)
+
+    Returns:
+        BulkResult keyed by branch, in input order
+    """
+    branch_ids = _unique(branches)
+    result = BulkResult()
+    if not branch_ids:
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(branch_ids)))) as executor:
+        futures = {branch: executor.submit(fetch, branch) for branch in branch_ids}
+
+    for branch, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            result.errors[branch] = error
+        else:
+            result.results[branch] = future.result()
+    return result
+
+
+async def fetch_many_async(
+    fetch: Callable[[int], Awaitable[pd.DataFrame]],
+    branches: Iterable[int],
+    max_concurrency: int = 32
+) -> BulkResult:
+    """
+    Fetch several branches concurrently on the running event loop.
+
+    Args:
+        fetch: Coroutine function returning the DataFrame for one branch
+        branches: Branch IDs to fetch
+        max_concurrency: Maximum in-flight fetches (default: 32)
+
+    Returns:
+        BulkResult keyed by branch, in input order
+    """
+    branch_ids = _unique(branches)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bounded(branch: int) -> pd.DataFrame:
+        async with semaphore:
+            return await fetch(branch)
+
+    outcomes = await asyncio.gather(
+        *(bounded(branch) for branch in branch_ids),
+        return_exceptions=True
+    )
+
+    result = BulkResult()
+    for branch, outcome in zip(branch_ids, outcomes):
+        if isinstance(outcome, Exception):
+            result.errors[branch] = outcome
+        else:
+            result.results[branch] = outcome
+    return result
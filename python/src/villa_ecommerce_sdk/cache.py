@@ -1,49 +1,252 @@
 """S3-based caching implementation for Villa Ecommerce SDK."""
 
-import json
 import os
-from typing import Optional
-import boto3
-from botocore.exceptions import ClientError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Protocol, Union, runtime_checkable
+from villa_ecommerce_sdk.serialization import Codec, DEFAULT_CODEC, LEGACY_CODEC, get_codec
+
+
+# S3 user-metadata keys holding entry freshness information
+STORED_AT_METADATA = "villa-stored-at"
+TTL_METADATA = "villa-ttl"
+ETAG_METADATA = "villa-etag"
+LAST_MODIFIED_METADATA = "villa-last-modified"
+CODEC_METADATA = "villa-codec"
+
+
+@dataclass
+class CacheEntry:
+    """A cached value together with its freshness and validator information."""
+    
+    data: Any
+    stored_at: Optional[float] = None
+    ttl: Optional[float] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    codec: Optional[str] = None
+    
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Get the entry age in seconds.
+        
+        Args:
+            now: Current epoch time (default: time.time())
+            
+        Returns:
+            Age in seconds, or None if the store time is unknown
+        """
+        if self.stored_at is None:
+            return None
+        return max((time.time() if now is None else now) - self.stored_at, 0.0)
+    
+    def is_fresh(self, max_age: Optional[float] = None, now: Optional[float] = None) -> bool:
+        """
+        Check whether the entry is within its TTL and the caller's max age.
+        
+        Args:
+            max_age: Optional maximum acceptable age in seconds
+            now: Current epoch time (default: time.time())
+            
+        Returns:
+            True if the entry can be served without revalidation
+        """
+        age = self.age(now)
+        if age is None:
+            # Unknown age: only fresh when nothing bounds it
+            return self.ttl is None and max_age is None
+        if self.ttl is not None and age >= self.ttl:
+            return False
+        if max_age is not None and age >= max_age:
+            return False
+        return True
+    
+    def is_stale_servable(self, stale_while_revalidate: float, now: Optional[float] = None) -> bool:
+        """
+        Check whether an expired entry may still be served while it is refreshed.
+        
+        Args:
+            stale_while_revalidate: Seconds past expiry during which stale data is served
+            now: Current epoch time (default: time.time())
+            
+        Returns:
+            True if the entry is inside its stale-while-revalidate window
+        """
+        age = self.age(now)
+        if age is None or self.ttl is None or stale_while_revalidate <= 0:
+            return False
+        return age < self.ttl + stale_while_revalidate
+    
+    def conditional_headers(self) -> dict:
+        """
+        Build conditional request headers from the upstream validators.
+        
+        Returns:
+            Dict with If-None-Match and/or If-Modified-Since (empty if no validators)
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Interface every cache backend (S3, memory, disk, Redis, tiered) implements.
+    
+    Services depend only on this protocol, so backends can be swapped or
+    stacked with TieredCache.
+    """
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve an entry with its freshness metadata, even if expired."""
+        ...
+    
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Retrieve fresh cached data, or None."""
+        ...
+    
+    def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """Store data with an optional TTL."""
+        ...
+    
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, keeping its freshness metadata."""
+        ...
+    
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """Refresh an entry's freshness metadata without rewriting its data."""
+        ...
+    
+    def is_cached(self, key: str) -> bool:
+        """Check if a key exists."""
+        ...
+    
+    def invalidate(self, key: str) -> None:
+        """Remove a key."""
+        ...
+
+
+def get_entries(cache: Any, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+    """
+    Retrieve several entries from any cache backend.
+    
+    Backends with a batched get_entries (RedisCache pipelines, S3Cache
+    concurrent GETs, MemoryCache and TieredCache) are used as such; others
+    are read key by key.
+    
+    Args:
+        cache: Cache backend
+        keys: Cache keys
+        
+    Returns:
+        Dict of key to CacheEntry for the keys found (missing keys are omitted)
+    """
+    keys = list(dict.fromkeys(keys))
+    batched = getattr(cache, 'get_entries', None)
+    if batched is not None:
+        return batched(keys)
+    entries = {}
+    for key in keys:
+        entry = cache.get_entry(key)
+        if entry is not None:
+            entries[key] = entry
+    return entries
 
 
 class S3Cache:
     """S3-based cache for storing API responses."""
     
-    def __init__(self, bucket_name: str, prefix: str = "villa-sdk"):
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "villa-sdk",
+        codec: Union[str, Codec] = DEFAULT_CODEC
+    ):
         """
         Initialize S3 cache.
         
         Args:
             bucket_name: Name of the S3 bucket to use for caching
             prefix: Prefix for cache keys (default: "villa-sdk")
+            codec: Codec name or instance for new entries, e.g. "json", "json+gzip",
+                   "json+zstd", "msgpack+zstd" (default: "json")
         """
         self.bucket_name = bucket_name
         self.prefix = prefix
-        self.s3_client = boto3.client('s3')
+        self.codec = get_codec(codec)
+        self._s3_client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def s3_client(self) -> Any:
+        """boto3 S3 client, created on first use (boto3 import and credential lookup are slow)."""
+        if self._s3_client is None:
+            with self._client_lock:
+                if self._s3_client is None:
+                    import boto3
+                    self._s3_client = boto3.client('s3')
+        return self._s3_client
+    
+    @s3_client.setter
+    def s3_client(self, client: Any) -> None:
+        self._s3_client = client
     
     def _get_cache_key(self, key: str) -> str:
         """Generate full cache key with prefix."""
         return f"{self.prefix}/{key}"
     
-    def get_cached(self, key: str) -> Optional[dict]:
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[dict]:
         """
-        Retrieve cached data from S3.
+        Retrieve fresh cached data from S3.
         
         Args:
             key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
             
         Returns:
-            Cached data as dict, or None if not found or error occurs
+            Cached data as dict, or None if not found, expired or error occurs
         """
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh(max_age=max_age):
+            return None
+        return entry.data
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry with its freshness metadata, even if expired.
+        
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            
+        Returns:
+            CacheEntry, or None if not found or error occurs
+        """
+        # botocore ships with boto3, which is imported only when S3 is used
+        from botocore.exceptions import ClientError
+        
         cache_key = self._get_cache_key(key)
         try:
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=cache_key
             )
-            content = response['Body'].read().decode('utf-8')
-            return json.loads(content)
+            metadata = response.get('Metadata') or {}
+            # Entries written before codecs were recorded are plain JSON
+            codec_name = metadata.get(CODEC_METADATA) or LEGACY_CODEC
+            return CacheEntry(
+                data=get_codec(codec_name).decode(response['Body']),
+                stored_at=_stored_at(metadata, response.get('LastModified')),
+                ttl=_parse_float(metadata.get(TTL_METADATA)),
+                etag=metadata.get(ETAG_METADATA),
+                last_modified=metadata.get(LAST_MODIFIED_METADATA),
+                codec=codec_name
+            )
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 return None
@@ -53,27 +256,94 @@ class S3Cache:
             # Any other error - return None to allow fallback
             return None
     
-    def set_cached(self, key: str, data: dict) -> None:
+    def get_entries(self, keys: Iterable[str], max_workers: int = 16) -> Dict[str, CacheEntry]:
+        """
+        Retrieve several entries with concurrent GETs.
+        
+        S3 has no multi-object GET, so objects are fetched on a bounded
+        thread pool (boto3 clients are thread-safe).
+        
+        Args:
+            keys: Cache keys
+            max_workers: Maximum concurrent GETs (default: 16)
+            
+        Returns:
+            Dict of key to CacheEntry for the keys found (missing keys are omitted)
+        """
+        keys = list(keys)
+        if len(keys) <= 1:
+            found = [self.get_entry(key) for key in keys]
+        else:
+            # Create the client once, before the workers race for it
+            self.s3_client
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(keys)), thread_name_prefix="villa-s3-get"
+            ) as executor:
+                found = list(executor.map(self.get_entry, keys))
+        return {key: entry for key, entry in zip(keys, found) if entry is not None}
+    
+    def set_cached(self, key: str, data: dict, ttl: Optional[float] = None) -> None:
         """
         Store data in S3 cache.
         
         Args:
             key: Cache key (e.g., "products/1000.json")
-            data: Data to cache (will be JSON serialized)
+            data: Data to cache (serialized with the configured codec)
+            ttl: Optional time-to-live in seconds (default: never expires)
+        """
+        self.set_entry(key, CacheEntry(data=data, stored_at=time.time(), ttl=ttl))
+    
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a cache entry, keeping its freshness metadata alongside the object.
+        
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry to store
         """
         cache_key = self._get_cache_key(key)
         try:
-            json_data = json.dumps(data, default=str)
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=cache_key,
-                Body=json_data.encode('utf-8'),
-                ContentType='application/json'
+                Body=self.codec.encode(entry.data),
+                Metadata=_entry_metadata(entry, self.codec.name),
+                **_content_headers(self.codec)
             )
         except Exception:
             # Log error but don't fail - caching is optional
             pass
     
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Refresh an entry's freshness metadata without rewriting its body.
+        
+        Uses a server-side copy onto the same key, so the cached payload is
+        neither downloaded nor re-uploaded (one HEAD request reads the codec
+        the body was written with).
+        
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry carrying the new store time and validators
+        """
+        cache_key = self._get_cache_key(key)
+        try:
+            # The body is copied as-is, so keep the codec it was written with.
+            # The entry may come from another tier, so read it from the object.
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=cache_key)
+            codec = get_codec((head.get('Metadata') or {}).get(CODEC_METADATA) or LEGACY_CODEC)
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=cache_key,
+                CopySource={'Bucket': self.bucket_name, 'Key': cache_key},
+                Metadata=_entry_metadata(entry, codec.name),
+                MetadataDirective='REPLACE',
+                **_content_headers(codec)
+            )
+        except Exception:
+            # Log error but don't fail - the entry will simply be revalidated again
+            pass
+    
     def is_cached(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -84,6 +354,8 @@ class S3Cache:
         Returns:
             True if key exists, False otherwise
         """
+        from botocore.exceptions import ClientError
+        
         cache_key = self._get_cache_key(key)
         try:
             self.s3_client.head_object(
@@ -115,3 +387,49 @@ class S3Cache:
             # Log error but don't fail
             pass
 
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Parse an optional numeric metadata value."""
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _stored_at(metadata: dict, last_modified: Any) -> Optional[float]:
+    """Resolve an entry's store time from metadata, falling back to LastModified."""
+    stored_at = _parse_float(metadata.get(STORED_AT_METADATA))
+    if stored_at is None and hasattr(last_modified, 'timestamp'):
+        stored_at = last_modified.timestamp()
+    return stored_at
+
+
+def _entry_metadata(entry: CacheEntry, codec_name: str) -> dict:
+    """Build S3 user metadata for a cache entry."""
+    metadata = {
+        STORED_AT_METADATA: repr(entry.stored_at if entry.stored_at is not None else time.time()),
+        CODEC_METADATA: codec_name
+    }
+    if entry.ttl is not None:
+        metadata[TTL_METADATA] = repr(float(entry.ttl))
+    if entry.etag:
+        metadata[ETAG_METADATA] = entry.etag
+    if entry.last_modified:
+        metadata[LAST_MODIFIED_METADATA] = entry.last_modified
+    return metadata
+
+
+def _content_headers(codec: Codec) -> dict:
+    """Build S3 Content-Type/Content-Encoding arguments for a codec."""
+    headers = {'ContentType': codec.content_type}
+    if codec.content_encoding:
+        headers['ContentEncoding'] = codec.content_encoding
+    return headers
+
+
+def __getattr__(name: str) -> Any:
+    """Import boto3 lazily while keeping it reachable as a module attribute."""
+    if name == 'boto3':
+        import boto3
+        return boto3
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,107 @@
 """Base API client for Villa Ecommerce SDK."""
 
-from typing import Optional, Dict, Any
-import pandas as pd
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Dict, Any, Collection, Iterable, Iterator, List, Union
+from villa_ecommerce_sdk.hedging import Hedger, HedgingStats
+from villa_ecommerce_sdk.resilience import CircuitBreaker, RetryPolicy
+from villa_ecommerce_sdk.singleflight import SingleFlight, SingleFlightStats
+from villa_ecommerce_sdk.transport import HTTPTransport, TransportStats
+
+if TYPE_CHECKING:  # pragma: no cover - heavy modules are imported on first use
+    import pandas as pd
+    from villa_ecommerce_sdk.bulk import BulkResult
+    from villa_ecommerce_sdk.cache import CacheBackend, S3Cache
+    from villa_ecommerce_sdk.disk_cache import DiskCache
+    from villa_ecommerce_sdk.filters import Filter
+    from villa_ecommerce_sdk.frame_cache import ParquetFrameCache
+    from villa_ecommerce_sdk.frames import JoinKey
+    from villa_ecommerce_sdk.inventory import InventoryService
+    from villa_ecommerce_sdk.memory_cache import MemoryCache
+    from villa_ecommerce_sdk.payments import PaymentService
+    from villa_ecommerce_sdk.products import ProductsService
+    from villa_ecommerce_sdk.schema import MemoryReport
+    from villa_ecommerce_sdk.submissions import SubmissionResult
 
 
 class VillaClient:
-    """Main client for interacting with Villa Ecommerce API."""
+    """
+    Main client for interacting with Villa Ecommerce API.
+    
+    The cache tiers and the products, inventory and payment services are
+    built on first use, so a caller that only needs one service (e.g. a
+    Lambda handling payment status) never pays for the others, for the
+    boto3 S3 client, or for importing pandas.
+    """
     
-    def __init__(self, s3_bucket: Optional[str] = None, base_url: str = "https://shop.villamarket.com"):
+    # Merged products/inventory views kept per client, least recently used evicted first
+    MAX_MERGED_VIEWS = 8
+    
+    def __init__(
+        self,
+        s3_bucket: Optional[str] = None,
+        base_url: str = "https://shop.villamarket.com",
+        transport: Optional[HTTPTransport] = None,
+        memory_cache: Optional["MemoryCache"] = None,
+        stale_while_revalidate: float = 0.0,
+        cache_codec: str = "json",
+        frame_cache: Optional["ParquetFrameCache"] = None,
+        disk_cache: Optional["DiskCache"] = None,
+        shared_cache: Optional["CacheBackend"] = None,
+        use_s3_cache: bool = True,
+        retry_policy: Union[RetryPolicy, bool, None] = None,
+        circuit_breaker: Union[CircuitBreaker, bool] = True,
+        stale_if_error: float = 0.0,
+        hedging: Union[Hedger, bool] = False,
+        typed_frames: bool = True,
+        report_memory: bool = False,
+        join_key: Optional["JoinKey"] = None
+    ):
         """
         Initialize Villa API client.
         
         Args:
             s3_bucket: S3 bucket name for caching (default: villa-ecommerce-sdk-cache)
             base_url: Base URL for Villa API (default: https://shop.villamarket.com)
+            transport: Optional HTTPTransport shared by all services
+                       (default: a new pooled transport)
+            memory_cache: Optional in-process MemoryCache tier placed in front of S3
+            stale_while_revalidate: Seconds past expiry during which stale cached data
+                                    is served while refreshed in the background
+                                    (default: 0, disabled)
+            cache_codec: Codec for new S3 cache entries, e.g. "json", "json+gzip",
+                         "json+zstd", "msgpack+zstd" (default: "json", which
+                         older SDK versions sharing the bucket can read)
+            frame_cache: Optional ParquetFrameCache storing product and inventory
+                         DataFrames as Parquet (on disk and/or in S3)
+            disk_cache: Optional local DiskCache tier placed in front of S3
+                        (behind memory_cache when both are given)
+            shared_cache: Optional fleet-wide cache backend (e.g. RedisCache) placed
+                          after the local tiers and in front of S3
+            use_s3_cache: Whether to cache in S3 (default: True); set False to use
+                          only the memory and/or disk tiers
+            retry_policy: RetryPolicy for transient upstream failures, or False to
+                          disable retries (default: 3 attempts with jittered
+                          exponential backoff)
+            circuit_breaker: CircuitBreaker shared by all services, True for a
+                             default one (5 failures, 30s recovery) or False to
+                             disable
+            stale_if_error: Seconds past expiry during which stale product and
+                            inventory data is served while the upstream is
+                            failing (default: 0, disabled); payment statuses
+                            are never served stale
+            hedging: Hedger for product and inventory GETs, True for a default one
+                     (hedge after the p95 latency, at most ~5% extra requests)
+                     or False to disable (default: False)
+            typed_frames: Whether product and inventory DataFrames use the declared
+                          schema dtypes (categoricals, nullable integers, compact
+                          floats, parsed datetimes) (default: True)
+            report_memory: Whether to record the memory saved by typed DataFrames
+                           per branch, see get_memory_report (default: False)
+            join_key: Column joining products to inventory in
+                      get_products_with_inventory, or (products column,
+                      inventory column) when the names differ (default: the
+                      first of product_id, id, sku, productId in both)
         """
         # Use default bucket name from template.yaml if not provided
         if s3_bucket is None:
@@ -21,84 +109,465 @@ class VillaClient:
         self.base_url = base_url.rstrip('/')
         self.s3_bucket = s3_bucket
         
-        # Import here to avoid circular dependency
+        self.transport = transport or HTTPTransport()
+        self.single_flight = SingleFlight()
+        self.memory_cache = memory_cache
+        self.frame_cache = frame_cache
+        self.disk_cache = disk_cache
+        self.shared_cache = shared_cache
+        self.cache_codec = cache_codec
+        self.use_s3_cache = use_s3_cache
+        self.stale_while_revalidate = stale_while_revalidate
+        if retry_policy is None or retry_policy is True:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy or None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+        self.stale_if_error = stale_if_error
+        if hedging is True:
+            hedging = Hedger()
+        self.hedger = hedging or None
+        self.typed_frames = typed_frames
+        self.report_memory = report_memory
+        self.join_key = join_key
+        # Merged products/inventory per (branch, join key): (input versions, DataFrame)
+        self._merged_views: "OrderedDict[Any, Any]" = OrderedDict()
+        self._merged_lock = threading.Lock()
+        
+        # Built on first use; RLock because services resolve the cache while holding it
+        self._lazy_lock = threading.RLock()
+        self._s3_cache: Optional["S3Cache"] = None
+        self._cache: Optional["CacheBackend"] = None
+        self._cache_built = False
+        self._products_service: Optional["ProductsService"] = None
+        self._inventory_service: Optional["InventoryService"] = None
+        self._payment_service: Optional["PaymentService"] = None
+    
+    @property
+    def s3_cache(self) -> Optional["S3Cache"]:
+        """S3 cache tier (None when use_s3_cache is False), built on first use."""
+        self._build_cache()
+        return self._s3_cache
+    
+    @property
+    def cache(self) -> Optional["CacheBackend"]:
+        """Cache shared by all services (a TieredCache when several tiers are configured)."""
+        self._build_cache()
+        return self._cache
+    
+    @cache.setter
+    def cache(self, cache: Optional["CacheBackend"]) -> None:
+        """Install a cache backend in place of the configured tiers, including in built services."""
         from villa_ecommerce_sdk.cache import S3Cache
-        from villa_ecommerce_sdk.products import ProductsService
-        from villa_ecommerce_sdk.inventory import InventoryService
-        from villa_ecommerce_sdk.payments import PaymentService
         
-        self.cache = S3Cache(bucket_name=s3_bucket)
-        self.products_service = ProductsService(base_url=base_url, cache=self.cache)
-        self.inventory_service = InventoryService(base_url=base_url, cache=self.cache)
-        self.payment_service = PaymentService(base_url=base_url, cache=self.cache)
+        with self._lazy_lock:
+            self._cache = cache
+            self._s3_cache = cache if isinstance(cache, S3Cache) else None
+            self._cache_built = True
+            for service in (self._products_service, self._inventory_service, self._payment_service):
+                if service is not None:
+                    service.cache = cache
+    
+    def _build_cache(self) -> None:
+        """Assemble the cache tiers once."""
+        if self._cache_built:
+            return
+        with self._lazy_lock:
+            if self._cache_built:
+                return
+            # Import here to avoid circular dependency
+            from villa_ecommerce_sdk.cache import S3Cache
+            from villa_ecommerce_sdk.tiered_cache import TieredCache
+            
+            if self.use_s3_cache:
+                self._s3_cache = S3Cache(bucket_name=self.s3_bucket, codec=self.cache_codec)
+            configured = (self.memory_cache, self.disk_cache, self.shared_cache, self._s3_cache)
+            tiers = [tier for tier in configured if tier is not None]
+            if len(tiers) > 1:
+                self._cache = TieredCache(tiers)
+            else:
+                self._cache = tiers[0] if tiers else None
+            self._cache_built = True
+    
+    def _service_kwargs(self) -> Dict[str, Any]:
+        """Constructor arguments shared by every service."""
+        return {
+            'base_url': self.base_url,
+            'cache': self.cache,
+            'transport': self.transport,
+            'stale_while_revalidate': self.stale_while_revalidate,
+            'single_flight': self.single_flight,
+            'retry_policy': self.retry_policy,
+            'circuit_breaker': self.circuit_breaker,
+            'stale_if_error': self.stale_if_error,
+        }
+    
+    @property
+    def products_service(self) -> "ProductsService":
+        """Products service, built on first use."""
+        if self._products_service is None:
+            with self._lazy_lock:
+                if self._products_service is None:
+                    from villa_ecommerce_sdk.products import ProductsService
+                    self._products_service = ProductsService(
+                        frame_cache=self.frame_cache,
+                        hedger=self.hedger,
+                        typed_frames=self.typed_frames,
+                        report_memory=self.report_memory,
+                        **self._service_kwargs()
+                    )
+        return self._products_service
+    
+    @property
+    def inventory_service(self) -> "InventoryService":
+        """Inventory service, built on first use."""
+        if self._inventory_service is None:
+            with self._lazy_lock:
+                if self._inventory_service is None:
+                    from villa_ecommerce_sdk.inventory import InventoryService
+                    self._inventory_service = InventoryService(
+                        frame_cache=self.frame_cache,
+                        hedger=self.hedger,
+                        typed_frames=self.typed_frames,
+                        report_memory=self.report_memory,
+                        **self._service_kwargs()
+                    )
+        return self._inventory_service
+    
+    @property
+    def payment_service(self) -> "PaymentService":
+        """Payment service, built on first use."""
+        if self._payment_service is None:
+            with self._lazy_lock:
+                if self._payment_service is None:
+                    from villa_ecommerce_sdk.payments import PaymentService
+                    # A payment status from before an outage may since have changed
+                    self._payment_service = PaymentService(
+                        **dict(self._service_kwargs(), stale_if_error=0.0)
+                    )
+        return self._payment_service
+    
+    def get_transport_stats(self) -> TransportStats:
+        """
+        Get connection reuse statistics for the shared HTTP transport.
+        
+        Returns:
+            TransportStats snapshot
+        """
+        return self.transport.stats()
     
-    def get_product_list(self, branch: int = 1000) -> pd.DataFrame:
+    def get_coalescing_stats(self) -> SingleFlightStats:
+        """
+        Get request coalescing counters shared by all services.
+        
+        Returns:
+            SingleFlightStats snapshot (calls, upstream executions, coalesced calls)
+        """
+        return self.single_flight.stats()
+    
+    def get_hedging_stats(self) -> HedgingStats:
+        """
+        Get hedged request counters for product and inventory GETs.
+        
+        Returns:
+            HedgingStats snapshot (all zero when hedging is disabled)
+        """
+        if self.hedger is None:
+            return HedgingStats()
+        return self.hedger.stats()
+    
+    def get_memory_report(self) -> Dict[str, "MemoryReport"]:
+        """
+        Get the memory saved by typed product and inventory DataFrames.
+        
+        Reports are recorded when report_memory is enabled, one per frame
+        built from a response (e.g. "products/1000", "inventory/2000").
+        
+        Returns:
+            Dict of frame key to MemoryReport for the most recent build
+        """
+        reports: Dict[str, "MemoryReport"] = {}
+        for service in (self._products_service, self._inventory_service):
+            if service is not None:
+                reports.update(service.memory_reports)
+        return reports
+    
+    def get_circuit_states(self) -> Dict[str, str]:
+        """
+        Get circuit breaker states for endpoints that have recorded failures.
+        
+        Returns:
+            Dict of endpoint route to "closed", "open" or "half_open"
+            (empty when the circuit breaker is disabled)
+        """
+        if self.circuit_breaker is None:
+            return {}
+        return self.circuit_breaker.states()
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections and hedging worker threads."""
+        self.transport.close()
+        if self.hedger is not None:
+            self.hedger.close()
+    
+    def __enter__(self) -> "VillaClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def get_product_list(
+        self,
+        branch: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> "pd.DataFrame":
         """
         Get product list for a specific branch.
         
         Args:
             branch: Branch ID (default: 1000)
+            columns: Optional columns to return
             
         Returns:
             DataFrame containing product data
         """
-        return self.products_service.get_product_list(branch=branch)
+        return self.products_service.get_product_list(branch=branch, columns=columns)
     
-    def get_inventory(self, branch: int = 1000) -> pd.DataFrame:
+    def get_inventory(
+        self,
+        branch: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> "pd.DataFrame":
         """
         Get inventory data for a specific branch.
         
         Args:
             branch: Branch ID (default: 1000)
+            columns: Optional columns to return
             
         Returns:
             DataFrame containing inventory data
         """
-        return self.inventory_service.get_inventory(branch=branch)
+        return self.inventory_service.get_inventory(branch=branch, columns=columns)
+    
+    def stream_product_list(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 10000
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Stream product data for a branch as DataFrame chunks in bounded memory.
+        
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Maximum rows per DataFrame (default: 10000)
+            
+        Returns:
+            Iterator of DataFrames
+        """
+        return self.products_service.stream_product_list(branch=branch, chunk_size=chunk_size)
+    
+    def stream_inventory(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 10000
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Stream inventory data for a branch as DataFrame chunks in bounded memory.
+        
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Maximum rows per DataFrame (default: 10000)
+            
+        Returns:
+            Iterator of DataFrames
+        """
+        return self.inventory_service.stream_inventory(branch=branch, chunk_size=chunk_size)
+    
+    def iter_products(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 1000,
+        as_records: bool = False
+    ) -> Iterator[Union["pd.DataFrame", List[Dict[str, Any]]]]:
+        """
+        Iterate over product data for a branch in fixed-size chunks.
+        
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Rows per chunk (default: 1000)
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Returns:
+            Iterator of DataFrames (or lists of dicts)
+        """
+        return self.products_service.iter_products(
+            branch=branch, chunk_size=chunk_size, as_records=as_records
+        )
+    
+    def iter_inventory(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 1000,
+        as_records: bool = False
+    ) -> Iterator[Union["pd.DataFrame", List[Dict[str, Any]]]]:
+        """
+        Iterate over inventory data for a branch in fixed-size chunks.
+        
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Rows per chunk (default: 1000)
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Returns:
+            Iterator of DataFrames (or lists of dicts)
+        """
+        return self.inventory_service.iter_inventory(
+            branch=branch, chunk_size=chunk_size, as_records=as_records
+        )
+    
+    def get_product_list_many(self, branches: Iterable[int], max_workers: int = 8) -> "BulkResult":
+        """
+        Get product lists for several branches in parallel.
+        
+        Failed branches are reported in BulkResult.errors without aborting the batch.
+        
+        Args:
+            branches: Branch IDs to fetch
+            max_workers: Maximum concurrent fetches (default: 8)
+            
+        Returns:
+            BulkResult; use .results for a dict keyed by branch or .to_frame()
+            for one DataFrame with a branch column
+        """
+        from villa_ecommerce_sdk.bulk import fetch_many
+        return fetch_many(
+            lambda branch: self.get_product_list(branch=branch),
+            branches,
+            max_workers=max_workers
+        )
+    
+    def get_inventory_many(self, branches: Iterable[int], max_workers: int = 8) -> "BulkResult":
+        """
+        Get inventory data for several branches in parallel.
+        
+        Failed branches are reported in BulkResult.errors without aborting the batch.
+        
+        Args:
+            branches: Branch IDs to fetch
+            max_workers: Maximum concurrent fetches (default: 8)
+            
+        Returns:
+            BulkResult; use .results for a dict keyed by branch or .to_frame()
+            for one DataFrame with a branch column
+        """
+        from villa_ecommerce_sdk.bulk import fetch_many
+        return fetch_many(
+            lambda branch: self.get_inventory(branch=branch),
+            branches,
+            max_workers=max_workers
+        )
     
     def get_products_with_inventory(
         self, 
         branch: int = 1000, 
-        filters: Optional[Dict[str, Any]] = None
-    ) -> pd.DataFrame:
+        filters: Optional[Union[Dict[str, Any], "Filter"]] = None,
+        join_key: Optional["JoinKey"] = None
+    ) -> "pd.DataFrame":
         """
         Get merged products and inventory data with optional filtering.
         
         This method fetches both product and inventory data, merges them,
-        and applies filters if provided.
+        and applies filters if provided. The merged view is kept per branch
+        and reused until the cache entry behind either input changes, so
+        repeated calls against cached data skip the join.
         
         Args:
             branch: Branch ID (default: 1000)
             filters: Optional dictionary of filters to apply to the merged DataFrame
                     Keys should be column names, values are filter criteria
                     Example: {"category": "electronics", "in_stock": True}
+                    A precompiled Filter can be reused across branches
+            join_key: Optional join column for this call (default: the
+                      client's join_key)
             
         Returns:
             Merged and filtered DataFrame
+            
+        Raises:
+            ValueError: If an explicit join column is missing from either frame
         """
         # Fetch both datasets
         products_df = self.get_product_list(branch=branch)
         inventory_df = self.get_inventory(branch=branch)
         
-        # Merge dataframes
-        # Try common merge keys (product_id, id, sku, etc.)
-        merged_df = self._merge_dataframes(products_df, inventory_df)
+        merged_df = self._merged_view(
+            branch, products_df, inventory_df,
+            join_key if join_key is not None else self.join_key
+        )
         
-        # Apply filters if provided
+        # Apply filters if provided (both paths return a copy of the shared view)
         if filters:
-            merged_df = self.filter_dataframe(merged_df, filters)
+            return self.filter_dataframe(merged_df, filters)
+        from villa_ecommerce_sdk.frames import copy_shared
+        return copy_shared(merged_df)
+    
+    def _merged_view(
+        self,
+        branch: int,
+        products_df: "pd.DataFrame",
+        inventory_df: "pd.DataFrame",
+        join_key: Optional["JoinKey"]
+    ) -> "pd.DataFrame":
+        """
+        Get the merged DataFrame for a branch, recomputing it only when an input changed.
+        
+        At most MAX_MERGED_VIEWS views are kept; the least recently used
+        one is dropped first.
+        
+        Args:
+            branch: Branch ID
+            products_df: Products DataFrame
+            inventory_df: Inventory DataFrame
+            join_key: Optional explicit join column(s)
+            
+        Returns:
+            Merged DataFrame (shared; callers must not modify it)
+        """
+        from villa_ecommerce_sdk.base import SOURCE_VERSION_ATTR
+        from villa_ecommerce_sdk.frames import merge_dataframes
         
+        versions = (
+            products_df.attrs.get(SOURCE_VERSION_ATTR),
+            inventory_df.attrs.get(SOURCE_VERSION_ATTR)
+        )
+        view_key = (branch, join_key)
+        with self._merged_lock:
+            cached = self._merged_views.get(view_key)
+            if cached is not None and cached[0] == versions:
+                self._merged_views.move_to_end(view_key)
+                return cached[1]
+        
+        merged_df = merge_dataframes(products_df, inventory_df, join_key=join_key)
+        with self._merged_lock:
+            if None in versions:
+                # Unknown provenance (e.g. uncached responses): nothing to validate against
+                self._merged_views.pop(view_key, None)
+            else:
+                self._merged_views[view_key] = (versions, merged_df)
+                self._merged_views.move_to_end(view_key)
+                while len(self._merged_views) > self.MAX_MERGED_VIEWS:
+                    self._merged_views.popitem(last=False)
         return merged_df
     
     def _merge_dataframes(
         self, 
-        products_df: pd.DataFrame, 
-        inventory_df: pd.DataFrame
-    ) -> pd.DataFrame:
+        products_df: "pd.DataFrame", 
+        inventory_df: "pd.DataFrame"
+    ) -> "pd.DataFrame":
         """
-        Merge product and inventory dataframes.
-        
-        Attempts to find common columns for merging (product_id, id, sku, etc.)
+        Merge product and inventory dataframes on the client's join key.
         
         Args:
             products_df: Products DataFrame
@@ -107,70 +576,29 @@ class VillaClient:
         Returns:
             Merged DataFrame
         """
-        # Try common merge keys in order of preference
-        merge_keys = ['product_id', 'id', 'sku', 'productId', 'product_id']
-        
-        for key in merge_keys:
-            if key in products_df.columns and key in inventory_df.columns:
-                return pd.merge(
-                    products_df, 
-                    inventory_df, 
-                    on=key, 
-                    how='outer',
-                    suffixes=('_product', '_inventory')
-                )
-        
-        # If no common key found, try to merge on index
-        # This is a fallback - may need adjustment based on actual API response structure
-        if len(products_df) == len(inventory_df):
-            return pd.concat([products_df, inventory_df], axis=1)
-        
-        # Last resort: return products with inventory columns appended
-        # This will need to be adjusted based on actual API response structure
-        return products_df.copy()
+        from villa_ecommerce_sdk.frames import merge_dataframes
+        return merge_dataframes(products_df, inventory_df, join_key=self.join_key)
     
-    def filter_dataframe(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
+    def filter_dataframe(
+        self,
+        df: "pd.DataFrame",
+        filters: Union[Dict[str, Any], "Filter"]
+    ) -> "pd.DataFrame":
         """
         Filter DataFrame based on provided criteria.
         
+        See villa_ecommerce_sdk.filters.Filter for supported criteria.
+        
         Args:
             df: DataFrame to filter
-            filters: Dictionary where keys are column names and values are filter criteria
-                    Supports:
-                    - Exact match: {"column": "value"}
-                    - Boolean: {"column": True}
-                    - Numeric comparison: {"column": {"gt": 100}} or {"column": {"lt": 50}}
-                    - Multiple conditions: {"column": ["value1", "value2"]}
+            filters: Dictionary where keys are column names and values are filter
+                     criteria, or a precompiled Filter
         
         Returns:
             Filtered DataFrame
         """
-        filtered_df = df.copy()
-        
-        for column, criteria in filters.items():
-            if column not in filtered_df.columns:
-                continue
-            
-            if isinstance(criteria, dict):
-                # Handle comparison operators
-                if 'gt' in criteria:
-                    filtered_df = filtered_df[filtered_df[column] > criteria['gt']]
-                elif 'lt' in criteria:
-                    filtered_df = filtered_df[filtered_df[column] < criteria['lt']]
-                elif 'gte' in criteria:
-                    filtered_df = filtered_df[filtered_df[column] >= criteria['gte']]
-                elif 'lte' in criteria:
-                    filtered_df = filtered_df[filtered_df[column] <= criteria['lte']]
-                elif 'eq' in criteria:
-                    filtered_df = filtered_df[filtered_df[column] == criteria['eq']]
-            elif isinstance(criteria, list):
-                # Handle multiple values (OR condition)
-                filtered_df = filtered_df[filtered_df[column].isin(criteria)]
-            else:
-                # Exact match
-                filtered_df = filtered_df[filtered_df[column] == criteria]
-        
-        return filtered_df
+        from villa_ecommerce_sdk.frames import filter_dataframe
+        return filter_dataframe(df, filters)
     
     # Payment methods
     def create_payment(
@@ -180,7 +608,8 @@ class VillaClient:
         currency: str = "THB",
         payment_method: str = "credit_card",
         customer_info: Optional[Dict[str, Any]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create a new payment for an order.
@@ -192,6 +621,7 @@ class VillaClient:
             payment_method: Payment method (credit_card, bank_transfer, etc.)
             customer_info: Optional customer information
             metadata: Optional additional metadata
+            idempotency_key: Optional Idempotency-Key making the request safe to repeat
             
         Returns:
             Payment response data
@@ -202,20 +632,98 @@ class VillaClient:
             currency=currency,
             payment_method=payment_method,
             customer_info=customer_info,
-            metadata=metadata
+            metadata=metadata,
+            idempotency_key=idempotency_key
         )
     
-    def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+    def create_payments(
+        self,
+        payments: Iterable[Dict[str, Any]],
+        journal: Optional[str] = None,
+        max_workers: int = 8
+    ) -> "SubmissionResult":
+        """
+        Create many payments with idempotency keys and bounded concurrency.
+        
+        Args:
+            payments: create_payment keyword arguments, one dict per payment
+            journal: Optional journal file path; re-running with the same items
+                     and journal resumes without re-sending completed payments
+            max_workers: Maximum requests in flight at once (default: 8)
+            
+        Returns:
+            SubmissionResult keyed by idempotency key
+        """
+        return self.payment_service.create_payments(
+            payments, journal=journal, max_workers=max_workers
+        )
+    
+    def get_payment_status(self, payment_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get payment status by payment ID.
         
+        Terminal statuses are cached for a day; in-progress statuses only briefly.
+        
         Args:
             payment_id: Payment identifier
+            refresh: Bypass the cache and ask the API (default: False)
             
         Returns:
             Payment status data
         """
-        return self.payment_service.get_payment_status(payment_id=payment_id)
+        return self.payment_service.get_payment_status(payment_id=payment_id, refresh=refresh)
+    
+    def get_payment_statuses(
+        self,
+        payment_ids: Iterable[str],
+        max_workers: int = 16
+    ) -> "pd.DataFrame":
+        """
+        Get the status of many payments.
+        
+        IDs are de-duplicated, cached terminal statuses are read in one
+        batched cache lookup and the rest are fetched concurrently.
+        
+        Args:
+            payment_ids: Payment identifiers
+            max_workers: Maximum concurrent API requests (default: 16)
+            
+        Returns:
+            DataFrame indexed by payment_id with the status fields and an error column
+        """
+        return self.payment_service.get_payment_statuses(payment_ids, max_workers=max_workers)
+    
+    def wait_for_payment_status(
+        self,
+        payment_ids: Union[str, Iterable[str]],
+        statuses: Optional[Collection[str]] = None,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: float = 15.0,
+        max_workers: int = 8
+    ) -> Any:
+        """
+        Poll payments until they reach a terminal (or given) status.
+        
+        Args:
+            payment_ids: Payment ID, or IDs to wait for
+            statuses: Optional statuses to wait for in addition to the terminal ones
+            timeout: Seconds to wait in total (default: 300)
+            initial_interval: Seconds between the first polls (default: 0.5)
+            max_interval: Upper bound on the poll interval (default: 15)
+            max_workers: Maximum polls in flight at once (default: 8)
+            
+        Returns:
+            The last status data for a single ID, or a dict mapping each ID to it
+        """
+        return self.payment_service.wait_for_payment_status(
+            payment_ids,
+            statuses=statuses,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            max_workers=max_workers
+        )
     
     def get_payment_history(
         self,
@@ -223,8 +731,10 @@ class VillaClient:
         customer_id: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 100
-    ) -> pd.DataFrame:
+        limit: int = 100,
+        all_pages: bool = False,
+        prefetch: int = 8
+    ) -> "pd.DataFrame":
         """
         Get payment history with optional filters.
         
@@ -233,7 +743,11 @@ class VillaClient:
             customer_id: Optional customer ID filter
             start_date: Optional start date (YYYY-MM-DD format)
             end_date: Optional end date (YYYY-MM-DD format)
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return, or the page size
+                   when all_pages is True
+            all_pages: Fetch every page of the history, prefetching pages
+                       concurrently (default: False)
+            prefetch: Maximum pages in flight when all_pages is True (default: 8)
             
         Returns:
             DataFrame containing payment history
@@ -243,14 +757,55 @@ class VillaClient:
             customer_id=customer_id,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            all_pages=all_pages,
+            prefetch=prefetch
+        )
+    
+    def iter_payment_history(
+        self,
+        order_id: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 8,
+        max_records: Optional[int] = None,
+        as_records: bool = False
+    ) -> Iterator[Union["pd.DataFrame", List[Dict[str, Any]]]]:
+        """
+        Stream payment history page by page, prefetching pages concurrently.
+        
+        Args:
+            order_id: Optional order ID filter
+            customer_id: Optional customer ID filter
+            start_date: Optional start date (YYYY-MM-DD format)
+            end_date: Optional end date (YYYY-MM-DD format)
+            page_size: Records requested per page (default: 100)
+            prefetch: Maximum pages in flight at once (default: 8)
+            max_records: Optional maximum number of records to return
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Yields:
+            One DataFrame (or list of record dicts) per page
+        """
+        return self.payment_service.iter_payment_history(
+            order_id=order_id,
+            customer_id=customer_id,
+            start_date=start_date,
+            end_date=end_date,
+            page_size=page_size,
+            prefetch=prefetch,
+            max_records=max_records,
+            as_records=as_records
         )
     
     def process_refund(
         self,
         payment_id: str,
         amount: Optional[float] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a refund for a payment.
@@ -259,6 +814,7 @@ class VillaClient:
             payment_id: Payment identifier to refund
             amount: Optional partial refund amount (if None, full refund)
             reason: Optional refund reason
+            idempotency_key: Optional Idempotency-Key making the request safe to repeat
             
         Returns:
             Refund response data
@@ -266,20 +822,98 @@ class VillaClient:
         return self.payment_service.process_refund(
             payment_id=payment_id,
             amount=amount,
-            reason=reason
+            reason=reason,
+            idempotency_key=idempotency_key
         )
     
-    def get_refund_status(self, refund_id: str) -> Dict[str, Any]:
+    def process_refunds(
+        self,
+        refunds: Iterable[Dict[str, Any]],
+        journal: Optional[str] = None,
+        max_workers: int = 8
+    ) -> "SubmissionResult":
+        """
+        Process many refunds with idempotency keys and bounded concurrency.
+        
+        Args:
+            refunds: process_refund keyword arguments, one dict per refund
+            journal: Optional journal file path; re-running with the same items
+                     and journal resumes without re-sending completed refunds
+            max_workers: Maximum requests in flight at once (default: 8)
+            
+        Returns:
+            SubmissionResult keyed by idempotency key
+        """
+        return self.payment_service.process_refunds(
+            refunds, journal=journal, max_workers=max_workers
+        )
+    
+    def get_refund_status(self, refund_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get refund status by refund ID.
         
+        Terminal statuses are cached for a day; in-progress statuses only briefly.
+        
         Args:
             refund_id: Refund identifier
+            refresh: Bypass the cache and ask the API (default: False)
             
         Returns:
             Refund status data
         """
-        return self.payment_service.get_refund_status(refund_id=refund_id)
+        return self.payment_service.get_refund_status(refund_id=refund_id, refresh=refresh)
+    
+    def get_refund_statuses(
+        self,
+        refund_ids: Iterable[str],
+        max_workers: int = 16
+    ) -> "pd.DataFrame":
+        """
+        Get the status of many refunds.
+        
+        IDs are de-duplicated, cached terminal statuses are read in one
+        batched cache lookup and the rest are fetched concurrently.
+        
+        Args:
+            refund_ids: Refund identifiers
+            max_workers: Maximum concurrent API requests (default: 16)
+            
+        Returns:
+            DataFrame indexed by refund_id with the status fields and an error column
+        """
+        return self.payment_service.get_refund_statuses(refund_ids, max_workers=max_workers)
+    
+    def wait_for_refund_status(
+        self,
+        refund_ids: Union[str, Iterable[str]],
+        statuses: Optional[Collection[str]] = None,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: float = 15.0,
+        max_workers: int = 8
+    ) -> Any:
+        """
+        Poll refunds until they reach a terminal (or given) status.
+        
+        Args:
+            refund_ids: Refund ID, or IDs to wait for
+            statuses: Optional statuses to wait for in addition to the terminal ones
+            timeout: Seconds to wait in total (default: 300)
+            initial_interval: Seconds between the first polls (default: 0.5)
+            max_interval: Upper bound on the poll interval (default: 15)
+            max_workers: Maximum polls in flight at once (default: 8)
+            
+        Returns:
+            The last status data for a single ID, or a dict mapping each ID to it
+        """
+        return self.payment_service.wait_for_refund_status(
+            refund_ids,
+            statuses=statuses,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            max_workers=max_workers
+        )
     
     def get_available_payment_methods(self, branch: int = 1000) -> list:
         """
@@ -0,0 +1,305 @@
+"""Local filesystem cache backend for Villa Ecommerce SDK."""
+
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.serialization import Codec, get_codec, json_dumps, json_loads
+
+
+# Suffix of in-progress writes; such files are ignored and never served
+_TMP_SUFFIX = ".tmp"
+
+
+@dataclass
+class DiskCacheStats:
+    """Counters for a DiskCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class DiskCache:
+    """
+    Size-bounded filesystem cache with the same interface as S3Cache.
+
+    Each entry is one file: a single JSON header line holding freshness,
+    validator and codec information, followed by the encoded payload.
+    Writes go to a temporary file that is atomically renamed into place, so
+    readers never see a partial entry. When the total size exceeds
+    max_bytes, least recently used entries are deleted. Entries at or above
+    mmap_threshold bytes are read through a memory map.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1024 ** 3,
+        codec: Union[str, Codec] = "json",
+        mmap_threshold: int = 256 * 1024
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory holding cache files (created if missing)
+            max_bytes: Maximum total size before LRU eviction (default: 1 GiB)
+            codec: Codec name or instance for new entries (default: "json")
+            mmap_threshold: Entry size in bytes from which reads are memory-mapped
+                            (default: 256 KiB)
+        """
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.codec = get_codec(codec)
+        self.mmap_threshold = mmap_threshold
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._stats = DiskCacheStats()
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Index existing cache files, least recently used first."""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(_TMP_SUFFIX):
+                    # Left behind by an interrupted write
+                    _remove(path)
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(found):
+            self._sizes[path] = size
+            self._total_bytes += size
+
+    def _get_path(self, key: str) -> str:
+        """Map a cache key to a file path inside the cache directory."""
+        path = os.path.normpath(os.path.join(self.directory, *key.split('/')))
+        if not path.startswith(self.directory + os.sep):
+            raise ValueError(f"Invalid cache key: {key}")
+        return path
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry with its freshness metadata, even if expired.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+
+        Returns:
+            CacheEntry, or None if not found or error occurs
+        """
+        try:
+            path = self._get_path(key)
+            entry = self._read(path)
+        except Exception:
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+                if path in self._sizes:
+                    self._sizes.move_to_end(path)
+        return entry
+
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve fresh cached data.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Cached data, or None if not found, expired or error occurs
+        """
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh(max_age=max_age):
+            return None
+        return entry.data
+
+    def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store data in the disk cache.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            data: Data to cache (serialized with the configured codec)
+            ttl: Optional time-to-live in seconds (default: never expires)
+        """
+        self.set_entry(key, CacheEntry(data=data, stored_at=time.time(), ttl=ttl))
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a cache entry, keeping its freshness metadata in the file header.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry to store
+        """
+        try:
+            payload = self.codec.encode(entry.data)
+            self._write(self._get_path(key), entry, self.codec.name, payload)
+        except Exception:
+            # Log error but don't fail - caching is optional
+            pass
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Refresh an entry's freshness metadata without re-encoding its payload.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry carrying the new store time and validators
+        """
+        try:
+            path = self._get_path(key)
+            with open(path, 'rb') as f:
+                header = json_loads(f.readline())
+                payload = f.read()
+            self._write(path, entry, header.get('codec') or self.codec.name, payload)
+        except Exception:
+            # Log error but don't fail - the entry will simply be revalidated again
+            pass
+
+    def is_cached(self, key: str) -> bool:
+        """
+        Check if a key exists in cache.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        try:
+            return os.path.isfile(self._get_path(key))
+        except Exception:
+            return False
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove cached data from disk.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        try:
+            path = self._get_path(key)
+        except ValueError:
+            return
+        with self._lock:
+            self._total_bytes -= self._sizes.pop(path, 0)
+        _remove(path)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache directory."""
+        with self._lock:
+            paths = list(self._sizes)
+            self._sizes.clear()
+            self._total_bytes = 0
+        for path in paths:
+            _remove(path)
+
+    def stats(self) -> DiskCacheStats:
+        """
+        Get hit/miss/eviction counters and current size.
+
+        Returns:
+            DiskCacheStats snapshot
+        """
+        with self._lock:
+            return DiskCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._sizes),
+                size_bytes=self._total_bytes
+            )
+
+    def _read(self, path: str) -> Optional[CacheEntry]:
+        """Read and decode an entry file."""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    offset = mapped.find(b"\n") + 1
+                    header = json_loads(mapped[:offset])
+                    # Decode straight from the mapping; the views must be
+                    # released before the map can close
+                    with memoryview(mapped) as view, view[offset:] as payload:
+                        data = get_codec(header.get('codec')).decode_bytes(payload)
+            else:
+                header = json_loads(f.readline())
+                data = get_codec(header.get('codec')).decode(f)
+        return CacheEntry(
+            data=data,
+            stored_at=header.get('stored_at'),
+            ttl=header.get('ttl'),
+            etag=header.get('etag'),
+            last_modified=header.get('last_modified'),
+            codec=header.get('codec')
+        )
+
+    def _write(self, path: str, entry: CacheEntry, codec_name: str, payload: bytes) -> None:
+        """Atomically write an entry file and enforce the size bound."""
+        header = {
+            'stored_at': entry.stored_at if entry.stored_at is not None else time.time(),
+            'ttl': entry.ttl,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'codec': codec_name,
+        }
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=_TMP_SUFFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps(header))
+                f.write(b"\n")
+                f.write(payload)
+                size = f.tell()
+            os.replace(tmp_path, path)
+        except Exception:
+            _remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._total_bytes += size - self._sizes.pop(path, 0)
+            self._sizes[path] = size
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(self._sizes) > 1:
+                victim, victim_size = self._sizes.popitem(last=False)
+                self._total_bytes -= victim_size
+                evicted.append(victim)
+            self._stats.evictions += len(evicted)
+        for victim in evicted:
+            _remove(victim)
+
+
+def _remove(path: str) -> None:
+    """Delete a file, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,234 @@
+"""Compiled DataFrame filters for Villa Ecommerce SDK."""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+# A row mask, or None when no criterion applies to the frame
+_Mask = Optional[np.ndarray]
+_Node = Callable[[pd.DataFrame], _Mask]
+
+
+def _between(series: pd.Series, bounds: Any) -> pd.Series:
+    low, high = bounds
+    return (series >= low) & (series <= high)
+
+
+def _isnull(series: pd.Series, expected: Any) -> pd.Series:
+    return series.isna() if expected else series.notna()
+
+
+# Column operators: name -> (series, value) -> boolean Series
+OPERATORS: Dict[str, Callable[[pd.Series, Any], Any]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'between': _between,
+    'in': lambda series, values: series.isin(values),
+    'nin': lambda series, values: ~series.isin(values),
+    'contains': lambda series, text: series.str.contains(text, regex=False, na=False),
+    'icontains': lambda series, text: series.str.contains(text, case=False, regex=False, na=False),
+    'isnull': _isnull,
+}
+
+
+class Filter:
+    """
+    A filter spec compiled into a single vectorized boolean mask.
+
+    Specs are dicts mapping column names to criteria:
+
+    - Exact match: {"category": "Dairy"}
+    - Null check: {"brand": None}
+    - Any of several values: {"category": ["Dairy", "Bakery"]}
+    - Operators, all of which must hold: {"price": {"gte": 10, "lt": 50}}
+      (eq, ne, gt, gte, lt, lte, between: [low, high], in, nin,
+      contains, icontains, isnull: True/False)
+    - Combinators: {"$and": [spec, ...]}, {"$or": [spec, ...]}, {"$not": spec}
+
+    Entries of one dict are ANDed. Criteria on columns a frame does not
+    have are ignored, and missing values never match a comparison. A
+    compiled Filter holds no data, so it can be built once and applied to
+    the frames of any branch.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Compile a filter spec.
+
+        Args:
+            spec: Filter spec (see class docstring)
+
+        Raises:
+            ValueError: If the spec uses an unknown operator or combinator
+            TypeError: If the spec is not a dict
+        """
+        self.spec = spec
+        self._node = _compile(spec)
+
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the filter to a row mask.
+
+        Args:
+            df: DataFrame to evaluate
+
+        Returns:
+            Boolean numpy array with one entry per row
+        """
+        mask = self._node(df)
+        if mask is None:
+            return np.ones(len(df), dtype=bool)
+        return mask
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the matching rows.
+
+        Args:
+            df: DataFrame to filter
+
+        Returns:
+            New DataFrame holding the matching rows
+        """
+        mask = self._node(df)
+        if mask is None:
+            return df.copy()
+        return df[mask]
+
+    __call__ = apply
+
+    def __repr__(self) -> str:
+        return f"Filter({self.spec!r})"
+
+
+def compile_filter(filters: Union[Dict[str, Any], Filter]) -> Filter:
+    """
+    Compile a filter spec, passing already compiled filters through.
+
+    Args:
+        filters: Filter spec or Filter
+
+    Returns:
+        Filter
+    """
+    if isinstance(filters, Filter):
+        return filters
+    return Filter(filters)
+
+
+def _compile(spec: Any) -> _Node:
+    """Compile a spec dict into a mask function."""
+    if isinstance(spec, Filter):
+        return spec._node
+    if not isinstance(spec, dict):
+        raise TypeError(f"Filter spec must be a dict, got {type(spec).__name__}")
+
+    nodes: List[_Node] = []
+    for key, value in spec.items():
+        if key == '$and':
+            nodes.append(_all([_compile(child) for child in _spec_list(key, value)]))
+        elif key == '$or':
+            nodes.append(_any([_compile(child) for child in _spec_list(key, value)]))
+        elif key == '$not':
+            nodes.append(_negate(_compile(value)))
+        elif isinstance(key, str) and key.startswith('$'):
+            raise ValueError(f"Unknown filter combinator {key!r}")
+        else:
+            nodes.extend(_column_nodes(key, value))
+    return nodes[0] if len(nodes) == 1 else _all(nodes)
+
+
+def _spec_list(key: str, value: Any) -> List[Any]:
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{key} expects a list of filter specs")
+    return list(value)
+
+
+def _column_nodes(column: Any, criteria: Any) -> List[_Node]:
+    """Compile the criteria for one column."""
+    if isinstance(criteria, dict):
+        return [_leaf(column, name, value) for name, value in criteria.items()]
+    if isinstance(criteria, (list, tuple, set, frozenset)):
+        return [_leaf(column, 'in', list(criteria))]
+    if criteria is None:
+        return [_leaf(column, 'isnull', True)]
+    return [_leaf(column, 'eq', criteria)]
+
+
+def _leaf(column: Any, name: str, value: Any) -> _Node:
+    """Compile one column operator."""
+    function = OPERATORS.get(name)
+    if function is None:
+        raise ValueError(f"Unknown filter operator {name!r} for column {column!r}")
+    if name == 'between' and (not isinstance(value, (list, tuple)) or len(value) != 2):
+        raise ValueError(f"between expects [low, high] for column {column!r}")
+    if name in ('in', 'nin') and not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError(f"{name} expects a list of values for column {column!r}")
+
+    def node(df: pd.DataFrame) -> _Mask:
+        if column not in df.columns:
+            return None
+        return _to_mask(function(df[column], value))
+
+    return node
+
+
+def _to_mask(result: Any) -> np.ndarray:
+    """Convert a comparison result to a writable bool array (missing values are False)."""
+    if isinstance(result, pd.Series):
+        mask = result.to_numpy(dtype=bool, na_value=False)
+    else:
+        mask = np.asarray(result, dtype=bool)
+    if not mask.flags.writeable:
+        # Copy-on-write views are read-only; masks are combined in place
+        mask = mask.copy()
+    return mask
+
+
+def _all(nodes: List[_Node]) -> _Node:
+    def node(df: pd.DataFrame) -> _Mask:
+        mask = None
+        for child in nodes:
+            child_mask = child(df)
+            if child_mask is None:
+                continue
+            if mask is None:
+                mask = child_mask
+            else:
+                mask &= child_mask
+            if not mask.any():
+                # Nothing left to narrow down
+                break
+        return mask
+    return node
+
+
+def _any(nodes: List[_Node]) -> _Node:
+    def node(df: pd.DataFrame) -> _Mask:
+        mask = None
+        for child in nodes:
+            child_mask = child(df)
+            if child_mask is None:
+                continue
+            if mask is None:
+                mask = child_mask
+            else:
+                mask |= child_mask
+            if mask.all():
+                break
+        return mask
+    return node
+
+
+def _negate(child: _Node) -> _Node:
+    def node(df: pd.DataFrame) -> _Mask:
+        mask = child(df)
+        if mask is None:
+            return None
+        return np.logical_not(mask, out=mask)
+    return node
@@ -0,0 +1,346 @@
+"""Columnar (Parquet) DataFrame cache for Villa Ecommerce SDK."""
+
+import io
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Iterator, List, Optional
+import pandas as pd
+from villa_ecommerce_sdk.cache import CacheEntry, STORED_AT_METADATA, TTL_METADATA, _parse_float
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without the parquet extra
+    pa = None
+    pq = None
+
+
+class ParquetFrameCache:
+    """
+    Cache normalized DataFrames as Parquet on local disk and/or in S3.
+
+    A hit loads typed columns straight from Parquet, skipping JSON parsing
+    and row-dict construction. Only the requested columns are read. Entry
+    freshness (store time and TTL) lives in the Parquet schema metadata, so
+    it is checked from the file footer before any column data is decoded.
+
+    Lookups try the local directory first, then S3; S3 hits are written
+    through to disk.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        bucket_name: Optional[str] = None,
+        prefix: str = "villa-sdk/frames",
+        compression: str = "zstd"
+    ):
+        """
+        Initialize Parquet frame cache.
+
+        Args:
+            directory: Optional local directory for Parquet files
+            bucket_name: Optional S3 bucket for Parquet objects
+            prefix: Prefix for S3 keys (default: "villa-sdk/frames")
+            compression: Parquet compression codec (default: "zstd")
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            ValueError: If neither directory nor bucket_name is given
+        """
+        if pq is None:
+            raise ImportError(
+                "The Parquet frame cache requires pyarrow. Install it with: "
+                "pip install 'villa-ecommerce-sdk[parquet]'"
+            )
+        if directory is None and bucket_name is None:
+            raise ValueError("ParquetFrameCache needs a directory, a bucket_name, or both")
+        self.directory = directory
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.compression = compression
+        self._s3_client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def s3_client(self) -> Any:
+        """boto3 S3 client (None without a bucket), created on first use."""
+        if self.bucket_name is None:
+            return None
+        if self._s3_client is None:
+            with self._client_lock:
+                if self._s3_client is None:
+                    import boto3
+                    self._s3_client = boto3.client('s3')
+        return self._s3_client
+
+    def _get_path(self, key: str) -> str:
+        """Generate the local file path for a key."""
+        return os.path.join(self.directory, *key.split('/'))
+
+    def _get_s3_key(self, key: str) -> str:
+        """Generate full S3 key with prefix."""
+        return f"{self.prefix}/{key}"
+
+    def get_frame(
+        self,
+        key: str,
+        columns: Optional[List[str]] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a fresh cached DataFrame.
+
+        Args:
+            key: Cache key (e.g., "products/1000.parquet")
+            columns: Optional columns to load; unknown columns are ignored
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            DataFrame (with the entry's store time in
+            attrs[STORED_AT_METADATA]), or None if not found, expired or
+            error occurs
+        """
+        parquet_file = self._open_fresh(key, max_age)
+        if parquet_file is None:
+            return None
+        try:
+            frame = parquet_file.read(
+                columns=_known_columns(parquet_file, columns),
+                use_pandas_metadata=True
+            ).to_pandas()
+        except Exception:
+            return None
+        frame.attrs[STORED_AT_METADATA] = _stored_entry(parquet_file).stored_at
+        return frame
+
+    def iter_frames(
+        self,
+        key: str,
+        chunk_size: int,
+        columns: Optional[List[str]] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[Iterator[pd.DataFrame]]:
+        """
+        Read a fresh cached DataFrame in fixed-size chunks.
+
+        Row batches are decoded one at a time, so only one chunk of rows is
+        materialized as pandas objects at once.
+
+        Args:
+            key: Cache key (e.g., "products/1000.parquet")
+            chunk_size: Rows per chunk (the last chunk may be shorter)
+            columns: Optional columns to load; unknown columns are ignored
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Iterator of DataFrames, or None if not found, expired or error occurs
+        """
+        parquet_file = self._open_fresh(key, max_age)
+        if parquet_file is None:
+            return None
+        return _rebatch(
+            parquet_file.iter_batches(
+                batch_size=chunk_size,
+                columns=_known_columns(parquet_file, columns),
+                use_pandas_metadata=True
+            ),
+            chunk_size
+        )
+
+    def _open_fresh(self, key: str, max_age: Optional[float]) -> Optional["pq.ParquetFile"]:
+        """Open the cached Parquet file for a key if its metadata says it is fresh."""
+        if self.directory is not None:
+            try:
+                path = self._get_path(key)
+                if os.path.exists(path):
+                    parquet_file = pq.ParquetFile(path, memory_map=True)
+                    if _is_fresh(parquet_file, max_age):
+                        return parquet_file
+            except Exception:
+                # Corrupt or unreadable file - fall through to S3 / refetch
+                pass
+
+        if self.s3_client is not None:
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=self._get_s3_key(key)
+                )
+                payload = response['Body'].read()
+                parquet_file = pq.ParquetFile(io.BytesIO(payload))
+                if not _is_fresh(parquet_file, max_age):
+                    return None
+                if self.directory is not None:
+                    self._write_file(key, payload)
+                return parquet_file
+            except Exception:
+                # Missing object or any other error - allow fallback
+                return None
+        return None
+
+    def set_frame(
+        self,
+        key: str,
+        frame: pd.DataFrame,
+        ttl: Optional[float] = None,
+        stored_at: Optional[float] = None
+    ) -> None:
+        """
+        Store a DataFrame as Parquet.
+
+        Args:
+            key: Cache key (e.g., "products/1000.parquet")
+            frame: DataFrame to cache
+            ttl: Optional time-to-live in seconds (default: never expires)
+            stored_at: Time the data was fetched, when the frame is built from
+                       an earlier cached response (default: now)
+        """
+        try:
+            payload = self._encode(frame, ttl, stored_at)
+        except Exception:
+            # Columns Arrow cannot type (e.g. mixed objects) - skip caching
+            return
+
+        if self.directory is not None:
+            try:
+                self._write_file(key, payload)
+            except Exception:
+                pass
+
+        if self.s3_client is not None:
+            try:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=self._get_s3_key(key),
+                    Body=payload,
+                    ContentType='application/vnd.apache.parquet'
+                )
+            except Exception:
+                # Log error but don't fail - caching is optional
+                pass
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a cached DataFrame from disk and S3.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        if self.directory is not None:
+            try:
+                os.remove(self._get_path(key))
+            except OSError:
+                pass
+        if self.s3_client is not None:
+            try:
+                self.s3_client.delete_object(
+                    Bucket=self.bucket_name,
+                    Key=self._get_s3_key(key)
+                )
+            except Exception:
+                pass
+
+    def _encode(
+        self,
+        frame: pd.DataFrame,
+        ttl: Optional[float],
+        stored_at: Optional[float] = None
+    ) -> bytes:
+        """Serialize a DataFrame to Parquet bytes with freshness metadata."""
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        if stored_at is None:
+            stored_at = time.time()
+        metadata[STORED_AT_METADATA.encode()] = repr(stored_at).encode()
+        if ttl is not None:
+            metadata[TTL_METADATA.encode()] = repr(float(ttl)).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        sink = io.BytesIO()
+        pq.write_table(table, sink, compression=self.compression)
+        return sink.getvalue()
+
+    def _write_file(self, key: str, payload: bytes) -> None:
+        """Atomically write a Parquet payload to the local directory."""
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def frame_key(cache_key: str) -> str:
+    """
+    Derive the frame cache key for a JSON cache key.
+
+    Args:
+        cache_key: JSON cache key (e.g., "products/1000.json")
+
+    Returns:
+        Frame cache key (e.g., "products/1000.parquet")
+    """
+    base, _, ext = cache_key.rpartition('.')
+    return f"{base if base else ext}.parquet"
+
+
+def _stored_entry(parquet_file: "pq.ParquetFile") -> CacheEntry:
+    """Read the file's freshness metadata without reading any column data."""
+    schema = parquet_file.schema_arrow
+    metadata = {k.decode(): v.decode() for k, v in (schema.metadata or {}).items()}
+    return CacheEntry(
+        data=None,
+        stored_at=_parse_float(metadata.get(STORED_AT_METADATA)),
+        ttl=_parse_float(metadata.get(TTL_METADATA))
+    )
+
+
+def _is_fresh(parquet_file: "pq.ParquetFile", max_age: Optional[float]) -> bool:
+    """Check the file's freshness metadata without reading any column data."""
+    return _stored_entry(parquet_file).is_fresh(max_age=max_age)
+
+
+def _known_columns(
+    parquet_file: "pq.ParquetFile",
+    columns: Optional[List[str]]
+) -> Optional[List[str]]:
+    """Drop requested columns the file does not have."""
+    if columns is None:
+        return None
+    names = parquet_file.schema_arrow.names
+    return [c for c in columns if c in names]
+
+
+def _rebatch(batches: Iterator["pa.RecordBatch"], size: int) -> Iterator[pd.DataFrame]:
+    """Regroup Arrow record batches (which end at row group boundaries) into size-row DataFrames."""
+    pending: List["pa.RecordBatch"] = []
+    rows = 0
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, size).to_pandas()
+            rest = table.slice(size)
+            pending = rest.to_batches()
+            rows = rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending).to_pandas()
+
+
+def __getattr__(name: str) -> Any:
+    """Import boto3 lazily while keeping it reachable as a module attribute."""
+    if name == 'boto3':
+        import boto3
+        return boto3
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,188 @@
+"""DataFrame helpers shared by the Villa Ecommerce SDK clients."""
+
+import warnings
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from villa_ecommerce_sdk.filters import Filter
+
+# A join column shared by both frames, or (products column, inventory column)
+JoinKey = Union[str, Tuple[str, str]]
+
+# Columns tried, in order, when no join key is configured
+DEFAULT_JOIN_KEYS = ('product_id', 'id', 'sku', 'productId')
+
+_PANDAS_MAJOR = int(pd.__version__.split('.')[0])
+
+
+def resolve_join_key(
+    products_df: pd.DataFrame,
+    inventory_df: pd.DataFrame,
+    join_key: Optional[JoinKey] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    Determine the product and inventory columns to join on.
+
+    Args:
+        products_df: Products DataFrame
+        inventory_df: Inventory DataFrame
+        join_key: Optional explicit join column, or (products column,
+                  inventory column) when the names differ
+
+    Returns:
+        (products column, inventory column), or None if no default key
+        column is present in both frames
+
+    Raises:
+        ValueError: If an explicit join column is missing from either frame
+    """
+    if join_key is not None:
+        product_column, inventory_column = (
+            (join_key, join_key) if isinstance(join_key, str) else join_key
+        )
+        if product_column not in products_df.columns:
+            raise ValueError(f"Join column {product_column!r} not found in products")
+        if inventory_column not in inventory_df.columns:
+            raise ValueError(f"Join column {inventory_column!r} not found in inventory")
+        return product_column, inventory_column
+
+    for key in DEFAULT_JOIN_KEYS:
+        if key in products_df.columns and key in inventory_df.columns:
+            return key, key
+    return None
+
+
+def _indexed(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Move a key column into a sorted index."""
+    indexed = df.set_index(column)
+    if not indexed.index.is_monotonic_increasing:
+        indexed = indexed.sort_index(kind='stable')
+    return indexed
+
+
+def _comparable_keys(left: pd.Series, right: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Cast join keys to strings when one side is numeric and the other is not."""
+    left_numeric = pd.api.types.is_numeric_dtype(left.dtype)
+    right_numeric = pd.api.types.is_numeric_dtype(right.dtype)
+    if left_numeric == right_numeric:
+        return left, right
+    return left.astype("string"), right.astype("string")
+
+
+def merge_dataframes(
+    products_df: pd.DataFrame,
+    inventory_df: pd.DataFrame,
+    join_key: Optional[JoinKey] = None,
+    how: str = 'outer'
+) -> pd.DataFrame:
+    """
+    Merge product and inventory dataframes.
+
+    Both frames are indexed on the join key and sorted, then joined on the
+    index, which lets pandas use a merge join over the sorted keys instead
+    of hashing an unindexed column. Overlapping columns get "_product" and
+    "_inventory" suffixes. When the key columns are named differently, the
+    result keeps the products column (an unrelated inventory column of the
+    same name becomes "<name>_inventory").
+
+    Without a configured join key the first of DEFAULT_JOIN_KEYS present in
+    both frames is used. If there is none, frames of equal length are
+    concatenated side by side and otherwise only the products are returned;
+    both fallbacks emit a warning.
+
+    Args:
+        products_df: Products DataFrame
+        inventory_df: Inventory DataFrame
+        join_key: Optional explicit join column, or (products column,
+                  inventory column) when the names differ
+        how: Join type, e.g. "outer", "left" or "inner" (default: "outer")
+
+    Returns:
+        Merged DataFrame
+
+    Raises:
+        ValueError: If an explicit join column is missing from either frame
+    """
+    columns = resolve_join_key(products_df, inventory_df, join_key)
+    if columns is None:
+        if len(products_df) == len(inventory_df):
+            warnings.warn(
+                "No join key shared by products and inventory; concatenating by position",
+                stacklevel=2
+            )
+            return pd.concat([products_df, inventory_df], axis=1)
+        warnings.warn(
+            "No join key shared by products and inventory; inventory columns dropped",
+            stacklevel=2
+        )
+        return products_df.copy()
+
+    product_column, inventory_column = columns
+    left_key, right_key = _comparable_keys(
+        products_df[product_column], inventory_df[inventory_column]
+    )
+    left = _indexed(products_df.assign(**{product_column: left_key}), product_column)
+    right = _indexed(inventory_df.assign(**{inventory_column: right_key}), inventory_column)
+    if product_column in right.columns:
+        right = right.rename(columns={product_column: f"{product_column}_inventory"})
+    right.index.name = product_column
+
+    merged = left.join(right, how=how, lsuffix='_product', rsuffix='_inventory').reset_index()
+    # Keep the key where it was in the products frame, as pd.merge does
+    order = list(merged.columns[1:])
+    order.insert(products_df.columns.get_loc(product_column), product_column)
+    return merged[order]
+
+
+def _copy_on_write() -> bool:
+    """Check whether pandas copies shared column data on write."""
+    if _PANDAS_MAJOR >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except KeyError:
+        # pandas < 2.0 has no copy-on-write mode
+        return False
+
+
+def copy_shared(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a DataFrame that is shared through a cache before handing it out.
+
+    Under copy-on-write the copy is shallow, so no column data is
+    duplicated until the caller modifies it; otherwise it is a deep copy.
+
+    Args:
+        df: Shared DataFrame
+
+    Returns:
+        DataFrame the caller may modify without affecting df
+    """
+    return df.copy(deep=not _copy_on_write())
+
+
+def filter_dataframe(df: pd.DataFrame, filters: Union[Dict[str, Any], "Filter"]) -> pd.DataFrame:
+    """
+    Filter DataFrame based on provided criteria.
+
+    All criteria are combined into one boolean mask that is evaluated in a
+    single vectorized pass; the frame is sliced once, at the end.
+
+    Args:
+        df: DataFrame to filter
+        filters: Dictionary where keys are column names and values are filter criteria,
+                or a precompiled Filter. Supports:
+                - Exact match: {"column": "value"}
+                - Boolean: {"column": True}
+                - Operators, all applied: {"column": {"gt": 100, "lte": 500}}
+                  (eq, ne, gt, gte, lt, lte, between, in, nin, contains,
+                  icontains, isnull)
+                - Multiple values (OR condition): {"column": ["value1", "value2"]}
+                - Combinators: {"$or": [...]}, {"$and": [...]}, {"$not": {...}}
+
+    Returns:
+        Filtered DataFrame (a new frame)
+    """
+    from villa_ecommerce_sdk.filters import compile_filter
+    return compile_filter(filters).apply(df)
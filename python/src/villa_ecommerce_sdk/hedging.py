@@ -0,0 +1,244 @@
+"""Hedged requests for Villa Ecommerce SDK."""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+@dataclass
+class HedgingStats:
+    """Counters for a Hedger."""
+
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that sent a hedge."""
+        if not self.requests:
+            return 0.0
+        return self.hedges / self.requests
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that answered before the original request."""
+        if not self.hedges:
+            return 0.0
+        return self.hedge_wins / self.hedges
+
+
+class Hedger:
+    """
+    Send a backup copy of a slow idempotent request and use the first answer.
+
+    The hedge delay is the given percentile of recently observed latencies
+    for the same route (initial_delay until min_samples are collected), so
+    only requests slower than e.g. the p95 are duplicated. Latency is timed
+    from when an attempt starts running, and only successful answers are
+    sampled. Extra load is capped by a token budget: the bucket starts
+    full, every request earns `budget` tokens (up to max_tokens) and every
+    hedge spends one, so hedges stay below roughly budget x requests plus
+    one burst of max_tokens. The losing attempt is left to finish in the
+    background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        budget: float = 0.05,
+        max_tokens: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 16
+    ):
+        """
+        Initialize hedger.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent (default: 95)
+            initial_delay: Hedge delay in seconds before enough samples exist
+                           (default: 0.5)
+            min_delay: Lower bound for the hedge delay in seconds (default: 0.01)
+            max_delay: Upper bound for the hedge delay in seconds (default: 5)
+            budget: Hedge tokens earned per request, i.e. the long-run maximum
+                    fraction of extra requests (default: 0.05)
+            max_tokens: Maximum saved tokens, bounding hedge bursts; the bucket
+                        starts full (default: 10)
+            window: Latency samples kept per route (default: 200)
+            min_samples: Samples needed before the percentile is used (default: 20)
+            max_workers: Threads running hedged attempts (default: 16)
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = max_tokens
+        self._stats = HedgingStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def delay(self, key: str) -> float:
+        """
+        Get the current hedge delay for a route.
+
+        Args:
+            key: Route key (see resilience.endpoint_route)
+
+        Returns:
+            Seconds to wait for the first attempt before hedging
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(samples)
+                index = max(math.ceil(self.percentile / 100.0 * len(ordered)) - 1, 0)
+                delay = ordered[index]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def run(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        is_failure: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Run fn, hedging it with a second call if it is slow.
+
+        Args:
+            key: Route key whose latency history sets the hedge delay
+            fn: Zero-argument idempotent callable
+            is_failure: Optional predicate marking a returned result as a failed
+                        answer (e.g. a 5xx response); such results are treated
+                        like exceptions and never sampled as latency
+
+        Returns:
+            The result of whichever attempt succeeds first, else the first
+            attempt's result
+
+        Raises:
+            Exception: The first attempt's exception if every attempt fails
+        """
+        with self._lock:
+            self._stats.requests += 1
+            self._tokens = min(self._tokens + self.budget, self.max_tokens)
+
+        executor = self._get_executor()
+        primary = self._submit(executor, key, fn, is_failure)
+        done, _ = wait([primary], timeout=self.delay(key))
+        if done or not self._take_token():
+            return primary.result()
+
+        hedge = self._submit(executor, key, fn, is_failure)
+        done, pending = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        # Prefer a successful answer; only fail once both attempts have failed
+        winner = _first_success(primary, hedge, done, is_failure)
+        if winner is None and pending:
+            winner = _first_success(primary, hedge, wait(pending).done | done, is_failure)
+        if winner is None:
+            return primary.result()
+        if winner is hedge:
+            with self._lock:
+                self._stats.hedge_wins += 1
+        return winner.result()
+
+    def stats(self) -> HedgingStats:
+        """
+        Get request/hedge/win counters.
+
+        Returns:
+            HedgingStats snapshot
+        """
+        with self._lock:
+            return HedgingStats(
+                requests=self._stats.requests,
+                hedges=self._stats.hedges,
+                hedge_wins=self._stats.hedge_wins,
+                budget_denied=self._stats.budget_denied
+            )
+
+    def close(self) -> None:
+        """Shut down the worker threads without waiting for losing attempts."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="villa-hedge"
+                )
+            return self._executor
+
+    def _take_token(self) -> bool:
+        """Spend one hedge token if the budget allows it."""
+        with self._lock:
+            if self._tokens < 1.0:
+                self._stats.budget_denied += 1
+                return False
+            self._tokens -= 1.0
+            self._stats.hedges += 1
+            return True
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        key: str,
+        fn: Callable[[], Any],
+        is_failure: Optional[Callable[[Any], bool]]
+    ) -> Future:
+        """Start an attempt and record its latency when it succeeds."""
+        def attempt() -> Any:
+            # Timed from the send, not from submit: time queued for a worker
+            # says nothing about the route
+            started = time.monotonic()
+            result = fn()
+            if is_failure is None or not is_failure(result):
+                self._record(key, time.monotonic() - started)
+            return result
+
+        return executor.submit(attempt)
+
+    def _record(self, key: str, latency: float) -> None:
+        """Add a latency sample for a route."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+
+def _first_success(
+    primary: Future,
+    hedge: Future,
+    done: Any,
+    is_failure: Optional[Callable[[Any], bool]] = None
+) -> Optional[Future]:
+    """Pick the completed attempt that succeeded, preferring the primary."""
+    for future in (primary, hedge):
+        if future not in done or future.exception() is not None:
+            continue
+        if is_failure is None or not is_failure(future.result()):
+            return future
+    return None
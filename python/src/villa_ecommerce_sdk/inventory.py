@@ -1,52 +1,97 @@
 """Inventory functionality for Villa Ecommerce SDK."""
 
+from typing import Any, Dict, Iterator, List, Optional, Union
 import pandas as pd
 from villa_ecommerce_sdk.base import BaseService
+from villa_ecommerce_sdk.schema import INVENTORY_SCHEMA
 
 
 class InventoryService(BaseService):
     """Service for fetching inventory data."""
     
+    # Stock levels move quickly; keep cached inventory for five minutes
+    default_cache_ttl = 300.0
+    
+    # Categorical, nullable-integer, compact-float and datetime columns
+    schema = INVENTORY_SCHEMA
+    
     def get_service_name(self) -> str:
         """Get service name."""
         return "InventoryService"
     
-    def get_inventory(self, branch: int = 1000) -> pd.DataFrame:
+    def get_inventory(
+        self,
+        branch: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Get inventory data for a specific branch.
         
         Args:
             branch: Branch ID (default: 1000)
+            columns: Optional columns to return (read directly from the frame
+                     cache when one is configured)
             
         Returns:
             DataFrame containing inventory data
         """
-        cache_key = f"inventory/{branch}.json"
+        return self._get_frame(
+            endpoint=f"/api/inventory2/{branch}",
+            cache_key=f"inventory/{branch}.json",
+            list_key='inventory',
+            columns=columns
+        )
+    
+    def stream_inventory(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream inventory data for a branch as DataFrame chunks.
+        
+        Records are parsed incrementally from the response, so branches with
+        very large catalogues are processed in bounded memory. The response
+        cache is bypassed.
         
-        # Fetch from API using base service
-        data = self._get(
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Maximum rows per DataFrame (default: 10000)
+            
+        Yields:
+            DataFrames of at most chunk_size rows
+        """
+        return self._stream_frames(
             endpoint=f"/api/inventory2/{branch}",
-            cache_key=cache_key
+            list_key='inventory',
+            chunk_size=chunk_size
         )
+    
+    def iter_inventory(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 1000,
+        as_records: bool = False
+    ) -> Iterator[Union[pd.DataFrame, List[Dict[str, Any]]]]:
+        """
+        Iterate over inventory data for a branch in fixed-size chunks.
         
-        # Process response data
-        if isinstance(data, dict):
-            # If data is a dict, try to find the list of inventory items
-            # Common patterns: data['inventory'], data['data'], data['items'], or data itself
-            if 'inventory' in data:
-                inventory_list = data['inventory']
-            elif 'data' in data:
-                inventory_list = data['data']
-            elif 'items' in data:
-                inventory_list = data['items']
-            else:
-                # If data is already a list or dict, use it directly
-                inventory_list = data if isinstance(data, list) else [data]
-        elif isinstance(data, list):
-            inventory_list = data
-        else:
-            inventory_list = [data]
+        Chunks come from the frame cache, a fresh cached response or the
+        streamed network response, whichever is available first, and are
+        yielded before the whole list is materialized.
         
-        # Convert to DataFrame
-        return pd.DataFrame(inventory_list)
-
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Rows per chunk (default: 1000)
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Yields:
+            DataFrames (or lists of dicts) of at most chunk_size rows
+        """
+        return self._iter_chunks(
+            endpoint=f"/api/inventory2/{branch}",
+            cache_key=f"inventory/{branch}.json",
+            list_key='inventory',
+            chunk_size=chunk_size,
+            as_records=as_records
+        )
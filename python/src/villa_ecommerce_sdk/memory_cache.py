@@ -0,0 +1,240 @@
+"""In-process LRU cache tier for Villa Ecommerce SDK."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from villa_ecommerce_sdk.cache import CacheEntry
+
+
+# Default per-key-prefix TTLs in seconds; the longest matching prefix wins.
+DEFAULT_PREFIX_TTLS: Dict[str, float] = {
+    "inventory/": 60.0,
+    "products/": 900.0,
+    "payment-methods/": 900.0,
+}
+
+
+@dataclass
+class MemoryCacheStats:
+    """Counters for a MemoryCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from memory."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryCache:
+    """
+    Bounded in-memory LRU cache with per-key-prefix TTLs.
+
+    The prefix TTL bounds how long an entry stays in memory; the entry's own
+    TTL (set by the writer) still decides whether its data is fresh.
+    Values are stored by reference; callers must not mutate returned data.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = 300.0,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction (default: 1024)
+            default_ttl: TTL in seconds for keys matching no prefix; None never expires
+                         (default: 300)
+            ttls: Per-key-prefix TTLs in seconds (default: DEFAULT_PREFIX_TTLS)
+            clock: Monotonic time source (default: time.monotonic)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_PREFIX_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[CacheEntry, Optional[float]]]" = OrderedDict()
+        self._stats = MemoryCacheStats()
+
+    def ttl_for(self, key: str) -> Optional[float]:
+        """
+        Resolve the TTL for a key from the longest matching prefix.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            TTL in seconds, or None if the entry never expires
+        """
+        best = None
+        for prefix in self.ttls:
+            if key.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.ttls[best] if best is not None else self.default_ttl
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """Find an entry that has not expired from memory; caller holds the lock."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        entry, expires_at = item
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[key]
+            self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry, even if its data is past its TTL.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+
+        Returns:
+            CacheEntry, or None if missing or evicted from memory
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+            return entry
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Retrieve several entries under a single lock acquisition.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key to CacheEntry for the keys found (missing keys are omitted)
+        """
+        entries = {}
+        with self._lock:
+            for key in keys:
+                entry = self._lookup(key)
+                if entry is None:
+                    self._stats.misses += 1
+                else:
+                    self._stats.hits += 1
+                    entries[key] = entry
+        return entries
+
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve fresh cached data.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Cached data, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or not entry.is_fresh(max_age=max_age):
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            return entry.data
+
+    def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store data in memory.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            data: Data to cache
+            ttl: Optional time-to-live of the data in seconds
+        """
+        self.set_entry(key, CacheEntry(data=data, stored_at=time.time(), ttl=ttl))
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a cache entry in memory.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry to store
+        """
+        ttl = self.ttl_for(key)
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (entry, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Refresh an entry's freshness after a successful revalidation.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry carrying the new store time and validators
+        """
+        self.set_entry(key, entry)
+
+    def is_cached(self, key: str) -> bool:
+        """
+        Check if an unexpired key exists in memory.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            return item is not None and (item[1] is None or self._clock() < item[1])
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove cached data.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> MemoryCacheStats:
+        """
+        Get hit/miss/eviction counters.
+
+        Returns:
+            MemoryCacheStats snapshot
+        """
+        with self._lock:
+            return MemoryCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=len(self._entries)
+            )
@@ -0,0 +1,127 @@
+"""Paginated record fetching with concurrent page prefetch for Villa Ecommerce SDK."""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+from villa_ecommerce_sdk.base import extract_records
+
+# Response fields naming the cursor of the next page
+CURSOR_KEYS = ('nextCursor', 'next_cursor', 'cursor')
+
+# Response fields flagging whether more pages follow
+HAS_MORE_KEYS = ('hasMore', 'has_more')
+
+# Response fields holding the total number of records
+TOTAL_KEYS = ('total', 'totalCount', 'total_count')
+
+
+def _field(page: Any, keys: tuple) -> Any:
+    """Return the first of keys present in a page response."""
+    if isinstance(page, dict):
+        for key in keys:
+            if page.get(key) is not None:
+                return page[key]
+    return None
+
+
+def _records(page: Any, list_key: str) -> List[Any]:
+    """Extract a page's records as a list."""
+    records = extract_records(page, list_key)
+    return records if isinstance(records, list) else [records]
+
+
+def iter_pages(
+    fetch: Callable[[Dict[str, Any]], Any],
+    list_key: str,
+    page_size: int = 100,
+    prefetch: int = 4,
+    max_records: Optional[int] = None,
+    limit_param: str = "limit",
+    offset_param: str = "offset",
+    cursor_param: str = "cursor"
+) -> Iterator[List[Any]]:
+    """
+    Walk a paginated endpoint, fetching upcoming pages concurrently.
+
+    The first page is requested with an offset of 0. If its response names
+    a next cursor, pages are followed by cursor: each next page is
+    requested as soon as the previous response arrives, before its records
+    are yielded. Otherwise pages are addressed by offset, and up to
+    prefetch pages are kept in flight ahead of the consumer. Pages are
+    always yielded in order.
+
+    Iteration stops at a short or empty page, when hasMore is false, when
+    the reported total is reached, or after max_records records. In offset
+    mode, up to prefetch requests past the end may already be in flight;
+    their results are discarded.
+
+    Args:
+        fetch: Callable taking the page query parameters and returning the
+               decoded page response
+        list_key: Preferred response key holding the records
+        page_size: Records requested per page (default: 100)
+        prefetch: Maximum pages in flight at once (default: 4)
+        max_records: Optional maximum number of records to yield
+        limit_param: Query parameter carrying the page size (default: "limit")
+        offset_param: Query parameter carrying the offset (default: "offset")
+        cursor_param: Query parameter carrying the cursor (default: "cursor")
+
+    Yields:
+        Lists of records, one per page
+
+    Raises:
+        ValueError: If page_size or prefetch is less than 1
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+
+    remaining = max_records
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: Deque["Future[Any]"] = deque()
+
+    def submit(params: Dict[str, Any]) -> None:
+        nonlocal executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="villa-pages")
+        pending.append(executor.submit(fetch, params))
+
+    response = fetch({limit_param: page_size, offset_param: 0})
+    cursor = _field(response, CURSOR_KEYS)
+    by_cursor = cursor is not None
+    total = _field(response, TOTAL_KEYS)
+    end = total if isinstance(total, int) and not isinstance(total, bool) else None
+    offset = page_size
+    try:
+        while True:
+            records = _records(response, list_key)
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            more = bool(records) and _field(response, HAS_MORE_KEYS) is not False
+            if remaining is not None and remaining <= 0:
+                more = False
+            # Queue upcoming requests before handing this page to the consumer
+            if more and by_cursor:
+                cursor = _field(response, CURSOR_KEYS)
+                if cursor is None:
+                    more = False
+                else:
+                    submit({limit_param: page_size, cursor_param: cursor})
+            elif more:
+                # A short page is the last one
+                more = len(records) >= page_size
+                while more and len(pending) < prefetch and (end is None or offset < end):
+                    submit({limit_param: page_size, offset_param: offset})
+                    offset += page_size
+            if records:
+                yield records
+            if not more or not pending:
+                return
+            response = pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,13 +1,72 @@
 """Payment functionality for Villa Ecommerce SDK."""
 
-from typing import Optional, Dict, Any, List
-import pandas as pd
-from villa_ecommerce_sdk.base import BaseService
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, Callable, Collection, Iterable, Iterator, List, Union
+)
+from villa_ecommerce_sdk.base import BaseService, extract_records
+from villa_ecommerce_sdk.cache import get_entries
+from villa_ecommerce_sdk.resilience import IDEMPOTENCY_KEY_HEADER
+from villa_ecommerce_sdk.status import (
+    TERMINAL_PAYMENT_STATUSES,
+    TERMINAL_REFUND_STATUSES,
+    StatusTTL,
+    extract_status,
+    wait_for_statuses
+)
+from villa_ecommerce_sdk.submissions import SubmissionResult, submit_many
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is only needed for payment history
+    import pandas as pd
+
+
+def extract_payment_methods(data: Any) -> List[Dict[str, Any]]:
+    """
+    Locate the list of payment methods in an API response.
+    
+    Args:
+        data: Decoded response payload
+        
+    Returns:
+        List of payment methods
+    """
+    if isinstance(data, dict):
+        if 'methods' in data:
+            return data['methods']
+        elif 'data' in data:
+            return data['data'] if isinstance(data['data'], list) else [data['data']]
+        else:
+            return [data] if not isinstance(data, list) else data
+    elif isinstance(data, list):
+        return data
+    else:
+        return [data]
+
+
+def _status_record(data: Any) -> Dict[str, Any]:
+    """Unwrap a status response into one flat record."""
+    if isinstance(data, dict):
+        if isinstance(data.get('data'), dict):
+            return data['data']
+        return data
+    return {}
 
 
 class PaymentService(BaseService):
     """Service for handling payment operations."""
     
+    # TTL in seconds for cached payment method lists
+    payment_methods_cache_ttl = 3600.0
+    
+    # TTL in seconds for cached payment history queries
+    payment_history_cache_ttl = 60.0
+    
+    # Status TTL policies: terminal states are cached for a day, others for 5 seconds
+    payment_status_cache_ttl = StatusTTL(TERMINAL_PAYMENT_STATUSES)
+    refund_status_cache_ttl = StatusTTL(TERMINAL_REFUND_STATUSES)
+    
     def get_service_name(self) -> str:
         """Get service name."""
         return "PaymentService"
@@ -19,7 +78,8 @@ class PaymentService(BaseService):
         currency: str = "THB",
         payment_method: str = "credit_card",
         customer_info: Optional[Dict[str, Any]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create a new payment for an order.
@@ -31,6 +91,9 @@ class PaymentService(BaseService):
             payment_method: Payment method (credit_card, bank_transfer, etc.)
             customer_info: Optional customer information
             metadata: Optional additional metadata
+            idempotency_key: Optional Idempotency-Key header value; repeating a
+                             request with the same key never charges twice, and
+                             lets the retry policy retry it safely
             
         Returns:
             Payment response data
@@ -51,15 +114,48 @@ class PaymentService(BaseService):
         return self._post(
             endpoint="/api/payment/create",
             json_data=payload,
-            headers={"Content-Type": "application/json"}
+            headers=self._json_headers(idempotency_key)
         )
     
-    def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+    def create_payments(
+        self,
+        payments: Iterable[Dict[str, Any]],
+        journal: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_workers: int = 8
+    ) -> SubmissionResult:
+        """
+        Create many payments with idempotency keys and bounded concurrency.
+        
+        Each item holds create_payment arguments, e.g. {"order_id": "O1",
+        "amount": 250.0}, and may set its own "idempotency_key". With a
+        journal, outcomes are appended to a JSON Lines file as they arrive;
+        calling again with the same items and journal after a crash skips
+        completed payments and re-sends the rest under the same keys (see
+        villa_ecommerce_sdk.submissions).
+        
+        Args:
+            payments: create_payment keyword arguments, one dict per payment
+            journal: Optional journal file path for resumable runs
+            max_workers: Maximum requests in flight at once (default: 8)
+            
+        Returns:
+            SubmissionResult keyed by idempotency key (keys lists them in input order)
+        """
+        return submit_many(
+            lambda item, key: self.create_payment(**item, idempotency_key=key),
+            payments, operation='create_payment', journal=journal, max_workers=max_workers
+        )
+    
+    def get_payment_status(self, payment_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get payment status by payment ID.
         
+        Terminal statuses (completed, failed, refunded, ...) are cached for
+        a day; in-progress statuses only briefly (see payment_status_cache_ttl).
+        
         Args:
             payment_id: Payment identifier
+            refresh: Bypass the cache and ask the API (default: False)
             
         Returns:
             Payment status data
@@ -67,70 +163,285 @@ class PaymentService(BaseService):
         cache_key = f"payments/{payment_id}.json"
         return self._get(
             endpoint=f"/api/payment/status/{payment_id}",
-            cache_key=cache_key
+            cache_key=cache_key,
+            cache_ttl=self.payment_status_cache_ttl,
+            refresh=refresh
         )
     
+    def get_payment_statuses(
+        self,
+        payment_ids: Iterable[str],
+        max_workers: int = 16
+    ) -> "pd.DataFrame":
+        """
+        Get the status of many payments.
+        
+        IDs are de-duplicated. Cached terminal statuses are read with one
+        batched cache lookup (see villa_ecommerce_sdk.cache.get_entries);
+        the other IDs are fetched from the API on at most max_workers
+        threads, and their results are cached. A failing ID does not abort
+        the batch: its row holds only the error.
+        
+        Args:
+            payment_ids: Payment identifiers
+            max_workers: Maximum concurrent API requests (default: 16)
+            
+        Returns:
+            DataFrame indexed by payment_id, in first-seen order, with one
+            column per status field and an error column (None on success)
+        """
+        return self._get_statuses(
+            payment_ids, 'payment_id', self.get_payment_status,
+            lambda payment_id: f"payments/{payment_id}.json",
+            self.payment_status_cache_ttl, max_workers
+        )
+    
+    def _get_statuses(
+        self,
+        ids: Iterable[str],
+        index_name: str,
+        get_status: Callable[..., Dict[str, Any]],
+        cache_key: Callable[[str], str],
+        policy: StatusTTL,
+        max_workers: int
+    ) -> "pd.DataFrame":
+        """Look up many status resources: batched cache read, then bounded concurrent fetches."""
+        import pandas as pd
+        
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        unique = list(dict.fromkeys(ids))
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        
+        if self.cache and unique:
+            keys = {item_id: cache_key(item_id) for item_id in unique}
+            entries = get_entries(self.cache, keys.values())
+            for item_id, key in keys.items():
+                entry = entries.get(key)
+                if entry is None or not policy.is_terminal(entry.data):
+                    continue
+                if replace(entry, ttl=policy(entry.data)).is_fresh():
+                    results[item_id] = entry.data
+        
+        missing = [item_id for item_id in unique if item_id not in results]
+        if missing:
+            # The cache was just consulted; go straight to the API and write through
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(missing)), thread_name_prefix="villa-status"
+            ) as executor:
+                futures = {
+                    item_id: executor.submit(get_status, item_id, refresh=True)
+                    for item_id in missing
+                }
+            for item_id, future in futures.items():
+                error = future.exception()
+                if error is not None:
+                    errors[item_id] = error
+                else:
+                    results[item_id] = future.result()
+        
+        frame = pd.DataFrame.from_records(
+            [_status_record(results.get(item_id)) for item_id in unique],
+            index=pd.Index(unique, name=index_name)
+        )
+        frame['error'] = [str(errors[i]) if i in errors else None for i in unique]
+        return frame
+    
+    def wait_for_payment_status(
+        self,
+        payment_ids: Union[str, Iterable[str]],
+        statuses: Optional[Collection[str]] = None,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: float = 15.0,
+        max_workers: int = 8
+    ) -> Any:
+        """
+        Poll payments until they reach a terminal (or given) status.
+        
+        All IDs share one scheduler: polls back off per payment from
+        initial_interval to max_interval and run on at most max_workers
+        threads (see villa_ecommerce_sdk.status.wait_for_statuses). Each
+        poll bypasses the cache and writes its result back to it.
+        
+        Args:
+            payment_ids: Payment ID, or IDs to wait for
+            statuses: Optional statuses to wait for in addition to the
+                      terminal ones (e.g. {"authorized"})
+            timeout: Seconds to wait in total (default: 300)
+            initial_interval: Seconds between the first polls (default: 0.5)
+            max_interval: Upper bound on the poll interval (default: 15)
+            max_workers: Maximum polls in flight at once (default: 8)
+            
+        Returns:
+            The last status data for a single ID, or a dict mapping each ID to
+            it; data that is still in progress means the wait timed out
+        """
+        return self._wait_for(
+            self.get_payment_status, self.payment_status_cache_ttl, payment_ids, statuses,
+            timeout=timeout, initial_interval=initial_interval,
+            max_interval=max_interval, max_workers=max_workers
+        )
+    
+    def _wait_for(
+        self,
+        get_status: Callable[..., Dict[str, Any]],
+        policy: StatusTTL,
+        ids: Union[str, Iterable[str]],
+        statuses: Optional[Collection[str]],
+        **options: Any
+    ) -> Any:
+        """Wait for status resources with the shared scheduler."""
+        targets = frozenset(s.lower() for s in statuses or ())
+        
+        def is_done(data: Any) -> bool:
+            return policy.is_terminal(data) or extract_status(data) in targets
+        
+        results = wait_for_statuses(
+            lambda item_id: get_status(item_id, refresh=True),
+            [ids] if isinstance(ids, str) else ids,
+            is_done,
+            **options
+        )
+        return results[ids] if isinstance(ids, str) else results
+    
     def get_payment_history(
         self,
         order_id: Optional[str] = None,
         customer_id: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 100
-    ) -> pd.DataFrame:
+        limit: int = 100,
+        all_pages: bool = False,
+        prefetch: int = 8
+    ) -> "pd.DataFrame":
         """
         Get payment history with optional filters.
         
+        Single-page results are cached for payment_history_cache_ttl seconds,
+        keyed by every filter and the limit.
+        
         Args:
             order_id: Optional order ID filter
             customer_id: Optional customer ID filter
             start_date: Optional start date (YYYY-MM-DD format)
             end_date: Optional end date (YYYY-MM-DD format)
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return, or the page size
+                   when all_pages is True
+            all_pages: Fetch every page of the history, prefetching pages
+                       concurrently (default: False)
+            prefetch: Maximum pages in flight when all_pages is True (default: 8)
             
         Returns:
             DataFrame containing payment history
         """
-        params = {"limit": limit}
+        import pandas as pd
         
-        if order_id:
-            params["orderId"] = order_id
-        if customer_id:
-            params["customerId"] = customer_id
-        if start_date:
-            params["startDate"] = start_date
-        if end_date:
-            params["endDate"] = end_date
+        if all_pages:
+            records: List[Any] = []
+            for page in self.iter_payment_history(
+                order_id=order_id,
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limit,
+                prefetch=prefetch,
+                as_records=True
+            ):
+                records.extend(page)
+            return pd.DataFrame(records)
+        
+        params = self._history_params(order_id, customer_id, start_date, end_date)
+        params["limit"] = limit
         
         cache_key = f"payments/history/{order_id or 'all'}.json"
         data = self._get(
             endpoint="/api/payment/history",
             cache_key=cache_key,
-            params=params
+            params=params,
+            cache_ttl=self.payment_history_cache_ttl
         )
         
         # Convert to DataFrame
-        if isinstance(data, dict):
-            if 'payments' in data:
-                payments_list = data['payments']
-            elif 'data' in data:
-                payments_list = data['data']
-            elif 'items' in data:
-                payments_list = data['items']
-            else:
-                payments_list = [data] if not isinstance(data, list) else data
-        elif isinstance(data, list):
-            payments_list = data
-        else:
-            payments_list = [data]
+        payments_list = extract_records(data, 'payments')
         
         return pd.DataFrame(payments_list)
     
+    def iter_payment_history(
+        self,
+        order_id: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 8,
+        max_records: Optional[int] = None,
+        as_records: bool = False
+    ) -> Iterator[Union["pd.DataFrame", List[Dict[str, Any]]]]:
+        """
+        Stream payment history page by page.
+        
+        Pages are walked by cursor when the API returns one, otherwise by
+        offset with up to prefetch page requests in flight ahead of the
+        consumer (see villa_ecommerce_sdk.pagination.iter_pages). Pages are
+        yielded in order. Page requests go through the retry policy and
+        circuit breaker but not the response cache.
+        
+        Args:
+            order_id: Optional order ID filter
+            customer_id: Optional customer ID filter
+            start_date: Optional start date (YYYY-MM-DD format)
+            end_date: Optional end date (YYYY-MM-DD format)
+            page_size: Records requested per page (default: 100)
+            prefetch: Maximum pages in flight at once (default: 8)
+            max_records: Optional maximum number of records to return
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Yields:
+            One DataFrame (or list of record dicts) per page
+        """
+        from villa_ecommerce_sdk.pagination import iter_pages
+        
+        params = self._history_params(order_id, customer_id, start_date, end_date)
+        
+        def fetch(page_params: Dict[str, Any]) -> Any:
+            return self._get(endpoint="/api/payment/history", params={**params, **page_params})
+        
+        pages = iter_pages(
+            fetch, 'payments', page_size=page_size, prefetch=prefetch, max_records=max_records
+        )
+        if as_records:
+            return pages
+        
+        import pandas as pd
+        return (pd.DataFrame(page) for page in pages)
+    
+    def _history_params(
+        self,
+        order_id: Optional[str],
+        customer_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the query filters shared by payment history requests."""
+        params: Dict[str, Any] = {}
+        if order_id:
+            params["orderId"] = order_id
+        if customer_id:
+            params["customerId"] = customer_id
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+        return params
+    
     def process_refund(
         self,
         payment_id: str,
         amount: Optional[float] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a refund for a payment.
@@ -139,6 +450,9 @@ class PaymentService(BaseService):
             payment_id: Payment identifier to refund
             amount: Optional partial refund amount (if None, full refund)
             reason: Optional refund reason
+            idempotency_key: Optional Idempotency-Key header value; repeating a
+                             request with the same key never refunds twice, and
+                             lets the retry policy retry it safely
             
         Returns:
             Refund response data
@@ -156,15 +470,52 @@ class PaymentService(BaseService):
         return self._post(
             endpoint="/api/payment/refund",
             json_data=payload,
-            headers={"Content-Type": "application/json"}
+            headers=self._json_headers(idempotency_key)
+        )
+    
+    def process_refunds(
+        self,
+        refunds: Iterable[Dict[str, Any]],
+        journal: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_workers: int = 8
+    ) -> SubmissionResult:
+        """
+        Process many refunds with idempotency keys and bounded concurrency.
+        
+        Each item holds process_refund arguments, e.g. {"payment_id": "P1",
+        "amount": 100.0, "reason": "damaged"}, and may set its own
+        "idempotency_key". Journaling and resuming work as in create_payments.
+        
+        Args:
+            refunds: process_refund keyword arguments, one dict per refund
+            journal: Optional journal file path for resumable runs
+            max_workers: Maximum requests in flight at once (default: 8)
+            
+        Returns:
+            SubmissionResult keyed by idempotency key (keys lists them in input order)
+        """
+        return submit_many(
+            lambda item, key: self.process_refund(**item, idempotency_key=key),
+            refunds, operation='process_refund', journal=journal, max_workers=max_workers
         )
     
-    def get_refund_status(self, refund_id: str) -> Dict[str, Any]:
+    def _json_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
+        """Build headers for a JSON POST, with an optional idempotency key."""
+        headers = {"Content-Type": "application/json"}
+        if idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        return headers
+    
+    def get_refund_status(self, refund_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get refund status by refund ID.
         
+        Terminal statuses are cached for a day; in-progress statuses only
+        briefly (see refund_status_cache_ttl).
+        
         Args:
             refund_id: Refund identifier
+            refresh: Bypass the cache and ask the API (default: False)
             
         Returns:
             Refund status data
@@ -172,7 +523,65 @@ class PaymentService(BaseService):
         cache_key = f"refunds/{refund_id}.json"
         return self._get(
             endpoint=f"/api/payment/refund/status/{refund_id}",
-            cache_key=cache_key
+            cache_key=cache_key,
+            cache_ttl=self.refund_status_cache_ttl,
+            refresh=refresh
+        )
+    
+    def get_refund_statuses(
+        self,
+        refund_ids: Iterable[str],
+        max_workers: int = 16
+    ) -> "pd.DataFrame":
+        """
+        Get the status of many refunds.
+        
+        Works like get_payment_statuses.
+        
+        Args:
+            refund_ids: Refund identifiers
+            max_workers: Maximum concurrent API requests (default: 16)
+            
+        Returns:
+            DataFrame indexed by refund_id, in first-seen order, with one
+            column per status field and an error column (None on success)
+        """
+        return self._get_statuses(
+            refund_ids, 'refund_id', self.get_refund_status,
+            lambda refund_id: f"refunds/{refund_id}.json",
+            self.refund_status_cache_ttl, max_workers
+        )
+    
+    def wait_for_refund_status(
+        self,
+        refund_ids: Union[str, Iterable[str]],
+        statuses: Optional[Collection[str]] = None,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: float = 15.0,
+        max_workers: int = 8
+    ) -> Any:
+        """
+        Poll refunds until they reach a terminal (or given) status.
+        
+        Works like wait_for_payment_status.
+        
+        Args:
+            refund_ids: Refund ID, or IDs to wait for
+            statuses: Optional statuses to wait for in addition to the terminal ones
+            timeout: Seconds to wait in total (default: 300)
+            initial_interval: Seconds between the first polls (default: 0.5)
+            max_interval: Upper bound on the poll interval (default: 15)
+            max_workers: Maximum polls in flight at once (default: 8)
+            
+        Returns:
+            The last status data for a single ID, or a dict mapping each ID to
+            it; data that is still in progress means the wait timed out
+        """
+        return self._wait_for(
+            self.get_refund_status, self.refund_status_cache_ttl, refund_ids, statuses,
+            timeout=timeout, initial_interval=initial_interval,
+            max_interval=max_interval, max_workers=max_workers
         )
     
     def get_available_payment_methods(self, branch: int = 1000) -> List[Dict[str, Any]]:
@@ -188,20 +597,11 @@ class PaymentService(BaseService):
         cache_key = f"payment-methods/{branch}.json"
         data = self._get(
             endpoint=f"/api/payment/methods/{branch}",
-            cache_key=cache_key
-        )
-        
-        if isinstance(data, dict):
-            if 'methods' in data:
-                return data['methods']
-            elif 'data' in data:
-                return data['data'] if isinstance(data['data'], list) else [data['data']]
-            else:
-                return [data] if not isinstance(data, list) else data
-        elif isinstance(data, list):
-            return data
-        else:
-            return [data]
+            cache_key=cache_key,
+            cache_ttl=self.payment_methods_cache_ttl
+        )
+        
+        return extract_payment_methods(data)
     
     def verify_payment(self, payment_id: str, order_id: str) -> Dict[str, Any]:
         """
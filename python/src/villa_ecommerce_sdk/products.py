@@ -1,52 +1,97 @@
 """Product list functionality for Villa Ecommerce SDK."""
 
+from typing import Any, Dict, Iterator, List, Optional, Union
 import pandas as pd
 from villa_ecommerce_sdk.base import BaseService
+from villa_ecommerce_sdk.schema import PRODUCT_SCHEMA
 
 
 class ProductsService(BaseService):
     """Service for fetching product list data."""
     
+    # Catalogue changes rarely; keep cached product lists for an hour
+    default_cache_ttl = 3600.0
+    
+    # Categorical, nullable-integer, compact-float and datetime columns
+    schema = PRODUCT_SCHEMA
+    
     def get_service_name(self) -> str:
         """Get service name."""
         return "ProductsService"
     
-    def get_product_list(self, branch: int = 1000) -> pd.DataFrame:
+    def get_product_list(
+        self,
+        branch: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Get product list for a specific branch.
         
         Args:
             branch: Branch ID (default: 1000)
+            columns: Optional columns to return (read directly from the frame
+                     cache when one is configured)
             
         Returns:
             DataFrame containing product data
         """
-        cache_key = f"products/{branch}.json"
+        return self._get_frame(
+            endpoint=f"/api/product/productlist/onlineData/{branch}",
+            cache_key=f"products/{branch}.json",
+            list_key='products',
+            columns=columns
+        )
+    
+    def stream_product_list(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream product data for a branch as DataFrame chunks.
+        
+        Records are parsed incrementally from the response, so branches with
+        very large catalogues are processed in bounded memory. The response
+        cache is bypassed.
         
-        # Fetch from API using base service
-        data = self._get(
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Maximum rows per DataFrame (default: 10000)
+            
+        Yields:
+            DataFrames of at most chunk_size rows
+        """
+        return self._stream_frames(
             endpoint=f"/api/product/productlist/onlineData/{branch}",
-            cache_key=cache_key
+            list_key='products',
+            chunk_size=chunk_size
         )
+    
+    def iter_products(
+        self,
+        branch: int = 1000,
+        chunk_size: int = 1000,
+        as_records: bool = False
+    ) -> Iterator[Union[pd.DataFrame, List[Dict[str, Any]]]]:
+        """
+        Iterate over product data for a branch in fixed-size chunks.
         
-        # Process response data
-        if isinstance(data, dict):
-            # If data is a dict, try to find the list of products
-            # Common patterns: data['products'], data['data'], data['items'], or data itself
-            if 'products' in data:
-                products_list = data['products']
-            elif 'data' in data:
-                products_list = data['data']
-            elif 'items' in data:
-                products_list = data['items']
-            else:
-                # If data is already a list or dict, use it directly
-                products_list = data if isinstance(data, list) else [data]
-        elif isinstance(data, list):
-            products_list = data
-        else:
-            products_list = [data]
+        Chunks come from the frame cache, a fresh cached response or the
+        streamed network response, whichever is available first, and are
+        yielded before the whole list is materialized.
         
-        # Convert to DataFrame
-        return pd.DataFrame(products_list)
-
+        Args:
+            branch: Branch ID (default: 1000)
+            chunk_size: Rows per chunk (default: 1000)
+            as_records: Yield lists of record dicts instead of DataFrames
+            
+        Yields:
+            DataFrames (or lists of dicts) of at most chunk_size rows
+        """
+        return self._iter_chunks(
+            endpoint=f"/api/product/productlist/onlineData/{branch}",
+            cache_key=f"products/{branch}.json",
+            list_key='products',
+            chunk_size=chunk_size,
+            as_records=as_records
+        )
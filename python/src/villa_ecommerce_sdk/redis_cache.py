@@ -0,0 +1,294 @@
+"""Redis-protocol cache backend for Villa Ecommerce SDK."""
+
+import time
+from typing import Any, Dict, Iterable, Optional, Union
+from villa_ecommerce_sdk.cache import CacheEntry, _parse_float
+from villa_ecommerce_sdk.serialization import Codec, get_codec
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - exercised only without the redis extra
+    redis = None
+
+
+# Hash fields holding an entry's payload and metadata
+_DATA_FIELD = "data"
+_METADATA_FIELDS = ("stored_at", "ttl", "etag", "last_modified", "codec")
+
+
+class RedisCache:
+    """
+    Shared low-latency cache on any Redis-protocol server.
+
+    Each entry is a Redis hash holding the encoded payload plus its
+    freshness, validator and codec fields, so touch() rewrites only the
+    metadata. Connections come from a bounded pool, and multi-command
+    operations (writes, touch, get_entries/set_entries) are pipelined into a
+    single round trip as MULTI/EXEC transactions, so readers never see an
+    entry half replaced and bulk reads see a batch written by set_entries
+    all or nothing. Entries with a TTL are expired by Redis
+    stale_retention seconds after they go stale, keeping them available for
+    stale-while-revalidate and conditional revalidation in the meantime.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "villa-sdk",
+        codec: Union[str, Codec] = "json",
+        stale_retention: float = 3600.0,
+        max_connections: int = 50,
+        socket_timeout: float = 1.0,
+        client: Optional["redis.Redis"] = None
+    ):
+        """
+        Initialize Redis cache.
+
+        Args:
+            url: Redis server URL (default: redis://localhost:6379/0)
+            prefix: Prefix for cache keys (default: "villa-sdk")
+            codec: Codec name or instance for payloads (default: "json")
+            stale_retention: Seconds an expired entry is kept before Redis
+                             deletes it (default: 3600)
+            max_connections: Maximum pooled connections (default: 50)
+            socket_timeout: Socket connect/read timeout in seconds (default: 1)
+            client: Optional preconfigured redis.Redis client (url and pool
+                    settings are then ignored)
+
+        Raises:
+            ImportError: If redis-py is not installed and no client is given
+        """
+        if client is None:
+            if redis is None:
+                raise ImportError(
+                    "The Redis cache requires redis-py. Install it with: "
+                    "pip install 'villa-ecommerce-sdk[redis]'"
+                )
+            # RESP2 is understood by every Redis-protocol server, including
+            # pre-6.0 Redis and proxies that do not implement HELLO
+            client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+                url,
+                protocol=2,
+                max_connections=max_connections,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=socket_timeout
+            ))
+        self.client = client
+        self.prefix = prefix
+        self.codec = get_codec(codec)
+        self.stale_retention = stale_retention
+
+    def _get_cache_key(self, key: str) -> str:
+        """Generate full cache key with prefix."""
+        return f"{self.prefix}/{key}"
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry with its freshness metadata, even if expired.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+
+        Returns:
+            CacheEntry, or None if not found or error occurs
+        """
+        try:
+            return self._decode(self.client.hgetall(self._get_cache_key(key)))
+        except Exception:
+            # Any error - return None to allow fallback
+            return None
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Retrieve several entries in one pipelined round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key to CacheEntry for the keys found (missing keys are omitted)
+        """
+        keys = list(keys)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            for key in keys:
+                pipe.hgetall(self._get_cache_key(key))
+            replies = pipe.execute()
+        except Exception:
+            return {}
+        entries = {}
+        for key, fields in zip(keys, replies):
+            entry = self._decode(fields)
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve fresh cached data.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Cached data, or None if not found, expired or error occurs
+        """
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh(max_age=max_age):
+            return None
+        return entry.data
+
+    def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store data in Redis.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            data: Data to cache (serialized with the configured codec)
+            ttl: Optional time-to-live in seconds (default: never expires)
+        """
+        self.set_entry(key, CacheEntry(data=data, stored_at=time.time(), ttl=ttl))
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a cache entry, keeping its freshness metadata in the same hash.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry to store
+        """
+        self.set_entries({key: entry})
+
+    def set_entries(self, entries: Dict[str, CacheEntry]) -> None:
+        """
+        Store several entries in one pipelined round trip.
+
+        Args:
+            entries: Dict of cache key to CacheEntry
+        """
+        try:
+            # DEL + HSET must apply together or a reader could see an empty entry
+            pipe = self.client.pipeline(transaction=True)
+            for key, entry in entries.items():
+                cache_key = self._get_cache_key(key)
+                fields = self._metadata(entry, self.codec.name)
+                fields[_DATA_FIELD] = self.codec.encode(entry.data)
+                pipe.delete(cache_key)
+                pipe.hset(cache_key, mapping=fields)
+                self._expire(pipe, cache_key, entry)
+            pipe.execute()
+        except Exception:
+            # Log error but don't fail - caching is optional
+            pass
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Refresh an entry's freshness metadata without rewriting its payload.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry carrying the new store time and validators
+        """
+        cache_key = self._get_cache_key(key)
+        try:
+            if not self.client.exists(cache_key):
+                return
+            # The payload is kept, so its codec field is left untouched
+            fields = self._metadata(entry, None)
+            dropped = [name for name in _METADATA_FIELDS if name not in fields and name != "codec"]
+            pipe = self.client.pipeline(transaction=True)
+            if dropped:
+                pipe.hdel(cache_key, *dropped)
+            pipe.hset(cache_key, mapping=fields)
+            self._expire(pipe, cache_key, entry)
+            pipe.execute()
+        except Exception:
+            # Log error but don't fail - the entry will simply be revalidated again
+            pass
+
+    def is_cached(self, key: str) -> bool:
+        """
+        Check if a key exists in cache.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        try:
+            return bool(self.client.exists(self._get_cache_key(key)))
+        except Exception:
+            return False
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove cached data from Redis.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        try:
+            self.client.delete(self._get_cache_key(key))
+        except Exception:
+            # Log error but don't fail
+            pass
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.client.close()
+
+    def _expire(self, pipe: Any, cache_key: str, entry: CacheEntry) -> None:
+        """Queue the Redis expiry for an entry (or clear it for entries without TTL)."""
+        if entry.ttl is None:
+            pipe.persist(cache_key)
+        else:
+            pipe.pexpire(cache_key, max(int((entry.ttl + self.stale_retention) * 1000), 1))
+
+    @staticmethod
+    def _metadata(entry: CacheEntry, codec_name: Optional[str]) -> Dict[str, Any]:
+        """Build the metadata hash fields for an entry."""
+        fields = {
+            "stored_at": repr(entry.stored_at if entry.stored_at is not None else time.time()),
+        }
+        if codec_name:
+            fields["codec"] = codec_name
+        if entry.ttl is not None:
+            fields["ttl"] = repr(float(entry.ttl))
+        if entry.etag:
+            fields["etag"] = entry.etag
+        if entry.last_modified:
+            fields["last_modified"] = entry.last_modified
+        return fields
+
+    @staticmethod
+    def _decode(fields: Dict[bytes, bytes]) -> Optional[CacheEntry]:
+        """Decode an entry from its hash fields."""
+        if not fields:
+            return None
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): v for k, v in fields.items()
+        }
+        payload = fields.get(_DATA_FIELD)
+        if payload is None:
+            return None
+        text = {
+            name: (fields[name].decode() if isinstance(fields[name], bytes) else fields[name])
+            for name in _METADATA_FIELDS if name in fields
+        }
+        codec_name = text.get("codec") or "json"
+        try:
+            data = get_codec(codec_name).decode_bytes(
+                payload if isinstance(payload, bytes) else payload.encode('utf-8')
+            )
+        except Exception:
+            return None
+        return CacheEntry(
+            data=data,
+            stored_at=_parse_float(text.get("stored_at")),
+            ttl=_parse_float(text.get("ttl")),
+            etag=text.get("etag"),
+            last_modified=text.get("last_modified"),
+            codec=codec_name
+        )
@@ -0,0 +1,318 @@
+"""Retry and circuit breaker policies for Villa Ecommerce SDK."""
+
+import email.utils
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional
+import requests
+
+
+# Methods that may be repeated without changing the outcome (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+# Header that makes a POST safe to repeat
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+# Path segments that look like identifiers: all digits, or several digits
+# mixed with other characters ("1000", "PAY123"), but not "inventory2"
+_ID_SEGMENT = re.compile(r'^\d+$|\d.*\d')
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because its endpoint's circuit is open."""
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current epoch time (default: time.time())
+
+    Returns:
+        Delay in seconds (never negative), or None if absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(when.timestamp() - (time.time() if now is None else now), 0.0)
+
+
+def response_retry_after(response: Any) -> Optional[float]:
+    """
+    Read the Retry-After delay from a response.
+
+    Args:
+        response: requests.Response (or None)
+
+    Returns:
+        Delay in seconds, or None
+    """
+    if response is None:
+        return None
+    try:
+        return parse_retry_after(response.headers.get('Retry-After'))
+    except Exception:
+        return None
+
+
+def is_upstream_failure(status_code: Optional[int]) -> bool:
+    """
+    Check whether a response status means the upstream is unhealthy.
+
+    Args:
+        status_code: HTTP status code
+
+    Returns:
+        True for 5xx responses and 429 Too Many Requests
+    """
+    return isinstance(status_code, int) and (status_code >= 500 or status_code == 429)
+
+
+def endpoint_route(endpoint: str) -> str:
+    """
+    Derive the circuit breaker key for an endpoint.
+
+    Identifier segments (e.g. branch or payment IDs) are replaced so that
+    every branch of the inventory endpoint shares one circuit.
+
+    Args:
+        endpoint: API endpoint (e.g., "/api/inventory2/1000")
+
+    Returns:
+        Route key (e.g., "/api/inventory2/{id}")
+    """
+    path = endpoint.split('?', 1)[0]
+    return '/'.join(
+        '{id}' if _ID_SEGMENT.search(segment) else segment
+        for segment in path.split('/')
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy with capped exponential backoff and full jitter.
+
+    Idempotent methods are retried on connection errors, timeouts and the
+    retryable statuses. Other methods (payment POSTs) are only retried when
+    the request carries an Idempotency-Key header, when the connection could
+    not be established (the request never reached the server), or on 429,
+    which the upstream sends before processing the request. A Retry-After
+    header sets the minimum delay; a Retry-After longer than max_retry_after
+    is not waited out.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False, compare=False)
+
+    def is_retryable(
+        self,
+        method: str,
+        headers: Optional[Mapping[str, str]] = None,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None
+    ) -> bool:
+        """
+        Check whether a failed attempt may be repeated.
+
+        Args:
+            method: HTTP method of the request
+            headers: Request headers
+            status_code: Response status (None if no response was received)
+            error: Exception raised by the transport (requests or httpx), if any
+
+        Returns:
+            True if the request is safe and worth retrying
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS or any(
+            name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in (headers or {})
+        )
+        if error is not None:
+            if isinstance(error, requests.exceptions.ConnectTimeout):
+                return True
+            # httpx errors (from the async client) exist only once httpx is imported
+            httpx = sys.modules.get('httpx')
+            if httpx is not None and isinstance(error, httpx.TransportError):
+                if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                    # The request never reached the server
+                    return True
+                transient = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+                return idempotent and isinstance(error, transient)
+            transient = (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError
+            )
+            return idempotent and isinstance(error, transient)
+        if status_code not in self.retry_statuses:
+            return False
+        return idempotent or status_code == 429
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Zero-based index of the retry
+            retry_after: Optional server-requested delay in seconds
+
+        Returns:
+            Delay in seconds, or None if the server asked for a longer wait
+            than max_retry_after
+        """
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+
+@dataclass
+class _Circuit:
+    """Failure state of one endpoint."""
+
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After failure_threshold consecutive upstream failures an endpoint's
+    circuit opens and requests fail fast. Once recovery_timeout has passed a
+    single probe request is let through (half-open); its success closes the
+    circuit and its failure reopens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (default: 5)
+            recovery_timeout: Seconds an open circuit waits before a probe (default: 30)
+            clock: Monotonic time source (default: time.monotonic)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def allow(self, key: str) -> bool:
+        """
+        Check whether a request to an endpoint may be sent.
+
+        Args:
+            key: Endpoint key (see endpoint_route)
+
+        Returns:
+            True if the request may proceed (possibly as the half-open probe)
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            if circuit.probing or self._clock() - circuit.opened_at < self.recovery_timeout:
+                return False
+            circuit.probing = True
+            return True
+
+    def record_success(self, key: str) -> None:
+        """
+        Record a healthy upstream response, closing the circuit.
+
+        Args:
+            key: Endpoint key
+        """
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """
+        Record an upstream failure, opening the circuit at the threshold.
+
+        Args:
+            key: Endpoint key
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.probing or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = self._clock()
+                circuit.probing = False
+
+    def state(self, key: str) -> str:
+        """
+        Get the state of an endpoint's circuit.
+
+        Args:
+            key: Endpoint key
+
+        Returns:
+            CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            return self._state(self._circuits.get(key))
+
+    def states(self) -> Dict[str, str]:
+        """
+        Get the state of every endpoint that has recorded failures.
+
+        Returns:
+            Dict of endpoint key to state
+        """
+        with self._lock:
+            return {key: self._state(circuit) for key, circuit in self._circuits.items()}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Close one circuit, or all circuits when no key is given.
+
+        Args:
+            key: Optional endpoint key
+        """
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def _state(self, circuit: Optional[_Circuit]) -> str:
+        """Classify a circuit."""
+        if circuit is None or circuit.opened_at is None:
+            return self.CLOSED
+        if circuit.probing or self._clock() - circuit.opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
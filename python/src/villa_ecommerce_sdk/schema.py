@@ -0,0 +1,256 @@
+"""Declared record schemas and dtype-optimized DataFrames for Villa Ecommerce SDK."""
+
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported only when DataFrames are built
+    import pandas as pd
+
+
+# float32 keeps cent precision (after rounding) for magnitudes below 2**17
+_FLOAT32_CENT_LIMIT = float(2 ** 17)
+
+
+@dataclass
+class MemoryReport:
+    """DataFrame memory before and after applying a schema."""
+
+    rows: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by the declared dtypes."""
+        return self.bytes_before - self.bytes_after
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of the original memory saved."""
+        if not self.bytes_before:
+            return 0.0
+        return self.saved_bytes / self.bytes_before
+
+
+class RecordSchema:
+    """
+    Explicit dtypes for the columns of a record list.
+
+    Supported dtypes are "string" (text columns only; numeric ids are kept),
+    "category", "boolean", "Int32"/"Int64" (nullable integers), "float32",
+    "float64" and "datetime" (parsed to UTC timestamps). Only declared
+    columns that are present are converted; other columns keep the dtype
+    pandas infers. A column whose values do not
+    fit its declared type (e.g. fractional quantities declared "Int32", or
+    prices too large for float32 to keep cent precision) is left unchanged.
+    """
+
+    def __init__(self, name: str, dtypes: Dict[str, str]):
+        """
+        Initialize record schema.
+
+        Args:
+            name: Schema name (e.g., "products")
+            dtypes: Column name to dtype
+        """
+        self.name = name
+        self.dtypes = dict(dtypes)
+
+    def apply(self, frame: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Convert declared columns to their dtypes.
+
+        Args:
+            frame: DataFrame built from decoded records
+
+        Returns:
+            DataFrame with converted columns (the input is not modified)
+        """
+        converted = {}
+        for column, dtype in self.dtypes.items():
+            if column not in frame.columns:
+                continue
+            original = frame[column]
+            try:
+                result = _CONVERTERS[dtype](original)
+            except (TypeError, ValueError, OverflowError):
+                result = None
+            if result is not None:
+                converted[column] = result
+        if not converted:
+            return frame
+        return frame.assign(**converted)
+
+    def build(self, records: object) -> "pd.DataFrame":
+        """
+        Build a typed DataFrame from records.
+
+        Args:
+            records: Records as accepted by pd.DataFrame
+
+        Returns:
+            DataFrame in the declared dtypes
+        """
+        import pandas as pd
+        return self.apply(pd.DataFrame(records))
+
+
+def memory_report(before: "pd.DataFrame", after: "pd.DataFrame") -> MemoryReport:
+    """
+    Compare the deep memory usage of two DataFrames.
+
+    Args:
+        before: DataFrame with inferred dtypes
+        after: Same data in the declared dtypes
+
+    Returns:
+        MemoryReport
+    """
+    return MemoryReport(
+        rows=len(after),
+        bytes_before=int(before.memory_usage(deep=True).sum()),
+        bytes_after=int(after.memory_usage(deep=True).sum())
+    )
+
+
+def _to_string(series: "pd.Series") -> Optional["pd.Series"]:
+    import pandas as pd
+    if series.dtype == "string" or not pd.api.types.is_object_dtype(series.dtype) \
+            and not pd.api.types.is_string_dtype(series.dtype):
+        # Already typed, or numeric ids that callers compare as numbers
+        return None
+    return series.astype("string")
+
+
+def _to_category(series: "pd.Series") -> Optional["pd.Series"]:
+    if series.dtype == "category":
+        return None
+    if series.map(type).isin([dict, list]).any():
+        # Unhashable values cannot be categories
+        return None
+    return series.astype("category")
+
+
+def _to_boolean(series: "pd.Series") -> Optional["pd.Series"]:
+    if series.dtype == "boolean":
+        return None
+    if not series.dropna().map(type).isin([bool]).all():
+        return None
+    return series.astype("boolean")
+
+
+def _integer(dtype: str) -> Callable[["pd.Series"], Optional["pd.Series"]]:
+    def convert(series: "pd.Series") -> Optional["pd.Series"]:
+        import numpy as np
+        import pandas as pd
+        if str(series.dtype) == dtype:
+            return None
+        numeric = pd.to_numeric(series, errors='coerce')
+        if numeric.notna().sum() != series.notna().sum():
+            return None
+        values = numeric.dropna()
+        if (values % 1 != 0).any():
+            return None
+        info = np.iinfo(dtype.lower())
+        if len(values) and (values.min() < info.min or values.max() > info.max):
+            return None
+        return numeric.astype(dtype)
+    return convert
+
+
+def _to_float32(series: "pd.Series") -> Optional["pd.Series"]:
+    import pandas as pd
+    if series.dtype == "float32":
+        return None
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().sum() != series.notna().sum():
+        return None
+    if (numeric.abs() >= _FLOAT32_CENT_LIMIT).any():
+        return None
+    return numeric.astype("float32")
+
+
+def _to_float64(series: "pd.Series") -> Optional["pd.Series"]:
+    import pandas as pd
+    if series.dtype == "float64":
+        return None
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().sum() != series.notna().sum():
+        return None
+    return numeric.astype("float64")
+
+
+def _to_datetime(series: "pd.Series") -> Optional["pd.Series"]:
+    import pandas as pd
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return None
+    with warnings.catch_warnings():
+        # Mixed formats fall back to per-element parsing; that is expected here
+        warnings.simplefilter("ignore", UserWarning)
+        parsed = pd.to_datetime(series, errors='coerce', utc=True)
+    if parsed.notna().sum() != series.notna().sum():
+        # Unparseable values: keep the original strings rather than losing data
+        return None
+    return parsed
+
+
+_CONVERTERS: Dict[str, Callable[["pd.Series"], Optional["pd.Series"]]] = {
+    "string": _to_string,
+    "category": _to_category,
+    "boolean": _to_boolean,
+    "Int32": _integer("Int32"),
+    "Int64": _integer("Int64"),
+    "float32": _to_float32,
+    "float64": _to_float64,
+    "datetime": _to_datetime,
+}
+
+
+PRODUCT_SCHEMA = RecordSchema("products", {
+    "id": "string",
+    "productId": "string",
+    "product_id": "string",
+    "sku": "string",
+    "barcode": "string",
+    "name": "string",
+    "category": "category",
+    "brand": "category",
+    "unit": "category",
+    "price": "float32",
+    "salePrice": "float32",
+    "quantity": "Int32",
+    "stock": "Int32",
+    "inStock": "boolean",
+    "in_stock": "boolean",
+    "isActive": "boolean",
+    "image": "string",
+    "createdAt": "datetime",
+    "updatedAt": "datetime",
+    "lastUpdated": "datetime",
+})
+
+INVENTORY_SCHEMA = RecordSchema("inventory", {
+    "id": "string",
+    "productId": "string",
+    "product_id": "string",
+    "inventory_id": "string",
+    "sku": "string",
+    "productName": "string",
+    "category": "category",
+    "brand": "category",
+    "branch": "Int32",
+    "branchName": "category",
+    "location": "category",
+    "status": "category",
+    "quantity": "Int32",
+    "stock": "Int32",
+    "available": "Int32",
+    "minStock": "Int32",
+    "price": "float32",
+    "in_stock": "boolean",
+    "inStock": "boolean",
+    "lastUpdated": "datetime",
+    "updatedAt": "datetime",
+    "timestamp": "datetime",
+})
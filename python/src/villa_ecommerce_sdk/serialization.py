@@ -0,0 +1,409 @@
+"""Cache payload codecs for Villa Ecommerce SDK."""
+
+import gzip
+import io
+import json
+import os
+from typing import Any, BinaryIO, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without the zstd extra
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the msgpack extra
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the orjson extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an alternative to orjson
+    msgspec = None
+
+
+# Codec assumed for entries written before codecs were recorded
+LEGACY_CODEC = "json"
+
+# Codec used for new S3 entries unless another is configured; plain JSON stays
+# readable by older SDK versions and other readers sharing the bucket
+DEFAULT_CODEC = LEGACY_CODEC
+
+# JSON backends in order of preference when none is configured
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+# Environment variable selecting the JSON backend
+JSON_BACKEND_ENV = "VILLA_SDK_JSON_BACKEND"
+
+# Encoded JSON accepted by json_loads
+JSONPayload = Union[bytes, bytearray, memoryview, str]
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types JSON lacks like the stdlib backend's default=str does."""
+    if isinstance(obj, float):
+        # Float subclasses (e.g. numpy.float64) stay numbers
+        return float(obj)
+    return str(obj)
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, default=str, separators=(',', ':')).encode('utf-8')
+
+
+def _stdlib_loads(payload: "JSONPayload") -> Any:
+    if isinstance(payload, memoryview):
+        # The stdlib decoder does not accept buffers
+        payload = payload.tobytes()
+    return json.loads(payload)
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    try:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Integers beyond 64 bits and other values orjson rejects
+        return _stdlib_dumps(data)
+
+
+def _orjson_loads(payload: "JSONPayload") -> Any:
+    try:
+        return orjson.loads(payload)
+    except ValueError:
+        # NaN/Infinity literals and other inputs only the stdlib accepts
+        return _stdlib_loads(payload)
+
+
+def _msgspec_dumps(data: Any) -> bytes:
+    try:
+        return msgspec.json.encode(data, enc_hook=_json_default)
+    except (TypeError, OverflowError, msgspec.EncodeError):
+        return _stdlib_dumps(data)
+
+
+def _msgspec_loads(payload: "JSONPayload") -> Any:
+    try:
+        return msgspec.json.decode(payload)
+    except msgspec.DecodeError:
+        return _stdlib_loads(payload)
+
+
+_JSON_IMPLEMENTATIONS = {
+    "orjson": (orjson, _orjson_dumps, _orjson_loads),
+    "msgspec": (msgspec, _msgspec_dumps, _msgspec_loads),
+    "json": (json, _stdlib_dumps, _stdlib_loads),
+}
+
+_json_backend = "json"
+_dumps = _stdlib_dumps
+_loads = _stdlib_loads
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """
+    Select the JSON implementation used for responses and cache payloads.
+
+    Args:
+        name: "orjson", "msgspec" or "json" (stdlib); None picks the fastest
+              installed one
+
+    Returns:
+        Name of the selected backend
+
+    Raises:
+        ValueError: If the name is not a known backend
+        ImportError: If the named backend is not installed
+    """
+    global _json_backend, _dumps, _loads
+    if name is None:
+        name = next(n for n in JSON_BACKENDS if _JSON_IMPLEMENTATIONS[n][0] is not None)
+    if name not in _JSON_IMPLEMENTATIONS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    module, dumps, loads = _JSON_IMPLEMENTATIONS[name]
+    if module is None:
+        raise ImportError(
+            f"The {name} JSON backend is not installed. Install it with: "
+            f"pip install 'villa-ecommerce-sdk[{name}]'"
+        )
+    _json_backend, _dumps, _loads = name, dumps, loads
+    return name
+
+
+def json_backend() -> str:
+    """
+    Get the name of the active JSON backend.
+
+    Returns:
+        "orjson", "msgspec" or "json"
+    """
+    return _json_backend
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON with the active backend.
+
+    Values JSON cannot represent are converted with str(), as with the
+    stdlib's default=str.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        Encoded JSON
+    """
+    return _dumps(data)
+
+
+def json_loads(payload: JSONPayload) -> Any:
+    """
+    Decode JSON with the active backend.
+
+    Args:
+        payload: UTF-8 encoded JSON (or str)
+
+    Returns:
+        Decoded data
+
+    Raises:
+        ValueError: If the payload is not valid JSON
+    """
+    return _loads(payload)
+
+
+def decode_json_response(response: Any) -> Any:
+    """
+    Decode an HTTP response body (requests or httpx) with the active backend.
+
+    Falls back to the response's own json() for bodies the backend cannot
+    decode (e.g. non-UTF-8 encodings), so errors surface exactly as before.
+
+    Args:
+        response: HTTP response object
+
+    Returns:
+        Decoded data
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, bytearray)):
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
+    return response.json()
+
+
+class Codec:
+    """
+    Serializes cache payloads to bytes and decodes them from a binary stream.
+
+    Codec names are recorded with each stored object, so any reader can
+    decode entries written with a different codec.
+    """
+
+    name = ""
+    content_type = "application/octet-stream"
+    content_encoding = None
+
+    def encode(self, data: Any) -> bytes:
+        """
+        Serialize data to bytes.
+
+        Args:
+            data: Data to serialize
+
+        Returns:
+            Encoded payload
+        """
+        raise NotImplementedError
+
+    def decode(self, stream: BinaryIO) -> Any:
+        """
+        Decode data from a readable binary stream.
+
+        Args:
+            stream: File-like object supporting read()
+
+        Returns:
+            Decoded data
+        """
+        raise NotImplementedError
+
+    def decode_bytes(self, payload: Union[bytes, memoryview]) -> Any:
+        """
+        Decode data from an in-memory payload.
+
+        Args:
+            payload: Encoded payload (any buffer, e.g. a memoryview over a
+                     memory-mapped file)
+
+        Returns:
+            Decoded data
+        """
+        return self.decode(io.BytesIO(payload))
+
+
+class JSONCodec(Codec):
+    """UTF-8 JSON; the format used by entries written without a codec."""
+
+    name = "json"
+    content_type = "application/json"
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize data as compact UTF-8 JSON."""
+        return json_dumps(data)
+
+    def decode(self, stream: BinaryIO) -> Any:
+        """Decode JSON from the stream."""
+        return json_loads(stream.read())
+
+    def decode_bytes(self, payload: Union[bytes, memoryview]) -> Any:
+        """Decode JSON from an in-memory payload without copying it (except with stdlib json)."""
+        return json_loads(payload)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack binary serialization (requires msgpack)."""
+
+    name = "msgpack"
+    content_type = "application/msgpack"
+
+    def __init__(self):
+        """Initialize msgpack codec."""
+        _require(msgpack, "msgpack")
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize data with msgpack."""
+        return msgpack.packb(data, default=str, use_bin_type=True)
+
+    def decode(self, stream: BinaryIO) -> Any:
+        """Decode a single msgpack object, reading the stream in chunks."""
+        unpacker = msgpack.Unpacker(stream, raw=False, strict_map_key=False)
+        return next(unpacker)
+
+    def decode_bytes(self, payload: Union[bytes, memoryview]) -> Any:
+        """Decode a msgpack object straight from an in-memory payload."""
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+class GzipCodec(Codec):
+    """Gzip compression around another codec."""
+
+    content_encoding = "gzip"
+
+    def __init__(self, inner: Codec, level: int = 6):
+        """
+        Initialize gzip codec.
+
+        Args:
+            inner: Codec producing the uncompressed payload
+            level: Compression level 1-9 (default: 6)
+        """
+        self.inner = inner
+        self.level = level
+        self.name = f"{inner.name}+gzip"
+        self.content_type = inner.content_type
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize with the inner codec and gzip the result."""
+        return gzip.compress(self.inner.encode(data), compresslevel=self.level)
+
+    def decode(self, stream: BinaryIO) -> Any:
+        """Decompress the stream incrementally into the inner codec."""
+        with gzip.GzipFile(fileobj=stream, mode='rb') as decompressed:
+            return self.inner.decode(decompressed)
+
+    def decode_bytes(self, payload: Union[bytes, memoryview]) -> Any:
+        """Decompress an in-memory payload in one pass into the inner codec."""
+        return self.inner.decode_bytes(gzip.decompress(payload))
+
+
+class ZstdCodec(Codec):
+    """Zstandard compression around another codec (requires zstandard)."""
+
+    content_encoding = "zstd"
+
+    def __init__(self, inner: Codec, level: int = 3):
+        """
+        Initialize zstd codec.
+
+        Args:
+            inner: Codec producing the uncompressed payload
+            level: Compression level (default: 3)
+        """
+        _require(zstandard, "zstd")
+        self.inner = inner
+        self.level = level
+        self.name = f"{inner.name}+zstd"
+        self.content_type = inner.content_type
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize with the inner codec and zstd-compress the result."""
+        return zstandard.ZstdCompressor(level=self.level).compress(self.inner.encode(data))
+
+    def decode(self, stream: BinaryIO) -> Any:
+        """Decompress the stream incrementally into the inner codec."""
+        with zstandard.ZstdDecompressor().stream_reader(stream) as decompressed:
+            return self.inner.decode(decompressed)
+
+    def decode_bytes(self, payload: Union[bytes, memoryview]) -> Any:
+        """Decompress an in-memory payload incrementally into the inner codec."""
+        with zstandard.ZstdDecompressor().stream_reader(payload) as decompressed:
+            return self.inner.decode(decompressed)
+
+
+_SERIALIZERS = {
+    "json": JSONCodec,
+    "msgpack": MsgpackCodec,
+}
+
+_COMPRESSORS = {
+    "gzip": GzipCodec,
+    "zstd": ZstdCodec,
+}
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """
+    Resolve a codec by name.
+
+    Names are a serializer optionally followed by a compressor, e.g. "json",
+    "json+gzip", "json+zstd" or "msgpack+zstd".
+
+    Args:
+        codec: Codec name or instance (default: DEFAULT_CODEC)
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the name is not a known codec
+        ImportError: If the codec's optional dependency is not installed
+    """
+    if isinstance(codec, Codec):
+        return codec
+    name = codec or DEFAULT_CODEC
+    serializer, _, compressor = name.partition('+')
+    if serializer not in _SERIALIZERS or (compressor and compressor not in _COMPRESSORS):
+        raise ValueError(f"Unknown cache codec: {name}")
+    resolved = _SERIALIZERS[serializer]()
+    if compressor:
+        resolved = _COMPRESSORS[compressor](resolved)
+    return resolved
+
+
+def _require(module: Any, extra: str) -> None:
+    """Raise a helpful ImportError when an optional codec dependency is missing."""
+    if module is None:
+        raise ImportError(
+            f"This cache codec requires an optional dependency. Install it with: "
+            f"pip install 'villa-ecommerce-sdk[{extra}]'"
+        )
+
+
+set_json_backend(os.environ.get(JSON_BACKEND_ENV) or None)
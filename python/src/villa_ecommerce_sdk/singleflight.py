@@ -0,0 +1,182 @@
+"""Request coalescing (single-flight) for Villa Ecommerce SDK."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class _Call:
+    """An in-flight call shared by every caller with the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls that share a key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        """Initialize an empty single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = SingleFlightStats()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once for all concurrent callers of key.
+
+        Args:
+            key: Deduplication key (e.g. a cache key)
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            The result of fn
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self) -> int:
+        """
+        Get the number of keys currently being fetched.
+
+        Returns:
+            Number of in-flight keys
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> SingleFlightStats:
+        """
+        Get call/execution/coalesced counters.
+
+        Returns:
+            SingleFlightStats snapshot
+        """
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._stats.calls,
+                executions=self._stats.executions,
+                coalesced=self._stats.coalesced
+            )
+
+
+class AsyncSingleFlight:
+    """
+    Deduplicate concurrent coroutine calls that share a key.
+
+    The asyncio counterpart of SingleFlight: the first caller for a key
+    awaits the coroutine function; callers arriving while it is in flight
+    await its result (or exception). Use one group per event loop.
+    """
+
+    def __init__(self):
+        """Initialize an empty single-flight group."""
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn once for all concurrent callers of key.
+
+        Args:
+            key: Deduplication key (e.g. a cache key)
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            The result of fn
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        self._stats.calls += 1
+        call = self._calls.get(key)
+        if call is not None:
+            self._stats.coalesced += 1
+            # A cancelled waiter must not cancel the call other callers share
+            return await asyncio.shield(call)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        self._stats.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            # Retrieved here so a call nobody else awaited is not reported as unhandled
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """
+        Get the number of keys currently being fetched.
+
+        Returns:
+            Number of in-flight keys
+        """
+        return len(self._calls)
+
+    def stats(self) -> SingleFlightStats:
+        """
+        Get call/execution/coalesced counters.
+
+        Returns:
+            SingleFlightStats snapshot
+        """
+        return SingleFlightStats(
+            calls=self._stats.calls,
+            executions=self._stats.executions,
+            coalesced=self._stats.coalesced
+        )
@@ -0,0 +1,195 @@
+"""State-aware status caching and polling for Villa Ecommerce SDK."""
+
+import heapq
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
+
+# Payment statuses that no longer change on their own
+TERMINAL_PAYMENT_STATUSES = frozenset({
+    'completed', 'succeeded', 'success', 'paid', 'captured', 'settled',
+    'failed', 'declined', 'rejected', 'cancelled', 'canceled', 'expired',
+    'voided', 'refunded',
+})
+
+# Refund statuses that no longer change on their own
+TERMINAL_REFUND_STATUSES = frozenset({
+    'completed', 'succeeded', 'success', 'refunded',
+    'failed', 'declined', 'rejected', 'cancelled', 'canceled',
+})
+
+# Response fields holding a status, in order of preference
+STATUS_KEYS = ('status', 'state', 'paymentStatus', 'refundStatus')
+
+
+def extract_status(data: Any) -> Optional[str]:
+    """
+    Locate the status in a status response.
+
+    Looks at the top level first, then inside a 'data' envelope.
+
+    Args:
+        data: Decoded response payload
+
+    Returns:
+        Lowercased status, or None if the response has none
+    """
+    for payload in (data, data.get('data') if isinstance(data, dict) else None):
+        if isinstance(payload, dict):
+            for key in STATUS_KEYS:
+                value = payload.get(key)
+                if isinstance(value, str) and value:
+                    return value.strip().lower()
+    return None
+
+
+class StatusTTL:
+    """
+    Cache TTL policy that depends on the status in a response.
+
+    Terminal statuses are cached for terminal_ttl seconds. Any other status
+    (including a missing or unrecognized one) is treated as in progress and
+    cached for pending_ttl seconds; 0 disables caching it. Instances are
+    passed as cache_ttl to BaseService._get, which evaluates them against
+    each response and, on reads, against the cached data, so entries
+    written with a fixed TTL are judged by the same rules.
+    """
+
+    def __init__(
+        self,
+        terminal_statuses: Collection[str],
+        terminal_ttl: Optional[float] = 86400.0,
+        pending_ttl: float = 5.0
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            terminal_statuses: Lowercase statuses that no longer change
+            terminal_ttl: TTL in seconds for terminal statuses; None never
+                          expires (default: 1 day, as completed payments
+                          can still be refunded)
+            pending_ttl: TTL in seconds for other statuses (default: 5)
+        """
+        self.terminal_statuses = frozenset(terminal_statuses)
+        self.terminal_ttl = terminal_ttl
+        self.pending_ttl = pending_ttl
+
+    def is_terminal(self, data: Any) -> bool:
+        """Check whether a status response holds a terminal status."""
+        return extract_status(data) in self.terminal_statuses
+
+    def __call__(self, data: Any) -> Optional[float]:
+        return self.terminal_ttl if self.is_terminal(data) else self.pending_ttl
+
+    def __repr__(self) -> str:
+        return f"StatusTTL(terminal_ttl={self.terminal_ttl!r}, pending_ttl={self.pending_ttl!r})"
+
+
+def wait_for_statuses(
+    fetch: Callable[[str], Any],
+    ids: Iterable[str],
+    is_done: Callable[[Any], bool],
+    timeout: float = 300.0,
+    initial_interval: float = 0.5,
+    max_interval: float = 15.0,
+    backoff: float = 1.5,
+    max_workers: int = 8,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep
+) -> Dict[str, Any]:
+    """
+    Poll many status resources until each is done or the timeout passes.
+
+    A single scheduler keeps one heap of next-poll times for all IDs and
+    runs in the calling thread. The IDs due at each tick are polled
+    together on a pool of at most max_workers threads, however many IDs
+    are waited on. Each ID's interval starts at initial_interval and grows
+    by backoff (with 10% jitter) up to max_interval while its status stays
+    the same; a status change resets it. Failed polls back off the same
+    way and are retried until the deadline.
+
+    Args:
+        fetch: Callable taking an ID and returning its current status response
+        ids: IDs to wait for (duplicates are polled once)
+        is_done: Predicate telling whether a response is final
+        timeout: Seconds to wait in total (default: 300)
+        initial_interval: Seconds before the second poll of an ID (default: 0.5)
+        max_interval: Upper bound on the poll interval in seconds (default: 15)
+        backoff: Interval growth factor between polls (default: 1.5)
+        max_workers: Maximum polls in flight at once (default: 8)
+        clock: Monotonic clock (for tests)
+        sleep: Sleep function (for tests)
+
+    Returns:
+        Dict mapping every ID to its last status response (None if no poll
+        succeeded); callers check is_done to spot IDs that timed out
+
+    Raises:
+        ValueError: If an interval, backoff or max_workers is out of range
+    """
+    if initial_interval <= 0 or max_interval < initial_interval:
+        raise ValueError("Poll intervals must satisfy 0 < initial_interval <= max_interval")
+    if backoff < 1:
+        raise ValueError("backoff must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    unique = list(dict.fromkeys(ids))
+    results: Dict[str, Any] = dict.fromkeys(unique)
+    statuses: Dict[str, Optional[str]] = {}
+    intervals = dict.fromkeys(unique, initial_interval)
+    start = clock()
+    deadline = start + timeout
+    # (next poll time, insertion order, ID)
+    schedule: List[Tuple[float, int, str]] = [(start, n, i) for n, i in enumerate(unique)]
+    heapq.heapify(schedule)
+    sequence = len(schedule)
+
+    def poll(item_id: str) -> Tuple[str, bool, Any]:
+        try:
+            return item_id, True, fetch(item_id)
+        except Exception as e:
+            return item_id, False, e
+
+    executor: Optional[ThreadPoolExecutor] = None
+    try:
+        while schedule:
+            now = clock()
+            if schedule[0][0] > now:
+                sleep(schedule[0][0] - now)
+                continue
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule)[2])
+            if len(due) == 1 or max_workers == 1:
+                polled = [poll(item_id) for item_id in due]
+            else:
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=max_workers, thread_name_prefix="villa-status"
+                    )
+                polled = list(executor.map(poll, due))
+
+            now = clock()
+            for item_id, ok, value in polled:
+                if ok:
+                    results[item_id] = value
+                    if is_done(value):
+                        continue
+                    status = extract_status(value)
+                    if status != statuses.get(item_id, status):
+                        # Progress: look again soon
+                        intervals[item_id] = initial_interval
+                    statuses[item_id] = status
+                interval = intervals[item_id]
+                intervals[item_id] = min(interval * backoff, max_interval)
+                next_poll = now + interval * random.uniform(0.9, 1.1)
+                if next_poll < deadline:
+                    heapq.heappush(schedule, (next_poll, sequence, item_id))
+                    sequence += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+    return results
@@ -0,0 +1,188 @@
+"""Incremental JSON parsing of large record arrays for Villa Ecommerce SDK."""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Union
+
+
+# Keys searched for the record array, mirroring base.extract_records
+RECORD_KEYS = ('data', 'items')
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+
+class _TextStream:
+    """Buffered cursor over incrementally decoded UTF-8 chunks."""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int = 1) -> bool:
+        """Append at least min_size characters (fewer at end of input), dropping consumed text."""
+        parts: List[str] = []
+        size = 0
+        while size < min_size and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                text = self._decoder.decode(b'', final=True)
+            elif isinstance(chunk, bytes):
+                text = self._decoder.decode(chunk)
+            else:
+                text = chunk
+            if text:
+                parts.append(text)
+                size += len(text)
+        if not parts:
+            return False
+        self._buffer = self._buffer[self._pos:] + ''.join(parts)
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end)."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def separator(self, closing: str) -> bool:
+        """Consume a ',' or the closing bracket; return True at the closing bracket."""
+        char = self.peek()
+        if char != ',' and char != closing:
+            found = char or 'end of input'
+            raise ValueError(f"Expected ',' or {closing!r} in JSON stream, found {found!r}")
+        self._pos += 1
+        return char == closing
+
+    def value(self) -> Any:
+        """Decode one complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # At least double the pending text before retrying, so a value
+                # spanning many chunks is decoded in linear time
+                if self._fill(max(len(self._buffer) - self._pos, 1)):
+                    continue
+                raise
+            # A number or literal ending at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """Yield the elements of the array starting at the cursor."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.separator(']'):
+                return
+
+
+def iter_json_records(
+    chunks: Iterable[Union[bytes, str]],
+    list_key: str
+) -> Iterator[Any]:
+    """
+    Incrementally parse the records of a JSON response.
+
+    Records are located like base.extract_records: the array under list_key,
+    else under 'data', else under 'items', a top-level array, or else the
+    whole document as a single record. The list_key array is streamed: only
+    the record currently being decoded and one input chunk are held in
+    memory, and anything after it is not read. A 'data' or 'items' value
+    seen before list_key is buffered until the end of the document rules
+    list_key out.
+
+    Args:
+        chunks: Response body chunks (bytes or str)
+        list_key: Preferred key holding the records (e.g. "products")
+
+    Yields:
+        Decoded records
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    stream = _TextStream(chunks)
+    first = stream.peek()
+    if first == '[':
+        yield from stream.array()
+        return
+    if first != '{':
+        yield stream.value()
+        return
+
+    document = {}
+    stream.expect('{')
+    if stream.peek() != '}':
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == list_key:
+                if stream.peek() == '[':
+                    yield from stream.array()
+                else:
+                    yield stream.value()
+                return
+            document[key] = stream.value()
+            if stream.separator('}'):
+                break
+    for key in RECORD_KEYS:
+        if key in document:
+            records = document[key]
+            if isinstance(records, list):
+                yield from records
+            else:
+                yield records
+            return
+    # No record array: the object itself is the only record
+    yield document
+
+
+def chunked(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Group records into lists of at most size items.
+
+    Args:
+        records: Records to group
+        size: Maximum records per list
+
+    Yields:
+        Lists of records (the last one may be shorter)
+    """
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    batch: List[Any] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
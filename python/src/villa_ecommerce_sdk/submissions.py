@@ -0,0 +1,248 @@
+"""Journaled bulk submissions with idempotency keys for Villa Ecommerce SDK."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+# Item field carrying a caller-chosen idempotency key
+IDEMPOTENCY_KEY_FIELD = 'idempotency_key'
+
+# Namespace of the idempotency keys derived for journaled runs
+_KEY_NAMESPACE = uuid.UUID('6f1d0c2e-55a4-4c1b-9b8e-2f7c51d9a3e0')
+
+
+@dataclass
+class SubmissionResult:
+    """Per-item outcomes of a bulk submission, keyed by idempotency key."""
+
+    keys: List[str] = field(default_factory=list)
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    resumed: Set[str] = field(default_factory=set)
+
+    @property
+    def ok(self) -> bool:
+        """True when every item was submitted successfully."""
+        return not self.errors
+
+
+class SubmissionJournal:
+    """
+    Append-only JSON Lines record of a bulk submission run.
+
+    The first line names the run and its operation; each later line
+    records the outcome of one item under its idempotency key. Reopening
+    the journal resumes the run: items that already succeeded are not
+    sent again, and the rest are re-sent with the same idempotency keys,
+    so the API deduplicates any request that was in flight when the
+    previous run stopped. A partly written last line is ignored.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], operation: str, fsync: bool = False):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path: Journal file path
+            operation: Name of the submitted operation (e.g. "process_refund")
+            fsync: Whether to fsync after every record, surviving OS crashes
+                   as well as process crashes (default: False)
+
+        Raises:
+            ValueError: If the journal belongs to a different operation
+        """
+        self.path = os.fspath(path)
+        self.operation = operation
+        self.fsync = fsync
+        self.run_id: Optional[str] = None
+        self._outcomes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if self._file.tell() > 0 and not self._ends_with_newline():
+            # Terminate a torn last line so the next record starts cleanly
+            self._file.write('\n')
+        if self.run_id is None:
+            self.run_id = uuid.uuid4().hex
+            self._write({'run_id': self.run_id, 'operation': operation, 'at': time.time()})
+
+    def _load(self) -> None:
+        """Read the run header and latest outcome per key from an existing journal."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash
+                    continue
+                if 'run_id' in record:
+                    if record.get('operation') != self.operation:
+                        raise ValueError(
+                            f"Journal {self.path} records {record.get('operation')!r}, "
+                            f"not {self.operation!r}"
+                        )
+                    self.run_id = record['run_id']
+                elif 'key' in record:
+                    self._outcomes[record['key']] = record
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as journal:
+            journal.seek(-1, os.SEEK_END)
+            return journal.read(1) == b'\n'
+
+    def succeeded(self, key: str) -> bool:
+        """Check whether an item already succeeded in this run."""
+        return self._outcomes.get(key, {}).get('state') == 'succeeded'
+
+    def response(self, key: str) -> Any:
+        """Get the recorded response of a succeeded item."""
+        return self._outcomes[key].get('response')
+
+    def record_success(self, key: str, response: Any) -> None:
+        """Record that an item succeeded."""
+        self._record({'key': key, 'state': 'succeeded', 'response': response, 'at': time.time()})
+
+    def record_failure(self, key: str, error: Exception) -> None:
+        """Record that an item failed; it is retried when the run resumes."""
+        self._record({'key': key, 'state': 'failed', 'error': str(error), 'at': time.time()})
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._outcomes[record['key']] = record
+            self._write(record)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, default=str) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def __enter__(self) -> "SubmissionJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def idempotency_keys(run_id: str, operation: str, payloads: List[Dict[str, Any]]) -> List[str]:
+    """
+    Assign an idempotency key to every item of a run.
+
+    Items carrying an idempotency_key field keep it. Other keys are UUIDs
+    derived from the run ID, the operation and the item's canonical
+    payload, so the same input yields the same keys when a run is resumed.
+    Identical payloads (e.g. two equal partial refunds) are told apart by
+    their occurrence number.
+
+    Args:
+        run_id: Run identifier
+        operation: Name of the submitted operation
+        payloads: Items to submit
+
+    Returns:
+        One key per item, in order
+
+    Raises:
+        ValueError: If two items share an idempotency key
+    """
+    occurrences: Counter = Counter()
+    keys = []
+    for payload in payloads:
+        key = payload.get(IDEMPOTENCY_KEY_FIELD)
+        if not key:
+            canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+            digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+            occurrence = occurrences[digest]
+            occurrences[digest] += 1
+            key = str(uuid.uuid5(_KEY_NAMESPACE, f"{run_id}:{operation}:{digest}:{occurrence}"))
+        keys.append(key)
+    if len(set(keys)) != len(keys):
+        raise ValueError("Items must not share an idempotency key")
+    return keys
+
+
+def submit_many(
+    send: Callable[[Dict[str, Any], str], Any],
+    items: Iterable[Dict[str, Any]],
+    operation: str,
+    journal: Optional[Union[str, "os.PathLike[str]"]] = None,
+    max_workers: int = 8
+) -> SubmissionResult:
+    """
+    Submit many items with idempotency keys on a bounded thread pool.
+
+    Without a journal every call is a new run with fresh keys. With a
+    journal, outcomes are appended as they arrive and a repeated call with
+    the same items resumes the run (see SubmissionJournal). Failing items
+    are recorded in SubmissionResult.errors and do not stop the batch.
+
+    Args:
+        send: Callable taking an item (without its idempotency_key field)
+              and its idempotency key and returning the response
+        items: Items to submit
+        operation: Name of the submitted operation
+        journal: Optional journal file path
+        max_workers: Maximum requests in flight at once (default: 8)
+
+    Returns:
+        SubmissionResult keyed by idempotency key, with keys in input order
+
+    Raises:
+        ValueError: If max_workers is less than 1, items share an
+                    idempotency key or the journal belongs to another operation
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    items = list(items)
+    log = SubmissionJournal(journal, operation) if journal is not None else None
+    try:
+        run_id = log.run_id if log is not None else uuid.uuid4().hex
+        result = SubmissionResult(keys=idempotency_keys(run_id, operation, items))
+        todo = []
+        for key, item in zip(result.keys, items):
+            if log is not None and log.succeeded(key):
+                result.results[key] = log.response(key)
+                result.resumed.add(key)
+            else:
+                payload = {k: v for k, v in item.items() if k != IDEMPOTENCY_KEY_FIELD}
+                todo.append((key, payload))
+
+        def run(key: str, payload: Dict[str, Any]) -> None:
+            try:
+                response = send(payload, key)
+            except Exception as e:
+                result.errors[key] = e
+                if log is not None:
+                    log.record_failure(key, e)
+            else:
+                result.results[key] = response
+                if log is not None:
+                    log.record_success(key, response)
+
+        if todo:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(todo)), thread_name_prefix="villa-submit"
+            ) as executor:
+                # Keep a bounded window of futures rather than queueing every item up front
+                in_flight: Set["Future[None]"] = set()
+                for key, payload in todo:
+                    if len(in_flight) >= max_workers * 2:
+                        _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    in_flight.add(executor.submit(run, key, payload))
+        return result
+    finally:
+        if log is not None:
+            log.close()
@@ -0,0 +1,165 @@
+"""Multi-tier cache composition for Villa Ecommerce SDK."""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from villa_ecommerce_sdk.cache import CacheEntry, get_entries
+
+
+class TieredCache:
+    """
+    Cache made of ordered tiers, fastest first.
+
+    Reads try each tier in turn and back-fill the faster tiers on a hit;
+    writes and invalidations go to every tier.
+    """
+
+    def __init__(self, tiers: Sequence[Any]):
+        """
+        Initialize tiered cache.
+
+        Args:
+            tiers: Cache backends ordered from fastest (e.g. MemoryCache) to
+                   most durable (e.g. S3Cache)
+        """
+        if not tiers:
+            raise ValueError("TieredCache requires at least one tier")
+        self.tiers: List[Any] = list(tiers)
+
+    def _find(self, key: str, max_age: Optional[float] = None) -> Optional[CacheEntry]:
+        """
+        Walk the tiers for the first fresh entry, else the newest stale one.
+
+        A fresh entry found in a slower tier is back-filled into the faster ones.
+        """
+        newest_stale = None
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get_entry(key)
+            if entry is None:
+                continue
+            if entry.is_fresh(max_age=max_age):
+                for faster in self.tiers[:index]:
+                    faster.set_entry(key, entry)
+                return entry
+            if newest_stale is None or (entry.stored_at or 0) > (newest_stale.stored_at or 0):
+                newest_stale = entry
+        return newest_stale
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached entry, preferring fresh data from the fastest tier.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+
+        Returns:
+            CacheEntry, or None if no tier has the key
+        """
+        return self._find(key)
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Retrieve several entries with one batched read per tier.
+
+        Each tier is only asked for the keys the faster tiers had no fresh
+        entry for. Fresh entries are back-filled into the faster tiers; for
+        keys without one, the newest stale entry is returned.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key to CacheEntry for the keys found (missing keys are omitted)
+        """
+        pending = list(dict.fromkeys(keys))
+        found: Dict[str, CacheEntry] = {}
+        for index, tier in enumerate(self.tiers):
+            if not pending:
+                break
+            remaining = []
+            entries = get_entries(tier, pending)
+            for key in pending:
+                entry = entries.get(key)
+                if entry is not None and entry.is_fresh():
+                    for faster in self.tiers[:index]:
+                        faster.set_entry(key, entry)
+                    found[key] = entry
+                    continue
+                newest_stale = found.get(key)
+                if entry is not None and (
+                    newest_stale is None or (entry.stored_at or 0) > (newest_stale.stored_at or 0)
+                ):
+                    found[key] = entry
+                remaining.append(key)
+            pending = remaining
+        return found
+
+    def get_cached(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve fresh cached data from the first tier that has it.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            max_age: Optional maximum acceptable age in seconds
+
+        Returns:
+            Cached data, or None if no tier has a fresh copy
+        """
+        entry = self._find(key, max_age=max_age)
+        if entry is None or not entry.is_fresh(max_age=max_age):
+            return None
+        return entry.data
+
+    def set_cached(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store data in every tier.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            data: Data to cache
+            ttl: Optional time-to-live in seconds
+        """
+        self.set_entry(key, CacheEntry(data=data, stored_at=time.time(), ttl=ttl))
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a cache entry in every tier.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry to store
+        """
+        for tier in self.tiers:
+            tier.set_entry(key, entry)
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """
+        Refresh an entry's freshness in every tier without rewriting bodies.
+
+        Args:
+            key: Cache key (e.g., "products/1000.json")
+            entry: CacheEntry carrying the new store time and validators
+        """
+        for tier in self.tiers:
+            tier.touch(key, entry)
+
+    def is_cached(self, key: str) -> bool:
+        """
+        Check if any tier has the key.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        return any(tier.is_cached(key) for tier in self.tiers)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove cached data from every tier.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        for tier in self.tiers:
+            tier.invalidate(key)
@@ -0,0 +1,166 @@
+"""Pooled HTTP transport for Villa Ecommerce SDK."""
+
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+@dataclass
+class TransportStats:
+    """Connection usage counters for an HTTPTransport."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Number of requests served over an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that reused a pooled connection."""
+        if not self.requests:
+            return 0.0
+        return self.connections_reused / self.requests
+
+
+def _counting_pool(pool_cls: type, on_new_connection: Callable[[], None]) -> type:
+    """Build a connection pool subclass that reports every opened socket."""
+
+    class CountingConnection(pool_cls.ConnectionCls):
+        def _new_conn(self):
+            on_new_connection()
+            return super()._new_conn()
+
+    class CountingPool(pool_cls):
+        ConnectionCls = CountingConnection
+
+    CountingPool.__name__ = f"Counting{pool_cls.__name__}"
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that counts opened connections and sets socket options."""
+
+    def __init__(
+        self,
+        on_new_connection: Callable[[], None],
+        tcp_keepalive: bool = False,
+        **kwargs
+    ):
+        self._on_new_connection = on_new_connection
+        self._tcp_keepalive = tcp_keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if self._tcp_keepalive:
+            pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool(pool_cls, self._on_new_connection)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class HTTPTransport:
+    """
+    Shared, connection-pooled HTTP transport.
+
+    Wraps a single requests.Session so that every service created by a
+    VillaClient reuses the same keep-alive connections instead of opening
+    a new TCP/TLS connection per call.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_keepalive: bool = False
+    ):
+        """
+        Initialize HTTP transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum open connections kept per host (default: 20)
+            pool_block: Block when a host pool is exhausted instead of opening
+                        throwaway connections (default: False)
+            keep_alive: Reuse connections between requests (default: True)
+            tcp_keepalive: Enable TCP keep-alive probes on pooled sockets (default: False)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.tcp_keepalive = tcp_keepalive
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections_opened = 0
+
+        self.session = requests.Session()
+        adapter = _CountingAdapter(
+            on_new_connection=self._record_new_connection,
+            tcp_keepalive=tcp_keepalive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def _record_new_connection(self) -> None:
+        """Count a newly opened connection."""
+        with self._lock:
+            self._connections_opened += 1
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send an HTTP request over the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: Keyword arguments accepted by requests.Session.request
+
+        Returns:
+            requests.Response object
+        """
+        with self._lock:
+            self._requests += 1
+        return self.session.request(method, url, **kwargs)
+
+    def stats(self) -> TransportStats:
+        """
+        Get connection reuse statistics.
+
+        Returns:
+            TransportStats snapshot
+        """
+        with self._lock:
+            return TransportStats(
+                requests=self._requests,
+                connections_opened=self._connections_opened
+            )
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "HTTPTransport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
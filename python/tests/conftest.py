@@ -0,0 +1,67 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+import requests
+from unittest.mock import Mock
+from villa_ecommerce_sdk.transport import HTTPTransport
+
+
+class FakeClock:
+    """Monotonic clock advanced by setting now or by sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(payload=None, status_code=200, headers=None):
+    """Build a mock requests.Response whose raise_for_status mirrors the status."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def _transport(*results):
+    """Build a mock transport answering requests with results in order.
+
+    Prepared responses and exceptions are used as they are; anything else is
+    a payload wrapped in a 200 response.
+    """
+    transport = Mock(spec=HTTPTransport)
+    transport.request.side_effect = [
+        r if isinstance(r, (Mock, BaseException)) else _response(r) for r in results
+    ]
+    return transport
+
+
+@pytest.fixture
+def make_response():
+    """Factory for mock requests.Response objects."""
+    return _response
+
+
+@pytest.fixture
+def make_transport():
+    """Factory for mock HTTPTransports answering with the given results in order."""
+    return _transport
+
+
+@pytest.fixture
+def clock():
+    """Fake monotonic clock, advanced manually or by clock.sleep."""
+    return FakeClock()
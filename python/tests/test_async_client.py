@@ -0,0 +1,268 @@
+"""Tests for the asyncio client and services."""
+
+import asyncio
+import json
+import time
+import pytest
+import pandas as pd
+from unittest.mock import Mock
+from villa_ecommerce_sdk.async_cache import AsyncCacheAdapter
+from villa_ecommerce_sdk.cache import CacheEntry, S3Cache
+from villa_ecommerce_sdk.resilience import RetryPolicy
+
+httpx = pytest.importorskip("httpx")
+
+from villa_ecommerce_sdk.async_client import AsyncVillaClient  # noqa: E402
+from villa_ecommerce_sdk.async_services import AsyncProductsService  # noqa: E402
+
+
+def _mock_http_client(handler):
+    """Create an httpx.AsyncClient answering requests with handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _json_response(payload, status_code=200):
+    return httpx.Response(status_code, content=json.dumps(payload).encode("utf-8"))
+
+
+def _make_client(handler, cache=None, **kwargs):
+    """Create an AsyncVillaClient wired to a mock transport, retrying without delay."""
+    if cache is None:
+        sync_cache = Mock(spec=S3Cache)
+        sync_cache.get_entry.return_value = None
+        cache = AsyncCacheAdapter(sync_cache)
+    kwargs.setdefault("retry_policy", RetryPolicy(backoff_base=0.0))
+    return AsyncVillaClient(
+        s3_bucket="test-bucket",
+        cache=cache,
+        http_client=_mock_http_client(handler),
+        **kwargs
+    )
+
+
+class TestAsyncCacheAdapter:
+    """Test cases for AsyncCacheAdapter."""
+
+    def test_delegates_to_sync_cache(self):
+        """Test async calls run the wrapped cache operations."""
+        sync_cache = Mock(spec=S3Cache)
+        sync_cache.get_cached.return_value = {"a": 1}
+        sync_cache.is_cached.return_value = True
+        cache = AsyncCacheAdapter(sync_cache)
+
+        async def run():
+            assert await cache.get_cached("k") == {"a": 1}
+            await cache.set_cached("k", {"b": 2})
+            assert await cache.is_cached("k") is True
+            await cache.invalidate("k")
+
+        asyncio.run(run())
+        cache.close()
+
+        sync_cache.get_cached.assert_called_once_with("k")
+        sync_cache.set_cached.assert_called_once_with("k", {"b": 2}, ttl=None)
+        sync_cache.invalidate.assert_called_once_with("k")
+
+
+class TestAsyncVillaClient:
+    """Test cases for AsyncVillaClient."""
+
+    def test_get_product_list(self):
+        """Test products are fetched and returned as a DataFrame."""
+        def handler(request):
+            assert request.url.path == "/api/product/productlist/onlineData/1000"
+            return _json_response({"products": [{"id": 1}, {"id": 2}]})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.get_product_list(branch=1000)
+
+        result = asyncio.run(run())
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
+
+    def test_get_product_list_from_cache(self):
+        """Test cache hits skip the network."""
+        sync_cache = Mock(spec=S3Cache)
+        sync_cache.get_entry.return_value = CacheEntry([{"id": 1}], stored_at=time.time())
+
+        def handler(request):
+            raise AssertionError("network should not be used")
+
+        async def run():
+            async with _make_client(handler, cache=AsyncCacheAdapter(sync_cache)) as client:
+                return await client.get_product_list(branch=1000)
+
+        result = asyncio.run(run())
+        assert len(result) == 1
+        sync_cache.get_entry.assert_called_once_with("products/1000.json")
+
+    def test_concurrent_branch_fetches(self):
+        """Test many branch fetches share one event loop."""
+        def handler(request):
+            branch = int(request.url.path.rsplit("/", 1)[1])
+            return _json_response([{"id": branch}])
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await asyncio.gather(
+                    *(client.get_inventory(branch=branch) for branch in range(50))
+                )
+
+        results = asyncio.run(run())
+        assert [int(df["id"].iloc[0]) for df in results] == list(range(50))
+
+    def test_get_products_with_inventory(self):
+        """Test merged view with filters."""
+        def handler(request):
+            if "inventory2" in request.url.path:
+                return _json_response([{"id": 1, "stock": 5}, {"id": 2, "stock": 0}])
+            return _json_response([{"id": 1, "name": "A"}, {"id": 2, "name": "B"}])
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.get_products_with_inventory(
+                    branch=1000, filters={"stock": {"gt": 0}}
+                )
+
+        result = asyncio.run(run())
+        assert list(result["name"]) == ["A"]
+
+    def test_create_payment(self):
+        """Test POST payloads are sent as JSON."""
+        def handler(request):
+            assert request.method == "POST"
+            body = json.loads(request.content)
+            assert body["orderId"] == "ORD-1"
+            return _json_response({"paymentId": "PAY-1"})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.create_payment(order_id="ORD-1", amount=10.0)
+
+        assert asyncio.run(run()) == {"paymentId": "PAY-1"}
+
+    def test_http_error(self):
+        """Test HTTP errors are raised as exceptions."""
+        def handler(request):
+            return _json_response({"error": "boom"}, status_code=500)
+
+        async def run():
+            async with _make_client(handler) as client:
+                await client.get_payment_status("PAY-1")
+
+        with pytest.raises(Exception, match="Failed to GET"):
+            asyncio.run(run())
+
+    def test_retries_transient_failures(self):
+        """Test a 503 is retried like in the sync client."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return _json_response({"error": "busy"}, status_code=503)
+            return _json_response([{"id": 1}])
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.get_inventory(branch=1000)
+
+        assert len(asyncio.run(run())) == 1
+        assert len(calls) == 2
+
+    def test_stale_if_error(self):
+        """Test stale products are served on upstream failure, payment statuses are not."""
+        sync_cache = Mock(spec=S3Cache)
+        sync_cache.get_entry.return_value = CacheEntry(
+            [{"id": 1}], stored_at=time.time() - 120, ttl=60
+        )
+
+        def handler(request):
+            return _json_response({"error": "boom"}, status_code=500)
+
+        async def run():
+            cache = AsyncCacheAdapter(sync_cache)
+            async with _make_client(handler, cache=cache, stale_if_error=300) as client:
+                products = await client.get_product_list(branch=1000)
+                with pytest.raises(Exception, match="Failed to GET"):
+                    await client.get_payment_status("PAY-1")
+                return products
+
+        assert len(asyncio.run(run())) == 1
+
+    def test_expired_entry_revalidated(self):
+        """Test an expired entry is revalidated and renewed on 304 Not Modified."""
+        sync_cache = Mock(spec=S3Cache)
+        sync_cache.get_entry.return_value = CacheEntry(
+            [{"id": 1}], stored_at=time.time() - 120, ttl=60, etag='"v1"'
+        )
+
+        def handler(request):
+            assert request.headers["If-None-Match"] == '"v1"'
+            return httpx.Response(304)
+
+        async def run():
+            async with _make_client(handler, cache=AsyncCacheAdapter(sync_cache)) as client:
+                return await client.get_product_list(branch=1000)
+
+        assert len(asyncio.run(run())) == 1
+        sync_cache.touch.assert_called_once()
+        sync_cache.set_entry.assert_not_called()
+
+    def test_concurrent_misses_coalesced(self):
+        """Test concurrent fetches of one branch share one upstream request."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return _json_response([{"id": 1}])
+
+        async def run():
+            async with _make_client(handler) as client:
+                frames = await asyncio.gather(
+                    *(client.get_inventory(branch=1000) for _ in range(10))
+                )
+                return frames, client.get_coalescing_stats()
+
+        frames, stats = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(len(df) == 1 for df in frames)
+        assert stats.coalesced == 9
+
+    def test_typed_frames(self):
+        """Test product frames use the declared dtypes unless typed_frames is off."""
+        def handler(request):
+            return _json_response([{"id": 1, "category": "fruit"}])
+
+        async def run(typed_frames):
+            async with _make_client(handler, typed_frames=typed_frames) as client:
+                return await client.get_product_list(branch=1000)
+
+        assert isinstance(asyncio.run(run(True))["category"].dtype, pd.CategoricalDtype)
+        assert not isinstance(asyncio.run(run(False))["category"].dtype, pd.CategoricalDtype)
+
+    def test_service_without_cache(self):
+        """Test a standalone service with its own HTTP client."""
+        def handler(request):
+            return _json_response({"data": [{"id": 1}]})
+
+        async def run():
+            service = AsyncProductsService(
+                base_url="https://api.example.com",
+                http_client=_mock_http_client(handler)
+            )
+            result = await service.get_product_list(branch=1)
+            await service.http_client.aclose()
+            return result
+
+        assert len(asyncio.run(run())) == 1
+
+    def test_missing_httpx_fails_fast(self, monkeypatch):
+        """Test services need httpx even when given a client, and say how to install it."""
+        from villa_ecommerce_sdk import async_base
+        monkeypatch.setattr(async_base, "httpx", None)
+
+        with pytest.raises(ImportError, match=r"villa-ecommerce-sdk\[async\]"):
+            AsyncProductsService(base_url="https://api.example.com", http_client=Mock())
@@ -0,0 +1,254 @@
+"""Tests for BaseService request and caching behaviour."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.base import BaseService, request_cache_key, request_fingerprint
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.transport import HTTPTransport
+
+
+class DummyService(BaseService):
+    """Minimal concrete service for exercising BaseService."""
+
+    def get_service_name(self) -> str:
+        return "DummyService"
+
+
+def _memory_cache():
+    return MemoryCache(default_ttl=None, ttls={})
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBaseServiceCaching:
+    """Test cases for BaseService cache freshness handling."""
+
+    def test_miss_fetches_and_caches_with_ttl(self, make_transport):
+        """Test a miss stores the response with the service TTL."""
+        cache = _memory_cache()
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=make_transport({"v": 1}), cache_ttl=60)
+
+        assert service._get("/x", cache_key="x.json") == {"v": 1}
+        entry = cache.get_entry("x.json")
+        assert entry.data == {"v": 1}
+        assert entry.ttl == 60
+
+    def test_fresh_entry_skips_network(self, make_transport):
+        """Test fresh entries are served from cache."""
+        cache = _memory_cache()
+        cache.set_cached("x.json", {"v": "cached"}, ttl=60)
+        transport = make_transport()
+        service = DummyService("https://api.example.com", cache=cache, transport=transport)
+
+        assert service._get("/x", cache_key="x.json") == {"v": "cached"}
+        transport.request.assert_not_called()
+
+    def test_expired_entry_refetches(self, make_transport):
+        """Test expired entries are refetched synchronously without SWR."""
+        cache = _memory_cache()
+        cache.set_entry("x.json", CacheEntry({"v": "old"}, stored_at=time.time() - 120, ttl=60))
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=make_transport({"v": "new"}))
+
+        assert service._get("/x", cache_key="x.json") == {"v": "new"}
+
+    def test_legacy_entry_without_ttl_is_refetched(self, make_transport):
+        """Test the service TTL bounds entries stored without TTL metadata."""
+        cache = _memory_cache()
+        cache.set_entry("products/1.json", CacheEntry({"v": "old"}, stored_at=time.time() - 20 * 86400))
+        transport = make_transport({"v": "new"})
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=transport, cache_ttl=300)
+
+        assert service._get("/p", cache_key="products/1.json") == {"v": "new"}
+        transport.request.assert_called_once()
+        assert cache.get_entry("products/1.json").ttl == 300
+
+    def test_stale_while_revalidate(self, make_transport):
+        """Test stale entries are returned immediately and refreshed in the background."""
+        cache = _memory_cache()
+        cache.set_entry("x.json", CacheEntry({"v": "old"}, stored_at=time.time() - 90, ttl=60))
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=make_transport({"v": "new"}),
+                               cache_ttl=60, stale_while_revalidate=60)
+
+        assert service._get("/x", cache_key="x.json") == {"v": "old"}
+        assert _wait_for(lambda: cache.get_cached("x.json") == {"v": "new"})
+
+    def test_stale_refresh_is_deduplicated(self, make_response):
+        """Test concurrent stale reads schedule a single refresh."""
+        release = threading.Event()
+        transport = Mock(spec=HTTPTransport)
+
+        def slow_request(*args, **kwargs):
+            release.wait(2)
+            return make_response({"v": "new"})
+
+        transport.request.side_effect = slow_request
+        cache = _memory_cache()
+        cache.set_entry("x.json", CacheEntry({"v": "old"}, stored_at=time.time() - 90, ttl=60))
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=transport, stale_while_revalidate=60)
+
+        for _ in range(5):
+            assert service._get("/x", cache_key="x.json") == {"v": "old"}
+        release.set()
+
+        assert _wait_for(lambda: not service._refreshing)
+        assert transport.request.call_count == 1
+
+    def test_concurrent_misses_are_coalesced(self, make_response):
+        """Test concurrent cold misses share one upstream fetch and cache write."""
+        release = threading.Event()
+        transport = Mock(spec=HTTPTransport)
+
+        def slow_request(*args, **kwargs):
+            release.wait(2)
+            return make_response({"v": 1})
+
+        transport.request.side_effect = slow_request
+        cache = Mock(wraps=_memory_cache())
+        service = DummyService("https://api.example.com", cache=cache, transport=transport)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service._get("/x", cache_key="x.json")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        assert _wait_for(lambda: service.single_flight.stats().calls == 5)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        assert results == [{"v": 1}] * 5
+        assert transport.request.call_count == 1
+        assert cache.set_entry.call_count == 1
+        assert service.single_flight.stats().coalesced == 4
+
+    def test_zero_ttl_skips_cache_write(self, make_transport):
+        """Test a zero TTL disables caching of the response."""
+        cache = _memory_cache()
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=make_transport({"v": 1}))
+
+        service._get("/x", cache_key="x.json", cache_ttl=0)
+        assert cache.get_entry("x.json") is None
+
+    def test_request_failure_raises(self):
+        """Test upstream failures surface as exceptions."""
+        import requests
+        transport = Mock(spec=HTTPTransport)
+        transport.request.side_effect = requests.exceptions.ConnectionError("reset")
+        service = DummyService("https://api.example.com", transport=transport)
+
+        with pytest.raises(Exception, match="Failed to GET /x"):
+            service._get("/x")
+
+
+class TestBaseServiceRevalidation:
+    """Test cases for conditional revalidation of stale entries."""
+
+    def test_stores_validators(self, make_response, make_transport):
+        """Test ETag and Last-Modified are kept with the cache entry."""
+        cache = _memory_cache()
+        response = make_response({"v": 1}, headers={
+            "ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"
+        })
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=make_transport(response))
+
+        service._get("/x", cache_key="x.json")
+        entry = cache.get_entry("x.json")
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def test_not_modified_renews_entry(self, make_response, make_transport):
+        """Test a 304 keeps the cached body and refreshes its store time."""
+        cache = _memory_cache()
+        stale = CacheEntry({"v": "old"}, stored_at=time.time() - 120, ttl=60, etag='"abc"')
+        cache.set_entry("x.json", stale)
+        not_modified = make_response(None, status_code=304)
+        transport = make_transport(not_modified)
+        service = DummyService("https://api.example.com", cache=cache,
+                               transport=transport, cache_ttl=60)
+
+        assert service._get("/x", cache_key="x.json") == {"v": "old"}
+
+        sent_headers = transport.request.call_args[1]["headers"]
+        assert sent_headers["If-None-Match"] == '"abc"'
+        not_modified.json.assert_not_called()
+        entry = cache.get_entry("x.json")
+        assert entry.is_fresh()
+        assert entry.data is stale.data
+        assert entry.etag == '"abc"'
+
+    def test_modified_replaces_entry(self, make_response, make_transport):
+        """Test a 200 on revalidation stores the new body and validators."""
+        cache = _memory_cache()
+        cache.set_entry("x.json", CacheEntry(
+            {"v": "old"}, stored_at=time.time() - 120, ttl=60,
+            last_modified="Mon, 19 Oct 2026 07:28:00 GMT"
+        ))
+        transport = make_transport(make_response({"v": "new"}, headers={"ETag": '"def"'}))
+        service = DummyService("https://api.example.com", cache=cache, transport=transport)
+
+        assert service._get("/x", cache_key="x.json") == {"v": "new"}
+        sent_headers = transport.request.call_args[1]["headers"]
+        assert sent_headers["If-Modified-Since"] == "Mon, 19 Oct 2026 07:28:00 GMT"
+        assert cache.get_entry("x.json").etag == '"def"'
+
+    def test_no_conditional_headers_without_entry(self, make_transport):
+        """Test cold misses send unconditional requests."""
+        transport = make_transport({"v": 1})
+        service = DummyService("https://api.example.com", cache=_memory_cache(),
+                               transport=transport)
+
+        service._get("/x", cache_key="x.json", params={"a": 1})
+        assert transport.request.call_args[1]["headers"] == {}
+
+
+class TestRequestFingerprint:
+    """Test cases for request fingerprinting and derived cache keys."""
+
+    def test_params_are_normalized(self):
+        """Test parameter order and None values do not change the fingerprint."""
+        base = request_fingerprint("GET", "/h", {"a": 1, "b": "x"})
+        assert request_fingerprint("get", "/h", {"b": "x", "a": 1, "c": None}) == base
+        assert request_fingerprint("GET", "/h", {"a": 2, "b": "x"}) != base
+        assert request_fingerprint("GET", "/other", {"a": 1, "b": "x"}) != base
+        assert request_fingerprint("GET", "/h", {"f": True}) == request_fingerprint("GET", "/h", {"f": "true"})
+        assert request_fingerprint("GET", "/h", {"t": ["a", "b"]}) != request_fingerprint("GET", "/h", {"t": ["b", "a"]})
+
+    def test_cache_key_keeps_resource_keys_readable(self):
+        """Test keys only gain a digest when query parameters are sent."""
+        assert request_cache_key("products/1000.json", "GET", "/p") == "products/1000.json"
+        assert request_cache_key("products/1000.json", "GET", "/p", {"x": None}) == "products/1000.json"
+        key = request_cache_key("payments/history/all.json", "GET", "/h", {"limit": 10})
+        digest = request_fingerprint("GET", "/h", {"limit": 10})
+        assert key == f"payments/history/all-{digest}.json"
+        assert request_cache_key("history", "GET", "/h", {"limit": 10}) == f"history-{digest}"
+
+    def test_distinct_params_get_distinct_entries(self, make_transport):
+        """Test requests sharing a base key but not their params are cached apart."""
+        cache = _memory_cache()
+        transport = make_transport({"v": 1}, {"v": 2})
+        service = DummyService("https://api.example.com", cache=cache, transport=transport)
+
+        assert service._get("/h", cache_key="h.json", params={"customerId": "A", "limit": 10}) == {"v": 1}
+        assert service._get("/h", cache_key="h.json", params={"customerId": "B", "limit": 10}) == {"v": 2}
+        assert service._get("/h", cache_key="h.json", params={"limit": 10, "customerId": "A"}) == {"v": 1}
+        assert transport.request.call_count == 2
+        assert cache.get_entry("h.json") is None
@@ -0,0 +1,132 @@
+"""Tests for multi-branch bulk fetch."""
+
+import asyncio
+import threading
+import time
+import pandas as pd
+from unittest.mock import Mock, patch
+from villa_ecommerce_sdk.bulk import BulkResult, fetch_many, fetch_many_async
+from villa_ecommerce_sdk.client import VillaClient
+
+
+def _branch_frame(branch):
+    return pd.DataFrame({"id": [1, 2], "stock": [branch, branch]})
+
+
+class TestFetchMany:
+    """Test cases for fetch_many helpers."""
+
+    def test_collects_results_in_order(self):
+        """Test results are keyed by branch in input order."""
+        result = fetch_many(_branch_frame, [3, 1, 2, 1])
+
+        assert result.ok
+        assert list(result.results) == [3, 1, 2]
+        assert int(result.results[2]["stock"].iloc[0]) == 2
+
+    def test_failures_do_not_abort_batch(self):
+        """Test a failing branch is reported alongside successful ones."""
+        def fetch(branch):
+            if branch == 2:
+                raise Exception("upstream down")
+            return _branch_frame(branch)
+
+        result = fetch_many(fetch, [1, 2, 3])
+
+        assert not result.ok
+        assert sorted(result.results) == [1, 3]
+        assert str(result.errors[2]) == "upstream down"
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_workers fetches run at once."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(branch):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return _branch_frame(branch)
+
+        result = fetch_many(fetch, range(20), max_workers=3)
+
+        assert len(result.results) == 20
+        assert 1 < state["peak"] <= 3
+
+    def test_to_frame_adds_branch_column(self):
+        """Test concatenated view carries the branch ID."""
+        result = BulkResult(results={1000: _branch_frame(1), 1001: _branch_frame(2)})
+        frame = result.to_frame()
+
+        assert len(frame) == 4
+        assert list(frame["branch"]) == [1000, 1000, 1001, 1001]
+
+    def test_to_frame_empty(self):
+        """Test empty result produces an empty frame."""
+        frame = BulkResult().to_frame()
+        assert frame.empty
+        assert "branch" in frame.columns
+
+    def test_fetch_many_async(self):
+        """Test async fan-out with bounded concurrency and failures."""
+        state = {"active": 0, "peak": 0}
+
+        async def fetch(branch):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.001)
+            state["active"] -= 1
+            if branch == 5:
+                raise ValueError("bad branch")
+            return _branch_frame(branch)
+
+        result = asyncio.run(fetch_many_async(fetch, range(10), max_concurrency=4))
+
+        assert state["peak"] == 4
+        assert len(result.results) == 9
+        assert isinstance(result.errors[5], ValueError)
+
+
+class TestVillaClientBulk:
+    """Test cases for VillaClient bulk methods."""
+
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    @patch('villa_ecommerce_sdk.payments.PaymentService')
+    @patch('villa_ecommerce_sdk.inventory.InventoryService')
+    @patch('villa_ecommerce_sdk.products.ProductsService')
+    def test_get_product_list_many(self, mock_products, mock_inventory, mock_payments, mock_cache):
+        """Test product lists are fetched per branch."""
+        mock_products_instance = Mock()
+        mock_products_instance.get_product_list.side_effect = lambda branch, columns=None: _branch_frame(branch)
+        mock_products.return_value = mock_products_instance
+
+        client = VillaClient(s3_bucket="test-bucket")
+        result = client.get_product_list_many([1000, 1001])
+
+        assert result.ok
+        assert mock_products_instance.get_product_list.call_count == 2
+        assert set(result.to_frame()["branch"]) == {1000, 1001}
+
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    @patch('villa_ecommerce_sdk.payments.PaymentService')
+    @patch('villa_ecommerce_sdk.inventory.InventoryService')
+    @patch('villa_ecommerce_sdk.products.ProductsService')
+    def test_get_inventory_many_reports_errors(self, mock_products, mock_inventory, mock_payments, mock_cache):
+        """Test inventory failures are reported per branch."""
+        def get_inventory(branch, columns=None):
+            if branch == 1001:
+                raise Exception("timeout")
+            return _branch_frame(branch)
+
+        mock_inventory_instance = Mock()
+        mock_inventory_instance.get_inventory.side_effect = get_inventory
+        mock_inventory.return_value = mock_inventory_instance
+
+        client = VillaClient(s3_bucket="test-bucket")
+        result = client.get_inventory_many([1000, 1001, 1002], max_workers=2)
+
+        assert list(result.results) == [1000, 1002]
+        assert list(result.errors) == [1001]
@@ -1,8 +1,12 @@
 """Tests for S3 cache module."""
 
+import io
+import json
+import time
+from datetime import datetime, timedelta, timezone
 import pytest
 from unittest.mock import Mock, patch
-from villa_ecommerce_sdk.cache import S3Cache
+from villa_ecommerce_sdk.cache import S3Cache, CacheEntry, get_entries
 
 
 class TestS3Cache:
@@ -170,3 +174,223 @@ class TestS3Cache:
         # Should not raise exception
         cache.invalidate("test-key")
 
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_set_cached_stores_ttl_metadata(self, mock_boto3):
+        """Test TTL and store time are written as object metadata."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        cache = S3Cache(bucket_name="test-bucket")
+        cache.set_cached("test-key", {"test": "data"}, ttl=300)
+        
+        metadata = mock_s3.put_object.call_args[1]['Metadata']
+        assert float(metadata['villa-ttl']) == 300.0
+        assert float(metadata['villa-stored-at']) > 0
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_get_cached_expired(self, mock_boto3):
+        """Test expired entries are not returned by get_cached but remain readable as entries."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        mock_response = {
+            'Body': Mock(),
+            'Metadata': {'villa-stored-at': str(time.time() - 600), 'villa-ttl': '300'}
+        }
+        mock_response['Body'].read.return_value = b'{"test": "data"}'
+        mock_s3.get_object.return_value = mock_response
+        
+        cache = S3Cache(bucket_name="test-bucket")
+        assert cache.get_cached("test-key") is None
+        
+        mock_response['Body'].read.return_value = b'{"test": "data"}'
+        entry = cache.get_entry("test-key")
+        assert entry.data == {"test": "data"}
+        assert entry.ttl == 300.0
+        assert not entry.is_fresh()
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_get_cached_max_age_uses_last_modified(self, mock_boto3):
+        """Test legacy entries without metadata fall back to LastModified for max-age checks."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        mock_response = {
+            'Body': Mock(),
+            'LastModified': datetime.now(timezone.utc) - timedelta(seconds=120)
+        }
+        mock_response['Body'].read.return_value = b'{"test": "data"}'
+        mock_s3.get_object.return_value = mock_response
+        
+        cache = S3Cache(bucket_name="test-bucket")
+        assert cache.get_cached("test-key", max_age=60) is None
+        
+        mock_response['Body'].read.return_value = b'{"test": "data"}'
+        assert cache.get_cached("test-key", max_age=600) == {"test": "data"}
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_entry_validators_roundtrip(self, mock_boto3):
+        """Test ETag/Last-Modified are written to and read from metadata."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        cache = S3Cache(bucket_name="test-bucket")
+        cache.set_entry("test-key", CacheEntry(
+            data={"test": "data"}, stored_at=1000.0, ttl=60,
+            etag='"abc"', last_modified="Wed, 21 Oct 2026 07:28:00 GMT"
+        ))
+        put_args = mock_s3.put_object.call_args[1]
+        metadata = put_args['Metadata']
+        assert metadata['villa-etag'] == '"abc"'
+        
+        mock_s3.get_object.return_value = {'Body': io.BytesIO(put_args['Body']), 'Metadata': metadata}
+        entry = cache.get_entry("test-key")
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert entry.stored_at == 1000.0
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_touch_copies_in_place(self, mock_boto3):
+        """Test touch replaces metadata with a server-side copy."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        mock_s3.head_object.return_value = {'Metadata': {}}
+        
+        cache = S3Cache(bucket_name="test-bucket")
+        cache.touch("test-key", CacheEntry(data=None, stored_at=2000.0, ttl=60, etag='"abc"'))
+        
+        mock_s3.put_object.assert_not_called()
+        call_args = mock_s3.copy_object.call_args[1]
+        assert call_args['CopySource'] == {'Bucket': "test-bucket", 'Key': "villa-sdk/test-key"}
+        assert call_args['MetadataDirective'] == 'REPLACE'
+        assert float(call_args['Metadata']['villa-stored-at']) == 2000.0
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_touch_keeps_entry_codec(self, mock_boto3):
+        """Test touch preserves the codec the body was written with."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        
+        mock_s3.head_object.return_value = {'Metadata': {'villa-codec': "json"}}
+        
+        cache = S3Cache(bucket_name="test-bucket", codec="json+gzip")
+        cache.touch("test-key", CacheEntry(data=None, stored_at=2000.0, codec="msgpack+zstd"))
+        
+        call_args = mock_s3.copy_object.call_args[1]
+        assert call_args['Metadata']['villa-codec'] == "json"
+        assert call_args['ContentType'] == "application/json"
+        assert 'ContentEncoding' not in call_args
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_set_cached_compresses_with_codec(self, mock_boto3):
+        """Test new entries are compressed when configured and tagged with their codec."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        data = {"products": [{"sku": i, "name": "Item"} for i in range(200)]}
+        
+        # The default stays plain JSON, readable by SDK versions without codecs
+        S3Cache(bucket_name="test-bucket").set_cached("test-key", data)
+        assert json.loads(mock_s3.put_object.call_args[1]['Body']) == data
+        
+        cache = S3Cache(bucket_name="test-bucket", codec="json+gzip")
+        cache.set_cached("test-key", data)
+        
+        put_args = mock_s3.put_object.call_args[1]
+        assert put_args['Metadata']['villa-codec'] == "json+gzip"
+        assert put_args['ContentEncoding'] == "gzip"
+        assert len(put_args['Body']) < len(json.dumps(data)) / 5
+        
+        mock_s3.get_object.return_value = {
+            'Body': io.BytesIO(put_args['Body']), 'Metadata': put_args['Metadata']
+        }
+        assert cache.get_cached("test-key") == data
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_legacy_entry_without_codec(self, mock_boto3):
+        """Test entries without codec metadata are read as plain JSON."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        mock_s3.get_object.return_value = {
+            'Body': io.BytesIO(b'{"test": "data"}'),
+            'Metadata': {'villa-stored-at': repr(time.time())}
+        }
+        
+        cache = S3Cache(bucket_name="test-bucket", codec="json+gzip")
+        entry = cache.get_entry("test-key")
+        assert entry.data == {"test": "data"}
+        assert entry.codec == "json"
+
+
+class TestGetEntries:
+    """Test cases for batched entry reads."""
+
+    def test_s3_concurrent_gets_skip_missing(self):
+        """Test S3Cache.get_entries fetches keys concurrently and omits missing ones."""
+        from botocore.exceptions import ClientError
+
+        def get_object(Bucket, Key):
+            if Key.endswith("missing.json"):
+                raise ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+            body = Mock()
+            body.read.return_value = json.dumps({"key": Key}).encode()
+            return {'Body': body}
+
+        cache = S3Cache(bucket_name="test-bucket")
+        cache.s3_client = Mock()
+        cache.s3_client.get_object.side_effect = get_object
+
+        entries = get_entries(cache, ["a.json", "missing.json", "b.json", "a.json"])
+
+        assert {k: e.data for k, e in entries.items()} == {
+            "a.json": {"key": "villa-sdk/a.json"},
+            "b.json": {"key": "villa-sdk/b.json"},
+        }
+        assert cache.s3_client.get_object.call_count == 3
+
+    def test_falls_back_to_single_reads(self):
+        """Test backends without get_entries are read key by key."""
+        backend = Mock(spec=["get_entry"])
+        backend.get_entry.side_effect = lambda key: CacheEntry(key) if key != "x" else None
+
+        assert {k: e.data for k, e in get_entries(backend, ["x", "y"]).items()} == {"y": "y"}
+
+
+class TestCacheEntry:
+    """Test cases for CacheEntry freshness rules."""
+    
+    def test_no_ttl_is_always_fresh(self):
+        """Test entries without TTL never expire."""
+        entry = CacheEntry(data={}, stored_at=0.0)
+        assert entry.is_fresh(now=1e9)
+        assert not entry.is_fresh(max_age=10, now=100)
+    
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL."""
+        entry = CacheEntry(data={}, stored_at=1000.0, ttl=60)
+        assert entry.age(now=1030.0) == 30.0
+        assert entry.is_fresh(now=1030.0)
+        assert not entry.is_fresh(now=1060.0)
+    
+    def test_stale_while_revalidate_window(self):
+        """Test stale entries are servable only inside the window."""
+        entry = CacheEntry(data={}, stored_at=1000.0, ttl=60)
+        assert entry.is_stale_servable(30, now=1080.0)
+        assert not entry.is_stale_servable(30, now=1100.0)
+        assert not entry.is_stale_servable(0, now=1070.0)
+    
+    def test_unknown_age(self):
+        """Test entries without store time are fresh only when unbounded."""
+        assert CacheEntry(data={}).is_fresh()
+        assert not CacheEntry(data={}, ttl=60).is_fresh()
+        assert not CacheEntry(data={}, ttl=60).is_stale_servable(60)
+    
+    def test_conditional_headers(self):
+        """Test validators map to conditional request headers."""
+        entry = CacheEntry(data={}, etag='"abc"', last_modified="Wed, 21 Oct 2026 07:28:00 GMT")
+        assert entry.conditional_headers() == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Wed, 21 Oct 2026 07:28:00 GMT"
+        }
+        assert CacheEntry(data={}).conditional_headers() == {}
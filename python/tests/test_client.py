@@ -33,7 +33,7 @@ class TestVillaClient:
         result = client.get_product_list(branch=1000)
         
         assert isinstance(result, pd.DataFrame)
-        mock_products_instance.get_product_list.assert_called_once_with(branch=1000)
+        mock_products_instance.get_product_list.assert_called_once_with(branch=1000, columns=None)
     
     @patch('villa_ecommerce_sdk.cache.S3Cache')
     @patch('villa_ecommerce_sdk.payments.PaymentService')
@@ -49,7 +49,7 @@ class TestVillaClient:
         result = client.get_inventory(branch=1000)
         
         assert isinstance(result, pd.DataFrame)
-        mock_inventory_instance.get_inventory.assert_called_once_with(branch=1000)
+        mock_inventory_instance.get_inventory.assert_called_once_with(branch=1000, columns=None)
     
     @patch('villa_ecommerce_sdk.cache.S3Cache')
     @patch('villa_ecommerce_sdk.payments.PaymentService')
@@ -102,8 +102,8 @@ class TestVillaClient:
         result = client.get_products_with_inventory(branch=1000)
         
         assert isinstance(result, pd.DataFrame)
-        mock_products_instance.get_product_list.assert_called_once_with(branch=1000)
-        mock_inventory_instance.get_inventory.assert_called_once_with(branch=1000)
+        mock_products_instance.get_product_list.assert_called_once_with(branch=1000, columns=None)
+        mock_inventory_instance.get_inventory.assert_called_once_with(branch=1000, columns=None)
     
     @patch('villa_ecommerce_sdk.cache.S3Cache')
     @patch('villa_ecommerce_sdk.payments.PaymentService')
@@ -198,7 +198,8 @@ class TestVillaClient:
         })
         
         # No common key - should use fallback
-        merged = client._merge_dataframes(products_df, inventory_df)
+        with pytest.warns(UserWarning):
+            merged = client._merge_dataframes(products_df, inventory_df)
         assert isinstance(merged, pd.DataFrame)
     
     @patch('villa_ecommerce_sdk.cache.S3Cache')
@@ -220,7 +221,8 @@ class TestVillaClient:
         })
         
         # Same length, no common key - should concat
-        merged = client._merge_dataframes(products_df, inventory_df)
+        with pytest.warns(UserWarning):
+            merged = client._merge_dataframes(products_df, inventory_df)
         assert isinstance(merged, pd.DataFrame)
         assert len(merged) == 2
     
@@ -243,7 +245,182 @@ class TestVillaClient:
         })
         
         # Different length - should return products copy
-        merged = client._merge_dataframes(products_df, inventory_df)
+        with pytest.warns(UserWarning):
+            merged = client._merge_dataframes(products_df, inventory_df)
         assert isinstance(merged, pd.DataFrame)
         assert len(merged) == 3
 
+
+
+class TestVillaClientLazyInit:
+    """Test cases for lazy construction of caches and services."""
+    
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    @patch('villa_ecommerce_sdk.payments.PaymentService')
+    @patch('villa_ecommerce_sdk.inventory.InventoryService')
+    @patch('villa_ecommerce_sdk.products.ProductsService')
+    def test_services_built_on_first_use(self, mock_products, mock_inventory, mock_payments, mock_cache):
+        """Test only the services actually used are constructed, once."""
+        client = VillaClient(s3_bucket="test-bucket")
+        mock_cache.assert_not_called()
+        mock_products.assert_not_called()
+        
+        service = client.payment_service
+        assert client.payment_service is service
+        mock_payments.assert_called_once()
+        assert mock_payments.call_args[1]['cache'] is mock_cache.return_value
+        mock_cache.assert_called_once_with(bucket_name="test-bucket", codec="json")
+        mock_products.assert_not_called()
+        mock_inventory.assert_not_called()
+    
+    @patch('villa_ecommerce_sdk.cache.boto3.client')
+    def test_s3_client_created_on_first_use(self, mock_boto3):
+        """Test the boto3 client is not created until S3 is accessed."""
+        client = VillaClient(s3_bucket="test-bucket")
+        assert client.cache is client.s3_cache
+        mock_boto3.assert_not_called()
+        
+        client.s3_cache.invalidate("k")
+        mock_boto3.assert_called_once_with('s3')
+    
+    def test_cache_setter_installs_backend(self):
+        """Test assigning client.cache replaces the cache, also in services already built."""
+        from villa_ecommerce_sdk.memory_cache import MemoryCache
+        client = VillaClient(s3_bucket="test-bucket")
+        service = client.payment_service
+        
+        cache = MemoryCache()
+        client.cache = cache
+        assert client.cache is cache
+        assert client.s3_cache is None
+        assert service.cache is cache
+        assert client.products_service.cache is cache
+    
+    def test_import_and_payment_path_skip_pandas_and_boto3(self):
+        """Test importing the SDK and using payments loads neither pandas nor boto3/botocore."""
+        import os
+        import subprocess
+        import sys
+        code = (
+            "import sys\n"
+            "import villa_ecommerce_sdk\n"
+            "assert 'villa_ecommerce_sdk.client' not in sys.modules\n"
+            "client = villa_ecommerce_sdk.VillaClient()\n"
+            "client.payment_service\n"
+            "print(sorted(m for m in ('pandas', 'boto3', 'botocore') if m in sys.modules))\n"
+        )
+        src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+        env = dict(os.environ, PYTHONPATH=src)
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+    
+    def test_lazy_package_exports(self):
+        """Test every public name resolves through the lazy package exports."""
+        import villa_ecommerce_sdk
+        for name in villa_ecommerce_sdk.__all__:
+            assert getattr(villa_ecommerce_sdk, name) is not None
+        assert 'VillaClient' in dir(villa_ecommerce_sdk)
+        with pytest.raises(AttributeError):
+            villa_ecommerce_sdk.NotAName
+
+
+class TestIndexedMerge:
+    """Test cases for key-aware product/inventory merges."""
+    
+    def test_matches_unindexed_outer_merge(self):
+        """Test the indexed join returns what pd.merge on the key returns."""
+        from villa_ecommerce_sdk.frames import merge_dataframes
+        products_df = pd.DataFrame({"name": ["c", "a", "b"], "sku": ["S3", "S1", "S2"], "price": [3, 1, 2]})
+        inventory_df = pd.DataFrame({"sku": ["S2", "S4", "S1"], "price": [20, 40, 10], "stock": [5, 6, 7]})
+        
+        merged = merge_dataframes(products_df, inventory_df)
+        expected = pd.merge(products_df, inventory_df, on="sku", how="outer",
+                            suffixes=("_product", "_inventory"))
+        pd.testing.assert_frame_equal(merged, expected)
+    
+    def test_explicit_join_key_with_different_names(self):
+        """Test (products column, inventory column) keys, including numeric vs text ids."""
+        from villa_ecommerce_sdk.frames import merge_dataframes
+        products_df = pd.DataFrame({"id": [2, 1], "name": ["b", "a"]})
+        inventory_df = pd.DataFrame({"productId": ["1", "2"], "id": ["x", "y"], "stock": [10, 20]})
+        
+        merged = merge_dataframes(products_df, inventory_df, join_key=("id", "productId"), how="left")
+        
+        assert merged["id"].tolist() == ["1", "2"]
+        assert merged["id_inventory"].tolist() == ["x", "y"]
+        assert merged["stock"].tolist() == [10, 20]
+        assert "productId" not in merged.columns
+    
+    def test_explicit_join_key_must_exist(self):
+        """Test a configured key missing from either frame is an error, not a fallback."""
+        from villa_ecommerce_sdk.frames import merge_dataframes
+        with pytest.raises(ValueError, match="inventory"):
+            merge_dataframes(pd.DataFrame({"sku": [1]}), pd.DataFrame({"id": [1]}), join_key="sku")
+
+
+class TestMergedView:
+    """Test cases for the cached merged view in get_products_with_inventory."""
+    
+    def _client(self):
+        from villa_ecommerce_sdk.memory_cache import MemoryCache
+        from villa_ecommerce_sdk.transport import HTTPTransport
+        
+        def request(method, url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {}
+            if "/product/" in url:
+                response.json.return_value = {"products": [{"sku": "A", "price": 1.0}, {"sku": "B", "price": 2.0}]}
+            else:
+                response.json.return_value = {"inventory": [{"sku": "A", "quantity": 3}]}
+            return response
+        
+        transport = Mock(spec=HTTPTransport)
+        transport.request.side_effect = request
+        return VillaClient(use_s3_cache=False, memory_cache=MemoryCache(), transport=transport,
+                           join_key="sku")
+    
+    def test_reused_until_an_input_changes(self):
+        """Test the join runs once per version of the cached inputs."""
+        from villa_ecommerce_sdk.frames import merge_dataframes
+        client = self._client()
+        with patch('villa_ecommerce_sdk.frames.merge_dataframes', wraps=merge_dataframes) as merge:
+            first = client.get_products_with_inventory(branch=1000)
+            second = client.get_products_with_inventory(branch=1000)
+            assert merge.call_count == 1
+            pd.testing.assert_frame_equal(first, second)
+            assert first is not second
+            
+            client.memory_cache.invalidate("inventory/1000.json")
+            client.get_products_with_inventory(branch=1000)
+            assert merge.call_count == 2
+            
+            filtered = client.get_products_with_inventory(branch=1000, filters={"sku": "B"})
+            assert merge.call_count == 2
+            assert filtered["sku"].tolist() == ["B"]
+    
+    def test_uncached_inputs_always_merge(self):
+        """Test frames without a known source version are merged on every call."""
+        client = VillaClient(use_s3_cache=False)
+        client.products_service._get = Mock(return_value={"products": [{"sku": "A"}]})
+        client.inventory_service._get = Mock(return_value={"inventory": [{"sku": "A", "quantity": 1}]})
+        with patch('villa_ecommerce_sdk.frames.merge_dataframes',
+                   return_value=pd.DataFrame({"sku": ["A"]})) as merge:
+            client.get_products_with_inventory(branch=1000)
+            client.get_products_with_inventory(branch=1000)
+        assert merge.call_count == 2
+    
+    def test_views_are_bounded_and_copied(self):
+        """Test the least recently used view is evicted and callers get independent frames."""
+        client = self._client()
+        client.MAX_MERGED_VIEWS = 2
+        first = client.get_products_with_inventory(branch=1)
+        first.loc[0, "price"] = 99.0
+        client.get_products_with_inventory(branch=2)
+        client.get_products_with_inventory(branch=1)
+        client.get_products_with_inventory(branch=3)
+        
+        assert [key[0] for key in client._merged_views] == [1, 3]
+        assert client.get_products_with_inventory(branch=1)["price"].tolist() == [1.0, 2.0]
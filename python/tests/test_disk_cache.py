@@ -0,0 +1,148 @@
+"""Tests for the local disk cache backend."""
+
+import os
+import time
+import pytest
+from unittest.mock import patch
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.client import VillaClient
+from villa_ecommerce_sdk.disk_cache import DiskCache
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.tiered_cache import TieredCache
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test data and metadata round-trip through a file."""
+        cache = DiskCache(str(tmp_path))
+        cache.set_entry("products/1000.json", CacheEntry(
+            {"products": [1, 2]}, stored_at=1000.0, ttl=60, etag='"abc"'
+        ))
+
+        assert os.path.isfile(tmp_path / "products" / "1000.json")
+        entry = cache.get_entry("products/1000.json")
+        assert entry.data == {"products": [1, 2]}
+        assert entry.stored_at == 1000.0
+        assert entry.ttl == 60
+        assert entry.etag == '"abc"'
+        assert cache.is_cached("products/1000.json")
+
+    def test_freshness(self, tmp_path):
+        """Test get_cached honours TTL and max_age."""
+        cache = DiskCache(str(tmp_path))
+        cache.set_cached("k.json", {"v": 1}, ttl=60)
+        assert cache.get_cached("k.json") == {"v": 1}
+        assert cache.get_cached("k.json", max_age=0) is None
+
+        cache.set_entry("old.json", CacheEntry({"v": 1}, stored_at=time.time() - 120, ttl=60))
+        assert cache.get_cached("old.json") is None
+        assert cache.get_entry("old.json").data == {"v": 1}
+
+    def test_missing_and_invalidate(self, tmp_path):
+        """Test misses and invalidation."""
+        cache = DiskCache(str(tmp_path))
+        assert cache.get_cached("missing.json") is None
+        assert not cache.is_cached("missing.json")
+
+        cache.set_cached("k.json", {"v": 1})
+        cache.invalidate("k.json")
+        assert not cache.is_cached("k.json")
+        assert cache.stats().size_bytes == 0
+
+    def test_writes_leave_no_temp_files(self, tmp_path):
+        """Test atomic writes replace the entry without leftovers."""
+        cache = DiskCache(str(tmp_path))
+        cache.set_cached("k.json", {"v": 1})
+        cache.set_cached("k.json", {"v": 2})
+
+        assert os.listdir(tmp_path) == ["k.json"]
+        assert cache.get_cached("k.json") == {"v": 2}
+        assert cache.stats().entries == 1
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Test least recently used entries are evicted past max_bytes."""
+        payload = {"blob": "x" * 1000}
+        cache = DiskCache(str(tmp_path), max_bytes=2500)
+        cache.set_cached("a.json", payload)
+        cache.set_cached("b.json", payload)
+        cache.get_cached("a.json")
+        cache.set_cached("c.json", payload)
+
+        assert cache.is_cached("a.json")
+        assert not cache.is_cached("b.json")
+        assert cache.is_cached("c.json")
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 2500
+
+    def test_mmap_read(self, tmp_path):
+        """Test large entries are read through a memory map."""
+        cache = DiskCache(str(tmp_path), mmap_threshold=0)
+        data = {"items": list(range(1000))}
+        cache.set_cached("big.json", data)
+        with patch('villa_ecommerce_sdk.disk_cache.mmap.mmap', wraps=__import__('mmap').mmap) as mapped:
+            assert cache.get_cached("big.json") == data
+        mapped.assert_called_once()
+
+    def test_compressed_codec(self, tmp_path):
+        """Test entries can use a compressed codec, including via mmap."""
+        data = {"items": ["same"] * 2000}
+        for threshold in (0, 1 << 30):
+            cache = DiskCache(str(tmp_path / str(threshold)), codec="json+gzip",
+                              mmap_threshold=threshold)
+            cache.set_cached("k.json", data)
+            assert cache.get_cached("k.json") == data
+            assert cache.get_entry("k.json").codec == "json+gzip"
+
+    def test_touch_keeps_payload(self, tmp_path):
+        """Test touch renews metadata and keeps the payload."""
+        cache = DiskCache(str(tmp_path))
+        cache.set_entry("k.json", CacheEntry({"v": 1}, stored_at=1000.0, ttl=60))
+        cache.touch("k.json", CacheEntry(None, stored_at=2000.0, ttl=60, etag='"e"'))
+
+        entry = cache.get_entry("k.json")
+        assert entry.data == {"v": 1}
+        assert entry.stored_at == 2000.0
+        assert entry.etag == '"e"'
+
+    def test_reopen_indexes_existing_files(self, tmp_path):
+        """Test a new instance picks up existing entries and drops temp files."""
+        DiskCache(str(tmp_path)).set_cached("k.json", {"v": 1})
+        (tmp_path / ".partial.tmp").write_bytes(b"garbage")
+
+        cache = DiskCache(str(tmp_path))
+        assert cache.stats().entries == 1
+        assert cache.get_cached("k.json") == {"v": 1}
+        assert not (tmp_path / ".partial.tmp").exists()
+
+    def test_rejects_keys_outside_directory(self, tmp_path):
+        """Test keys cannot escape the cache directory."""
+        cache = DiskCache(str(tmp_path / "cache"))
+        cache.set_cached("../escape.json", {"v": 1})
+        assert not (tmp_path / "escape.json").exists()
+        assert cache.get_cached("../escape.json") is None
+
+
+class TestClientDiskCache:
+    """Test cases for VillaClient disk cache wiring."""
+
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    def test_disk_tier_in_front_of_s3(self, mock_cache, tmp_path):
+        """Test the disk cache sits between memory and S3."""
+        memory = MemoryCache()
+        disk = DiskCache(str(tmp_path))
+        client = VillaClient(memory_cache=memory, disk_cache=disk)
+
+        assert isinstance(client.cache, TieredCache)
+        assert client.cache.tiers == [memory, disk, client.s3_cache]
+
+    def test_disk_instead_of_s3(self, tmp_path):
+        """Test the disk cache can replace S3 entirely."""
+        disk = DiskCache(str(tmp_path))
+        client = VillaClient(disk_cache=disk, use_s3_cache=False)
+
+        assert client.s3_cache is None
+        assert client.cache is disk
+        assert client.inventory_service.cache is disk
@@ -0,0 +1,82 @@
+"""Tests for compiled DataFrame filters."""
+
+import pandas as pd
+import pytest
+from villa_ecommerce_sdk.filters import Filter, compile_filter
+from villa_ecommerce_sdk.frames import filter_dataframe
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "sku": ["A", "B", "C", "D", "E"],
+        "name": ["Fresh Milk", "Bread", "Cheese", "milk powder", None],
+        "category": ["Dairy", "Bakery", "Dairy", "Dairy", "Snacks"],
+        "price": [45.0, 39.0, 250.0, 120.0, 15.0],
+        "stock": pd.array([10, 0, None, 4, 30], dtype="Int32"),
+    })
+
+
+def _skus(frame):
+    return frame["sku"].tolist()
+
+
+class TestFilter:
+    """Test cases for Filter."""
+
+    def test_all_operators_in_one_dict_apply(self, df):
+        """Test every operator of a column dict is honored, not just the first."""
+        assert _skus(filter_dataframe(df, {"price": {"gt": 20, "lt": 200}})) == ["A", "B", "D"]
+        assert _skus(filter_dataframe(df, {"price": {"between": [39, 120], "ne": 45.0}})) == ["B", "D"]
+
+    def test_membership_and_text(self, df):
+        """Test in / nin / contains / icontains."""
+        assert _skus(filter_dataframe(df, {"category": ["Bakery", "Snacks"]})) == ["B", "E"]
+        assert _skus(filter_dataframe(df, {"category": {"nin": ["Dairy"]}})) == ["B", "E"]
+        assert _skus(filter_dataframe(df, {"name": {"contains": "milk"}})) == ["D"]
+        assert _skus(filter_dataframe(df, {"name": {"icontains": "MILK"}})) == ["A", "D"]
+
+    def test_nulls(self, df):
+        """Test null checks and that missing values never match comparisons."""
+        assert _skus(filter_dataframe(df, {"stock": None})) == ["C"]
+        assert _skus(filter_dataframe(df, {"stock": {"isnull": False, "lt": 5}})) == ["B", "D"]
+        assert _skus(filter_dataframe(df, {"stock": {"gte": 0}})) == ["A", "B", "D", "E"]
+
+    def test_combinators(self, df):
+        """Test $and, $or and $not, including nesting."""
+        spec = {
+            "$or": [{"category": "Bakery"}, {"price": {"gte": 200}}],
+            "$not": {"sku": "B"},
+        }
+        assert _skus(filter_dataframe(df, spec)) == ["C"]
+        spec = {"$and": [{"category": "Dairy"}, {"$not": {"$or": [{"sku": "A"}, {"sku": "C"}]}}]}
+        assert _skus(filter_dataframe(df, spec)) == ["D"]
+
+    def test_missing_columns_are_ignored(self, df):
+        """Test criteria on absent columns do not constrain the result."""
+        assert len(filter_dataframe(df, {"brand": "X"})) == 5
+        assert _skus(filter_dataframe(df, {"$or": [{"brand": "X"}, {"sku": "E"}]})) == ["E"]
+
+    def test_invalid_specs_fail_at_compile_time(self):
+        """Test unknown operators and malformed arguments raise when compiled."""
+        with pytest.raises(ValueError, match="operator"):
+            Filter({"price": {"greater": 1}})
+        with pytest.raises(ValueError, match="combinator"):
+            Filter({"$xor": []})
+        with pytest.raises(ValueError):
+            Filter({"price": {"between": 5}})
+        with pytest.raises(TypeError):
+            Filter(["price"])
+
+    def test_reusable_across_frames(self, df):
+        """Test one compiled filter applies to any frame without copying it first."""
+        in_stock = compile_filter({"stock": {"gt": 0}})
+        assert compile_filter(in_stock) is in_stock
+        assert _skus(in_stock(df)) == ["A", "D", "E"]
+        other = pd.DataFrame({"sku": ["X", "Y"], "stock": [0, 2]})
+        assert _skus(in_stock.apply(other)) == ["Y"]
+        assert in_stock.mask(other).tolist() == [False, True]
+
+        result = filter_dataframe(df, in_stock)
+        result.loc[:, "price"] = 0.0
+        assert df["price"].iloc[0] == 45.0
@@ -0,0 +1,192 @@
+"""Tests for the Parquet DataFrame cache."""
+
+import os
+import time
+import pytest
+import pandas as pd
+from unittest.mock import Mock, patch
+
+pytest.importorskip("pyarrow")
+
+from villa_ecommerce_sdk.frame_cache import ParquetFrameCache, frame_key
+from villa_ecommerce_sdk.products import ProductsService
+from villa_ecommerce_sdk.schema import PRODUCT_SCHEMA
+
+
+def _frame():
+    return pd.DataFrame({
+        "sku": ["A1", "B2", "C3"],
+        "price": [10.5, 20.0, 7.25],
+        "stock": [5, 0, 12],
+    })
+
+
+class TestParquetFrameCache:
+    """Test cases for ParquetFrameCache."""
+
+    def test_requires_a_location(self):
+        """Test a directory or bucket is required."""
+        with pytest.raises(ValueError):
+            ParquetFrameCache()
+
+    def test_iter_frames_fixed_size_chunks(self, tmp_path):
+        """Test cached frames are read back in fixed-size chunks across row groups."""
+        import pyarrow as pa
+        from villa_ecommerce_sdk.frame_cache import _rebatch
+
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        cache.set_frame("products/1000.parquet", _frame(), ttl=60)
+        chunks = list(cache.iter_frames("products/1000.parquet", 2, columns=["sku", "x"]))
+        assert [list(c["sku"]) for c in chunks] == [["A1", "B2"], ["C3"]]
+        assert cache.iter_frames("missing.parquet", 2) is None
+
+        batches = pa.Table.from_pandas(pd.DataFrame({"n": range(9)})).to_batches(max_chunksize=3)
+        assert [list(c["n"]) for c in _rebatch(iter(batches), 4)] == [
+            [0, 1, 2, 3], [4, 5, 6, 7], [8]
+        ]
+
+    def test_disk_roundtrip_keeps_dtypes(self, tmp_path):
+        """Test frames round-trip through disk with typed columns."""
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        cache.set_frame("products/1000.parquet", _frame())
+
+        assert os.path.exists(tmp_path / "products" / "1000.parquet")
+        result = cache.get_frame("products/1000.parquet")
+        pd.testing.assert_frame_equal(result, _frame())
+        assert result["stock"].dtype == "int64"
+
+    def test_column_projection(self, tmp_path):
+        """Test only requested columns are loaded; unknown ones are ignored."""
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        cache.set_frame("products/1000.parquet", _frame())
+
+        result = cache.get_frame("products/1000.parquet", columns=["sku", "stock", "missing"])
+        assert list(result.columns) == ["sku", "stock"]
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test entries past their TTL or max_age are not returned."""
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        cache.set_frame("products/1000.parquet", _frame(), ttl=60)
+        assert cache.get_frame("products/1000.parquet") is not None
+
+        with patch('villa_ecommerce_sdk.cache.time.time', return_value=time.time() + 120):
+            assert cache.get_frame("products/1000.parquet") is None
+        assert cache.get_frame("products/1000.parquet", max_age=0) is None
+
+    def test_missing_and_invalidate(self, tmp_path):
+        """Test misses return None and invalidate removes the file."""
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        assert cache.get_frame("products/1.parquet") is None
+        cache.set_frame("products/1.parquet", _frame())
+        cache.invalidate("products/1.parquet")
+        assert cache.get_frame("products/1.parquet") is None
+
+    def test_unencodable_frame_is_skipped(self, tmp_path):
+        """Test frames Arrow cannot type are not cached and do not raise."""
+        cache = ParquetFrameCache(directory=str(tmp_path))
+        cache.set_frame("x.parquet", pd.DataFrame({"mixed": [1, "a", {"b": 2}]}))
+        assert cache.get_frame("x.parquet") is None
+
+    @patch('villa_ecommerce_sdk.frame_cache.boto3.client')
+    def test_s3_hit_writes_through_to_disk(self, mock_boto3, tmp_path):
+        """Test S3 hits are served and copied to the local directory."""
+        mock_s3 = Mock()
+        mock_boto3.return_value = mock_s3
+        writer = ParquetFrameCache(bucket_name="test-bucket")
+        writer.set_frame("inventory/1000.parquet", _frame())
+        put_args = mock_s3.put_object.call_args[1]
+        assert put_args['Key'] == "villa-sdk/frames/inventory/1000.parquet"
+
+        body = Mock()
+        body.read.return_value = put_args['Body']
+        mock_s3.get_object.return_value = {'Body': body}
+        cache = ParquetFrameCache(directory=str(tmp_path), bucket_name="test-bucket")
+
+        result = cache.get_frame("inventory/1000.parquet", columns=["sku"])
+        assert list(result["sku"]) == ["A1", "B2", "C3"]
+        assert os.path.exists(tmp_path / "inventory" / "1000.parquet")
+
+    def test_frame_key(self):
+        """Test JSON cache keys map to Parquet keys."""
+        assert frame_key("products/1000.json") == "products/1000.parquet"
+
+
+class TestServiceFrameCache:
+    """Test cases for services backed by a frame cache."""
+
+    def test_hit_skips_json_fetch(self, tmp_path):
+        """Test a frame cache hit does not touch the JSON path."""
+        frames = ParquetFrameCache(directory=str(tmp_path))
+        frames.set_frame("products/1000.parquet", _frame())
+        service = ProductsService(base_url="https://api.example.com", frame_cache=frames)
+        service._get = Mock()
+
+        result = service.get_product_list(branch=1000, columns=["sku", "price"])
+
+        service._get.assert_not_called()
+        assert list(result.columns) == ["sku", "price"]
+
+    def test_hit_carries_source_version(self, tmp_path):
+        """Test frames loaded from Parquet are versioned by their store time."""
+        from villa_ecommerce_sdk.base import SOURCE_VERSION_ATTR
+        from villa_ecommerce_sdk.cache import STORED_AT_METADATA
+        frames = ParquetFrameCache(directory=str(tmp_path))
+        frames.set_frame("products/1000.parquet", _frame())
+        service = ProductsService(base_url="https://api.example.com", frame_cache=frames)
+
+        first = service.get_product_list(branch=1000)
+        second = service.get_product_list(branch=1000)
+
+        assert first.attrs[SOURCE_VERSION_ATTR] == second.attrs[SOURCE_VERSION_ATTR]
+        assert first.attrs[SOURCE_VERSION_ATTR][0] == "frame"
+        assert STORED_AT_METADATA not in first.attrs
+
+    def test_miss_populates_frame_cache(self, tmp_path):
+        """Test a miss builds the DataFrame once and stores it."""
+        frames = ParquetFrameCache(directory=str(tmp_path))
+        service = ProductsService(base_url="https://api.example.com", frame_cache=frames)
+        service._get = Mock(return_value={"products": _frame().to_dict("records")})
+
+        first = service.get_product_list(branch=1000, columns=["sku"])
+        second = service.get_product_list(branch=1000)
+
+        assert list(first.columns) == ["sku"]
+        assert service._get.call_count == 1
+        pd.testing.assert_frame_equal(second, PRODUCT_SCHEMA.apply(_frame()))
+
+    def test_stale_json_entry_not_stored_as_fresh(self, tmp_path):
+        """Test frames keep their source's age and stale entries never reach the frame cache."""
+        from villa_ecommerce_sdk.cache import CacheEntry, STORED_AT_METADATA
+        from villa_ecommerce_sdk.memory_cache import MemoryCache
+        frames = ParquetFrameCache(directory=str(tmp_path))
+        cache = MemoryCache(default_ttl=None, ttls={})
+        service = ProductsService(
+            base_url="https://api.example.com", cache=cache, frame_cache=frames,
+            cache_ttl=60, stale_while_revalidate=3600
+        )
+        service._refresh_in_background = Mock()
+        records = {"products": _frame().to_dict("records")}
+
+        cache.set_entry("products/1.json", CacheEntry(records, stored_at=time.time() - 120, ttl=60))
+        assert len(service.get_product_list(branch=1)) == 3
+        service._refresh_in_background.assert_called_once()
+        assert frames.get_frame("products/1.parquet") is None
+
+        stored_at = time.time() - 50
+        cache.set_entry("products/2.json", CacheEntry(records, stored_at=stored_at, ttl=60))
+        service.get_product_list(branch=2)
+        assert frames.get_frame("products/2.parquet").attrs[STORED_AT_METADATA] == stored_at
+        assert frames.get_frame("products/2.parquet", max_age=30) is None
+
+    def test_service_ttl_bounds_frame_hits(self, tmp_path):
+        """Test frames older than the service TTL are refetched, even when stored without a TTL."""
+        frames = ParquetFrameCache(directory=str(tmp_path))
+        frames.set_frame("products/1000.parquet", _frame(), stored_at=time.time() - 120)
+        service = ProductsService(base_url="https://api.example.com", frame_cache=frames, cache_ttl=60)
+        service._stream_records = Mock(return_value=iter(_frame().to_dict("records")))
+        service._get = Mock(return_value={"products": _frame().to_dict("records")})
+
+        assert len(list(service.iter_products(branch=1000, chunk_size=2))) == 2
+        service._stream_records.assert_called_once()
+        service.get_product_list(branch=1000)
+        service._get.assert_called_once()
@@ -0,0 +1,179 @@
+"""Tests for hedged requests."""
+
+import threading
+import time
+import pytest
+from villa_ecommerce_sdk.base import BaseService
+from villa_ecommerce_sdk.client import VillaClient
+from villa_ecommerce_sdk.hedging import Hedger
+
+
+class DummyService(BaseService):
+    """Minimal concrete service for exercising BaseService."""
+
+    def get_service_name(self) -> str:
+        return "DummyService"
+
+
+def _hedger(**kwargs):
+    kwargs.setdefault('initial_delay', 0.02)
+    kwargs.setdefault('min_delay', 0.0)
+    kwargs.setdefault('budget', 1.0)
+    return Hedger(**kwargs)
+
+
+def _calls(*behaviours):
+    """Build a callable whose n-th invocation sleeps then returns or raises."""
+    lock = threading.Lock()
+    queue = list(behaviours)
+
+    def fn():
+        with lock:
+            delay, outcome = queue.pop(0)
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return fn
+
+
+def _answering(transport, *behaviours):
+    """Make a mock transport answer requests through _calls(*behaviours)."""
+    fn = _calls(*behaviours)
+    transport.request.side_effect = lambda *args, **kwargs: fn()
+    return transport
+
+
+class TestHedger:
+    """Test cases for Hedger."""
+
+    def test_fast_request_not_hedged(self):
+        """Test answers inside the hedge delay send no second request."""
+        hedger = _hedger()
+        assert hedger.run("r", _calls((0, "a"))) == "a"
+        stats = hedger.stats()
+        assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 0, 0)
+
+    def test_slow_request_hedged_and_hedge_wins(self):
+        """Test a slow first attempt is raced by a hedge that answers first."""
+        hedger = _hedger()
+        fn = _calls((0.5, "slow"), (0, "fast"))
+
+        started = time.monotonic()
+        assert hedger.run("r", fn) == "fast"
+        assert time.monotonic() - started < 0.3
+        stats = hedger.stats()
+        assert (stats.hedges, stats.hedge_wins) == (1, 1)
+        assert stats.win_rate == 1.0
+
+    def test_primary_can_still_win(self):
+        """Test the original answer is used if it finishes before the hedge."""
+        hedger = _hedger()
+        assert hedger.run("r", _calls((0.05, "first"), (0.5, "hedge"))) == "first"
+        assert hedger.stats().hedge_wins == 0
+
+    def test_failed_attempt_falls_back_to_other(self):
+        """Test one failing attempt does not fail the request."""
+        hedger = _hedger()
+        fn = _calls((0.05, ValueError("boom")), (0.1, "ok"))
+        assert hedger.run("r", fn) == "ok"
+
+        fn = _calls((0.05, ValueError("first")), (0, ValueError("second")))
+        with pytest.raises(ValueError, match="first"):
+            hedger.run("r", fn)
+
+    def test_budget_caps_hedges(self):
+        """Test hedges stop once the token budget is spent."""
+        hedger = _hedger(budget=0.5, max_tokens=1.0)
+        for _ in range(4):
+            hedger.run("r", _calls((0.05, "slow"), (0.05, "slow")))
+
+        stats = hedger.stats()
+        assert stats.requests == 4
+        assert stats.hedges == 2
+        assert stats.budget_denied == 2
+
+    def test_first_slow_request_hedged(self):
+        """Test the token bucket starts full so a cold hedger can hedge."""
+        hedger = Hedger(initial_delay=0.02, min_delay=0.0)
+        assert hedger.run("r", _calls((0.3, "slow"), (0, "fast"))) == "fast"
+        assert hedger.stats().hedges == 1
+
+    def test_latency_excludes_queue_wait(self):
+        """Test latency samples start when the attempt runs, not when it is queued."""
+        hedger = _hedger(max_workers=1)
+        executor = hedger._get_executor()
+        executor.submit(time.sleep, 0.2)
+        hedger._submit(executor, "r", lambda: "ok", None).result()
+        assert max(hedger._latencies["r"]) < 0.1
+        hedger.close()
+
+    def test_upstream_failures_not_successes(self):
+        """Test failed answers lose to the hedge and are never sampled as latency."""
+        hedger = _hedger()
+
+        def is_failure(status):
+            return status >= 500
+
+        assert hedger.run("r", _calls((0, 503)), is_failure=is_failure) == 503
+        assert "r" not in hedger._latencies
+
+        assert hedger.run("r", _calls((0.05, 503), (0.1, 200)), is_failure=is_failure) == 200
+        assert hedger.stats().hedge_wins == 1
+        assert len(hedger._latencies["r"]) == 1
+
+    def test_delay_tracks_latency_percentile(self):
+        """Test the hedge delay follows the observed latency percentile."""
+        hedger = Hedger(percentile=90, min_samples=10, min_delay=0.0)
+        assert hedger.delay("r") == hedger.initial_delay
+        for latency in range(1, 11):
+            hedger._record("r", latency / 100)
+        assert hedger.delay("r") == pytest.approx(0.09)
+        assert hedger.delay("other") == hedger.initial_delay
+
+
+class TestBaseServiceHedging:
+    """Test cases for hedging in BaseService."""
+
+    def test_get_is_hedged(self, make_response, make_transport):
+        """Test a slow GET is answered by its hedge."""
+        transport = _answering(
+            make_transport(),
+            (0.5, make_response({"v": "slow"})), (0, make_response({"v": "fast"}))
+        )
+        service = DummyService("https://api.example.com", transport=transport, hedger=_hedger())
+
+        assert service._get("/x") == {"v": "fast"}
+        assert transport.request.call_count == 2
+
+    def test_post_is_never_hedged(self, make_response, make_transport):
+        """Test non-idempotent requests are sent once."""
+        transport = _answering(make_transport(), (0.1, make_response({"ok": True})))
+        hedger = _hedger()
+        service = DummyService("https://api.example.com", transport=transport, hedger=hedger)
+
+        assert service._post("/api/payment/create", json_data={"amount": 1}) == {"ok": True}
+        assert transport.request.call_count == 1
+        assert hedger.stats().requests == 0
+
+
+class TestClientHedging:
+    """Test cases for VillaClient hedging wiring."""
+
+    def test_catalogue_services_share_hedger(self):
+        """Test hedging applies to product and inventory GETs only."""
+        client = VillaClient(use_s3_cache=False, hedging=True)
+
+        assert client.products_service.hedger is client.hedger
+        assert client.inventory_service.hedger is client.hedger
+        assert client.payment_service.hedger is None
+        assert client.get_hedging_stats().requests == 0
+        client.close()
+
+    def test_disabled_by_default(self):
+        """Test hedging is opt-in."""
+        client = VillaClient(use_s3_cache=False)
+        assert client.hedger is None
+        assert client.products_service.hedger is None
+        assert client.get_hedging_stats().hedges == 0
@@ -1,10 +1,11 @@
 """Tests for InventoryService."""
 
+import time
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
 from villa_ecommerce_sdk.inventory import InventoryService
-from villa_ecommerce_sdk.cache import S3Cache
+from villa_ecommerce_sdk.cache import S3Cache, CacheEntry
 
 
 class TestInventoryService:
@@ -42,14 +43,14 @@ class TestInventoryService:
         ]
         
         cache = Mock(spec=S3Cache)
-        cache.get_cached.return_value = cached_data
+        cache.get_entry.return_value = CacheEntry(data=cached_data, stored_at=time.time())
         
         service = InventoryService(base_url="https://api.example.com", cache=cache)
         result = service.get_inventory(branch=1000)
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 2
-        cache.get_cached.assert_called_once_with("inventory/1000.json")
+        cache.get_entry.assert_called_once_with("inventory/1000.json")
     
     def test_get_inventory_dict_with_inventory_key(self):
         """Test parsing dict response with 'inventory' key."""
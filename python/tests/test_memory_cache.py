@@ -0,0 +1,134 @@
+"""Tests for in-process memory cache."""
+
+import pytest
+from unittest.mock import Mock, patch
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.tiered_cache import TieredCache
+from villa_ecommerce_sdk.client import VillaClient
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test hits and misses are counted."""
+        cache = MemoryCache()
+        assert cache.get_cached("products/1000.json") is None
+
+        cache.set_cached("products/1000.json", [{"id": 1}])
+        assert cache.get_cached("products/1000.json") == [{"id": 1}]
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+        assert stats.hit_ratio == 0.5
+
+    def test_prefix_ttls(self):
+        """Test the longest matching prefix sets the TTL."""
+        cache = MemoryCache(
+            default_ttl=100,
+            ttls={"inventory/": 10, "inventory/hot/": 1, "products/": 1000}
+        )
+        assert cache.ttl_for("inventory/1000.json") == 10
+        assert cache.ttl_for("inventory/hot/1000.json") == 1
+        assert cache.ttl_for("products/1000.json") == 1000
+        assert cache.ttl_for("payments/PAY-1.json") == 100
+
+    def test_entries_expire(self, clock):
+        """Test expired entries are dropped on read."""
+        cache = MemoryCache(ttls={"inventory/": 10, "products/": 1000}, clock=clock)
+        cache.set_cached("inventory/1000.json", {"stock": 1})
+        cache.set_cached("products/1000.json", {"name": "A"})
+
+        clock.now = 11
+        assert cache.get_cached("inventory/1000.json") is None
+        assert cache.is_cached("inventory/1000.json") is False
+        assert cache.get_cached("products/1000.json") == {"name": "A"}
+        assert cache.stats().expirations == 1
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = MemoryCache(max_entries=2, default_ttl=None)
+        cache.set_cached("a", 1)
+        cache.set_cached("b", 2)
+        cache.get_cached("a")
+        cache.set_cached("c", 3)
+
+        assert cache.get_cached("b") is None
+        assert cache.get_cached("a") == 1
+        assert cache.get_cached("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a zero TTL prefix is never stored."""
+        cache = MemoryCache(ttls={"payments/": 0})
+        cache.set_cached("payments/PAY-1.json", {"status": "pending"})
+        assert cache.is_cached("payments/PAY-1.json") is False
+
+    def test_invalidate_and_clear(self):
+        """Test explicit removal."""
+        cache = MemoryCache(default_ttl=None)
+        cache.set_cached("a", 1)
+        cache.set_cached("b", 2)
+        cache.invalidate("a")
+        assert cache.get_cached("a") is None
+        cache.clear()
+        assert cache.stats().size == 0
+
+
+class TestTieredCache:
+    """Test cases for TieredCache."""
+
+    def test_requires_tiers(self):
+        """Test an empty tier list is rejected."""
+        with pytest.raises(ValueError):
+            TieredCache([])
+
+    def test_backfills_faster_tier(self):
+        """Test a slow-tier hit populates the memory tier."""
+        memory = MemoryCache(default_ttl=None)
+        durable = MemoryCache(default_ttl=None)
+        durable.set_cached("products/1000.json", [{"id": 1}])
+        cache = TieredCache([memory, durable])
+
+        assert cache.get_cached("products/1000.json") == [{"id": 1}]
+        assert memory.get_cached("products/1000.json") == [{"id": 1}]
+
+    def test_write_and_invalidate_all_tiers(self):
+        """Test writes and invalidations reach every tier."""
+        memory = MemoryCache(default_ttl=None)
+        durable = MemoryCache(default_ttl=None)
+        cache = TieredCache([memory, durable])
+
+        cache.set_cached("k", 1)
+        assert memory.is_cached("k") and durable.is_cached("k")
+        assert cache.is_cached("k")
+
+        cache.invalidate("k")
+        assert cache.get_cached("k") is None
+
+    def test_get_entries_reads_each_tier_once(self):
+        """Test batched reads ask slower tiers only for keys still missing."""
+        memory = MemoryCache(default_ttl=None)
+        durable = MemoryCache(default_ttl=None)
+        memory.set_cached("a", 1)
+        durable.set_cached("b", 2)
+        durable.get_entries = Mock(wraps=durable.get_entries)
+        cache = TieredCache([memory, durable])
+
+        entries = cache.get_entries(["a", "b", "c"])
+
+        assert {k: e.data for k, e in entries.items()} == {"a": 1, "b": 2}
+        durable.get_entries.assert_called_once_with(["b", "c"])
+        assert memory.get_cached("b") == 2
+
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    def test_client_uses_memory_tier(self, mock_cache):
+        """Test VillaClient places the memory cache in front of S3."""
+        memory = MemoryCache()
+        client = VillaClient(s3_bucket="test-bucket", memory_cache=memory)
+
+        assert isinstance(client.cache, TieredCache)
+        assert client.cache.tiers == [memory, client.s3_cache]
+        assert client.products_service.cache is client.cache
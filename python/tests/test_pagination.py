@@ -0,0 +1,131 @@
+"""Tests for paginated fetching and payment history pagination."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.pagination import iter_pages
+from villa_ecommerce_sdk.payments import PaymentService
+
+
+def _offset_api(total, delay=0.0, report_total=False):
+    """Fake offset-paginated endpoint recording peak concurrency."""
+    state = {"active": 0, "peak": 0, "calls": []}
+    lock = threading.Lock()
+
+    def fetch(params):
+        with lock:
+            state["calls"].append(dict(params))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        start = params["offset"]
+        page = {"payments": [{"id": i} for i in range(start, min(start + params["limit"], total))]}
+        if report_total:
+            page["total"] = total
+        return page
+
+    return fetch, state
+
+
+class TestIterPages:
+    """Test cases for iter_pages."""
+
+    def test_offset_pages_in_order_with_bounded_prefetch(self):
+        """Test pages arrive in order while at most prefetch requests run at once."""
+        fetch, state = _offset_api(total=1050, delay=0.02)
+
+        pages = list(iter_pages(fetch, "payments", page_size=100, prefetch=4))
+
+        assert [r["id"] for page in pages for r in page] == list(range(1050))
+        assert [len(p) for p in pages][-2:] == [100, 50]
+        assert 1 < state["peak"] <= 4
+
+    def test_prefetch_speeds_up_slow_pages(self):
+        """Test concurrent prefetch beats sequential paging."""
+        fetch, _ = _offset_api(total=1000, delay=0.03)
+        started = time.monotonic()
+        list(iter_pages(fetch, "payments", page_size=100, prefetch=1))
+        sequential = time.monotonic() - started
+
+        started = time.monotonic()
+        list(iter_pages(fetch, "payments", page_size=100, prefetch=8))
+        assert time.monotonic() - started < sequential / 2
+
+    def test_reported_total_avoids_overfetch(self):
+        """Test no page past the reported total is requested."""
+        fetch, state = _offset_api(total=300, report_total=True)
+
+        pages = list(iter_pages(fetch, "payments", page_size=100, prefetch=8))
+
+        assert sum(len(p) for p in pages) == 300
+        assert sorted(c["offset"] for c in state["calls"]) == [0, 100, 200]
+
+    def test_cursor_pages(self):
+        """Test cursor responses are followed until the cursor runs out."""
+        responses = {
+            None: {"payments": [1, 2], "nextCursor": "b"},
+            "b": {"payments": [3, 4], "nextCursor": "c"},
+            "c": {"payments": [5], "nextCursor": None},
+        }
+        fetch = Mock(side_effect=lambda params: responses[params.get("cursor")])
+
+        pages = list(iter_pages(fetch, "payments", page_size=2))
+
+        assert pages == [[1, 2], [3, 4], [5]]
+        assert fetch.call_args_list[1][0][0] == {"limit": 2, "cursor": "b"}
+
+    def test_max_records_and_has_more(self):
+        """Test max_records truncates and hasMore=false stops iteration."""
+        fetch, _ = _offset_api(total=1000)
+        pages = list(iter_pages(fetch, "payments", page_size=100, max_records=250))
+        assert [len(p) for p in pages] == [100, 100, 50]
+
+        fetch = Mock(return_value={"payments": [1, 2], "hasMore": False})
+        assert list(iter_pages(fetch, "payments", page_size=2)) == [[1, 2]]
+        fetch.assert_called_once()
+
+    def test_page_error_propagates(self):
+        """Test a failing page request raises from the iterator."""
+        def fetch(params):
+            if params["offset"] == 200:
+                raise Exception("Failed to GET /api/payment/history: 500")
+            return {"payments": list(range(100))}
+
+        with pytest.raises(Exception, match="500"):
+            list(iter_pages(fetch, "payments", page_size=100, prefetch=2))
+
+    def test_invalid_arguments(self):
+        """Test page_size and prefetch must be positive."""
+        with pytest.raises(ValueError):
+            next(iter_pages(Mock(), "payments", page_size=0))
+        with pytest.raises(ValueError):
+            next(iter_pages(Mock(), "payments", prefetch=0))
+
+
+class TestPaymentHistoryPages:
+    """Test cases for paginated payment history."""
+
+    def test_all_pages_materialized(self):
+        """Test all_pages merges every page into one DataFrame with the filters applied."""
+        fetch, state = _offset_api(total=250)
+        service = PaymentService(base_url="https://api.example.com")
+        service._get = Mock(side_effect=lambda endpoint, params: fetch(params))
+
+        df = service.get_payment_history(customer_id="C1", limit=100, all_pages=True)
+
+        assert len(df) == 250
+        assert all(c["customerId"] == "C1" for c in state["calls"])
+        service._get.assert_called_with(endpoint="/api/payment/history", params=state["calls"][-1])
+
+    def test_iter_payment_history_frames(self):
+        """Test the streaming iterator yields one DataFrame per page."""
+        fetch, _ = _offset_api(total=5)
+        service = PaymentService(base_url="https://api.example.com")
+        service._get = Mock(side_effect=lambda endpoint, params: fetch(params))
+
+        frames = list(service.iter_payment_history(page_size=2, prefetch=2))
+
+        assert [list(f["id"]) for f in frames] == [[0, 1], [2, 3], [4]]
@@ -1,10 +1,11 @@
 """Tests for ProductsService."""
 
+import time
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
 from villa_ecommerce_sdk.products import ProductsService
-from villa_ecommerce_sdk.cache import S3Cache
+from villa_ecommerce_sdk.cache import S3Cache, CacheEntry
 
 
 class TestProductsService:
@@ -44,14 +45,14 @@ class TestProductsService:
         ]
         
         cache = Mock(spec=S3Cache)
-        cache.get_cached.return_value = cached_data
+        cache.get_entry.return_value = CacheEntry(data=cached_data, stored_at=time.time())
         
         service = ProductsService(base_url="https://api.example.com", cache=cache)
         result = service.get_product_list(branch=1000)
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 2
-        cache.get_cached.assert_called_once_with("products/1000.json")
+        cache.get_entry.assert_called_once_with("products/1000.json")
     
     def test_get_product_list_dict_with_products_key(self):
         """Test parsing dict response with 'products' key."""
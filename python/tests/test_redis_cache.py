@@ -0,0 +1,254 @@
+"""Tests for the Redis-protocol cache backend, run against a local stand-in server."""
+
+import socketserver
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("redis")
+
+from villa_ecommerce_sdk.cache import CacheBackend, CacheEntry
+from villa_ecommerce_sdk.client import VillaClient
+from villa_ecommerce_sdk.disk_cache import DiskCache
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.redis_cache import RedisCache
+from villa_ecommerce_sdk.tiered_cache import TieredCache
+
+
+class _FakeRedisServer(socketserver.ThreadingTCPServer):
+    """Minimal RESP2 server implementing the hash commands RedisCache uses."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeRedisHandler)
+        # Reentrant so EXEC can run its queued commands as one atomic step
+        self.lock = threading.RLock()
+        self.hashes = {}
+        self.expiry = {}
+        self.connections = 0
+        self.commands = []
+
+    def _alive(self, key):
+        deadline = self.expiry.get(key)
+        if deadline is not None and time.time() >= deadline:
+            self.hashes.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.hashes
+
+    def execute(self, args):
+        name = args[0].upper().decode()
+        with self.lock:
+            self.commands.append(name)
+            if name == "PING":
+                return "+PONG"
+            if name == "HSET":
+                fields = self.hashes.setdefault(args[1], {})
+                pairs = args[2:]
+                for i in range(0, len(pairs), 2):
+                    fields[pairs[i]] = pairs[i + 1]
+                return len(pairs) // 2
+            if name == "HGETALL":
+                return self.hashes.get(args[1], {}) if self._alive(args[1]) else {}
+            if name == "HDEL":
+                fields = self.hashes.get(args[1], {})
+                return sum(1 for f in args[2:] if fields.pop(f, None) is not None)
+            if name == "DEL":
+                removed = 0
+                for key in args[1:]:
+                    removed += self.hashes.pop(key, None) is not None
+                    self.expiry.pop(key, None)
+                return removed
+            if name == "EXISTS":
+                return sum(1 for key in args[1:] if self._alive(key))
+            if name == "PEXPIRE":
+                if args[1] not in self.hashes:
+                    return 0
+                self.expiry[args[1]] = time.time() + int(args[2]) / 1000
+                return 1
+            if name == "PERSIST":
+                return 1 if self.expiry.pop(args[1], None) is not None else 0
+        return "-ERR unknown command"
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Parse RESP requests and write RESP2 replies."""
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        queued = None
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            if name == b"MULTI":
+                self.server.commands.append("MULTI")
+                queued, reply = [], "+OK"
+            elif name == b"EXEC" and queued is not None:
+                with self.server.lock:
+                    reply = [self.server.execute(queued_args) for queued_args in queued]
+                    self.server.commands.append("EXEC")
+                queued = None
+            elif queued is not None:
+                queued.append(args)
+                reply = "+QUEUED"
+            else:
+                reply = self.server.execute(args)
+            self.wfile.write(self._encode(reply))
+            self.wfile.flush()
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _encode(self, value):
+        if isinstance(value, str):
+            return value.encode() + b"\r\n"
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, list):
+            return b"*%d\r\n" % len(value) + b"".join(self._encode(v) for v in value)
+        if isinstance(value, dict):
+            out = b"*%d\r\n" % (len(value) * 2)
+            for k, v in value.items():
+                out += b"$%d\r\n%s\r\n" % (len(k), k) + b"$%d\r\n%s\r\n" % (len(v), v)
+            return out
+        raise TypeError(value)
+
+
+@pytest.fixture
+def server():
+    srv = _FakeRedisServer()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def cache(server):
+    port = server.server_address[1]
+    backend = RedisCache(url=f"redis://127.0.0.1:{port}/0", max_connections=4)
+    yield backend
+    backend.close()
+
+
+class TestRedisCache:
+    """Test cases for RedisCache."""
+
+    def test_implements_backend_protocol(self, cache):
+        """Test every backend satisfies the CacheBackend protocol."""
+        assert isinstance(cache, CacheBackend)
+        assert isinstance(MemoryCache(), CacheBackend)
+        assert isinstance(TieredCache([MemoryCache()]), CacheBackend)
+
+    def test_roundtrip(self, cache):
+        """Test data and metadata round-trip through a Redis hash."""
+        cache.set_entry("products/1000.json", CacheEntry(
+            {"products": [1, 2]}, stored_at=1000.0, ttl=60, etag='"abc"'
+        ))
+        entry = cache.get_entry("products/1000.json")
+
+        assert entry.data == {"products": [1, 2]}
+        assert entry.stored_at == 1000.0
+        assert entry.ttl == 60
+        assert entry.etag == '"abc"'
+        assert cache.is_cached("products/1000.json")
+
+    def test_freshness_and_invalidate(self, cache):
+        """Test get_cached honours TTL and invalidate removes the key."""
+        cache.set_cached("k.json", {"v": 1}, ttl=60)
+        assert cache.get_cached("k.json") == {"v": 1}
+        assert cache.get_cached("k.json", max_age=0) is None
+
+        cache.invalidate("k.json")
+        assert cache.get_cached("k.json") is None
+        assert not cache.is_cached("k.json")
+
+    def test_redis_expiry_keeps_stale_window(self, cache, server):
+        """Test entries expire in Redis only after TTL plus stale retention."""
+        cache.stale_retention = 30
+        cache.set_cached("k.json", {"v": 1}, ttl=60)
+        remaining = server.expiry[b"villa-sdk/k.json"] - time.time()
+        assert 85 < remaining <= 90
+
+    def test_touch_updates_metadata_only(self, cache, server):
+        """Test touch rewrites metadata fields and keeps the payload and codec."""
+        cache.set_entry("k.json", CacheEntry({"v": 1}, stored_at=1000.0, ttl=60, etag='"a"'))
+        payload = server.hashes[b"villa-sdk/k.json"][b"data"]
+
+        cache.touch("k.json", CacheEntry(None, stored_at=2000.0, ttl=60, codec="msgpack+zstd"))
+        entry = cache.get_entry("k.json")
+
+        assert server.hashes[b"villa-sdk/k.json"][b"data"] is payload
+        assert entry.data == {"v": 1}
+        assert entry.stored_at == 2000.0
+        assert entry.etag is None
+        assert entry.codec == "json"
+
+    def test_touch_missing_key_is_noop(self, cache):
+        """Test touch does not create entries."""
+        cache.touch("missing.json", CacheEntry(None, stored_at=1.0))
+        assert not cache.is_cached("missing.json")
+
+    def test_pipelined_bulk_operations(self, cache, server):
+        """Test bulk reads and writes share pooled connections and round trips."""
+        cache.set_entries({
+            f"inventory/{b}.json": CacheEntry({"branch": b}, stored_at=time.time(), ttl=60)
+            for b in range(10)
+        })
+        entries = cache.get_entries([f"inventory/{b}.json" for b in range(12)])
+
+        assert sorted(entries) == sorted(f"inventory/{b}.json" for b in range(10))
+        assert entries["inventory/3.json"].data == {"branch": 3}
+        assert server.connections == 1
+
+    def test_replacing_writes_are_transactions(self, cache, server):
+        """Test the DEL + HSET of a replace and touch's metadata rewrite run in MULTI/EXEC."""
+        cache.set_entry("k.json", CacheEntry({"v": 1}, stored_at=time.time(), ttl=60))
+        cache.touch("k.json", CacheEntry(None, stored_at=time.time()))
+
+        commands = server.commands
+        replace = commands.index("DEL")
+        assert commands[replace - 1:replace + 2] == ["MULTI", "DEL", "HSET"]
+        assert commands.count("MULTI") == commands.count("EXEC") == 2
+        assert cache.get_cached("k.json") == {"v": 1}
+
+    def test_connection_errors_are_misses(self):
+        """Test an unreachable server degrades to cache misses."""
+        backend = RedisCache(url="redis://127.0.0.1:1/0", socket_timeout=0.2)
+        backend.set_cached("k.json", {"v": 1})
+        assert backend.get_cached("k.json") is None
+        assert backend.get_entries(["k.json"]) == {}
+        assert not backend.is_cached("k.json")
+
+
+class TestClientSharedCache:
+    """Test cases for VillaClient shared cache wiring."""
+
+    @patch('villa_ecommerce_sdk.cache.S3Cache')
+    def test_shared_tier_between_local_and_s3(self, mock_cache, cache, tmp_path):
+        """Test the shared cache sits after local tiers and before S3."""
+        memory = MemoryCache()
+        disk = DiskCache(str(tmp_path))
+        client = VillaClient(memory_cache=memory, disk_cache=disk, shared_cache=cache)
+
+        assert client.cache.tiers == [memory, disk, cache, client.s3_cache]
+
+    def test_shared_cache_alone(self, cache):
+        """Test a shared cache can be used without S3."""
+        client = VillaClient(shared_cache=cache, use_s3_cache=False)
+        assert client.cache is cache
+        assert client.payment_service.cache is cache
@@ -0,0 +1,285 @@
+"""Tests for retry, backoff and circuit breaker behaviour."""
+
+import time
+import pytest
+import requests
+from villa_ecommerce_sdk.base import BaseService
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.client import VillaClient
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_route,
+    parse_retry_after
+)
+
+
+class DummyService(BaseService):
+    """Minimal concrete service for exercising BaseService."""
+
+    def get_service_name(self) -> str:
+        return "DummyService"
+
+
+def _policy(**kwargs):
+    sleeps = []
+    kwargs.setdefault('backoff_base', 0.0)
+    return RetryPolicy(sleep=sleeps.append, **kwargs), sleeps
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy and header parsing."""
+
+    def test_parse_retry_after(self):
+        """Test delay-seconds and HTTP-date forms."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=10.0) == 20.0
+        assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=60.0) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test delays stay within the exponential cap and honour Retry-After."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0, max_retry_after=10.0)
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= min(4.0, 2 ** attempt)
+        assert policy.backoff(0, retry_after=7.0) == 7.0
+        assert policy.backoff(0, retry_after=11.0) is None
+
+    def test_idempotency_rules(self):
+        """Test GET retries broadly while POST retries only when safe."""
+        policy = RetryPolicy()
+        reset = requests.exceptions.ConnectionError("reset")
+
+        assert policy.is_retryable('GET', status_code=503)
+        assert policy.is_retryable('GET', error=reset)
+        assert not policy.is_retryable('GET', status_code=404)
+
+        assert not policy.is_retryable('POST', status_code=503)
+        assert not policy.is_retryable('POST', error=reset)
+        assert not policy.is_retryable('POST', error=requests.exceptions.ReadTimeout())
+        assert policy.is_retryable('POST', error=requests.exceptions.ConnectTimeout())
+        assert policy.is_retryable('POST', status_code=429)
+        assert policy.is_retryable('POST', {'idempotency-key': 'k'}, status_code=503)
+
+    def test_endpoint_route(self):
+        """Test identifier segments share one circuit."""
+        assert endpoint_route("/api/inventory2/1000") == "/api/inventory2/{id}"
+        assert endpoint_route("/api/payment/status/PAY123") == "/api/payment/status/{id}"
+        assert endpoint_route("/api/payment/create") == "/api/payment/create"
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold_and_probes(self, clock):
+        """Test closed -> open -> half-open -> closed."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+        breaker.record_failure("r")
+        assert breaker.allow("r")
+        breaker.record_failure("r")
+        assert breaker.state("r") == CircuitBreaker.OPEN
+        assert not breaker.allow("r")
+
+        clock.now = 10
+        assert breaker.state("r") == CircuitBreaker.HALF_OPEN
+        assert breaker.allow("r")
+        assert not breaker.allow("r")
+        breaker.record_success("r")
+        assert breaker.state("r") == CircuitBreaker.CLOSED
+        assert breaker.states() == {}
+
+    def test_failed_probe_reopens(self, clock):
+        """Test a failing half-open probe reopens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure("r")
+        clock.now = 10
+        assert breaker.allow("r")
+        breaker.record_failure("r")
+
+        assert not breaker.allow("r")
+        clock.now = 19
+        assert breaker.state("r") == CircuitBreaker.OPEN
+
+    def test_success_resets_failure_count(self):
+        """Test failures must be consecutive to open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure("r")
+        breaker.record_success("r")
+        breaker.record_failure("r")
+        assert breaker.state("r") == CircuitBreaker.CLOSED
+
+
+class TestBaseServiceResilience:
+    """Test cases for retries and circuit breaking in BaseService."""
+
+    def test_get_retried_until_success(self, make_response, make_transport):
+        """Test transient GET failures are retried with backoff."""
+        policy, sleeps = _policy()
+        transport = make_transport(
+            requests.exceptions.ConnectionError("reset"),
+            make_response(status_code=503),
+            make_response({"v": 1})
+        )
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy)
+
+        assert service._get("/x") == {"v": 1}
+        assert transport.request.call_count == 3
+        assert len(sleeps) == 2
+
+    def test_retry_after_is_honoured(self, make_response, make_transport):
+        """Test the server's Retry-After sets the delay."""
+        policy, sleeps = _policy()
+        transport = make_transport(
+            make_response(status_code=429, headers={"Retry-After": "2"}),
+            make_response({"v": 1})
+        )
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy)
+
+        assert service._get("/x") == {"v": 1}
+        assert sleeps == [2.0]
+
+    def test_attempts_exhausted_raises(self, make_response, make_transport):
+        """Test the last failure surfaces after max_attempts."""
+        policy, sleeps = _policy(max_attempts=2)
+        transport = make_transport(make_response(status_code=502), make_response(status_code=502))
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy)
+
+        with pytest.raises(Exception, match="Failed to GET /x"):
+            service._get("/x")
+        assert transport.request.call_count == 2
+
+    def test_payment_post_not_retried(self, make_response, make_transport):
+        """Test a POST that may have reached the server is not repeated."""
+        policy, _ = _policy()
+        transport = make_transport(make_response(status_code=503), make_response({"ok": True}))
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy)
+
+        with pytest.raises(Exception):
+            service._post("/api/payment/create", json_data={"amount": 1})
+        assert transport.request.call_count == 1
+
+    def test_post_with_idempotency_key_retried(self, make_response, make_transport):
+        """Test a POST carrying an Idempotency-Key is retried."""
+        policy, _ = _policy()
+        transport = make_transport(make_response(status_code=503), make_response({"ok": True}))
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy)
+
+        result = service._post("/api/payment/create", json_data={"amount": 1},
+                               headers={"Idempotency-Key": "order-1"})
+        assert result == {"ok": True}
+        assert transport.request.call_count == 2
+
+    def test_client_errors_not_retried(self, make_response, make_transport):
+        """Test 4xx responses fail immediately and do not trip the breaker."""
+        policy, _ = _policy()
+        breaker = CircuitBreaker(failure_threshold=1)
+        transport = make_transport(make_response(status_code=404))
+        service = DummyService("https://api.example.com", transport=transport,
+                               retry_policy=policy, circuit_breaker=breaker)
+
+        with pytest.raises(Exception):
+            service._get("/x")
+        assert transport.request.call_count == 1
+        assert breaker.state("/x") == CircuitBreaker.CLOSED
+
+    def test_open_circuit_fails_fast(self, make_response, make_transport):
+        """Test an open circuit rejects requests without touching the network."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        transport = make_transport(make_response(status_code=500))
+        service = DummyService("https://api.example.com", transport=transport,
+                               circuit_breaker=breaker)
+
+        with pytest.raises(Exception):
+            service._get("/api/inventory2/1000")
+        with pytest.raises(CircuitOpenError):
+            service._get("/api/inventory2/2000")
+        assert transport.request.call_count == 1
+
+    def test_probe_raising_other_errors_does_not_wedge_circuit(
+        self, make_response, make_transport, clock
+    ):
+        """Test a half-open probe that raises a non-requests error releases the probe slot."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        transport = make_transport(
+            make_response(status_code=500),
+            RuntimeError("executor shut down"),
+            make_response({"v": 1})
+        )
+        service = DummyService("https://api.example.com", transport=transport,
+                               circuit_breaker=breaker)
+
+        with pytest.raises(Exception):
+            service._get("/x")
+        clock.now = 11
+        with pytest.raises(Exception, match="executor shut down"):
+            service._get("/x")
+        assert breaker.state("/x") == CircuitBreaker.OPEN
+
+        clock.now = 22
+        assert service._get("/x") == {"v": 1}
+        assert breaker.state("/x") == CircuitBreaker.CLOSED
+
+    def test_stale_entry_served_while_unhealthy(self, make_response, make_transport):
+        """Test stale cache entries stand in for a failing upstream."""
+        cache = MemoryCache(default_ttl=None, ttls={})
+        cache.set_entry("x.json", CacheEntry({"v": "old"}, stored_at=time.time() - 120, ttl=60))
+        breaker = CircuitBreaker(failure_threshold=1)
+        transport = make_transport(make_response(status_code=503))
+        service = DummyService("https://api.example.com", cache=cache, transport=transport,
+                               circuit_breaker=breaker, stale_if_error=3600)
+
+        # Upstream failure, then an open circuit, both fall back to the stale entry
+        assert service._get("/x", cache_key="x.json") == {"v": "old"}
+        assert service._get("/x", cache_key="x.json") == {"v": "old"}
+        assert transport.request.call_count == 1
+
+    def test_stale_fallback_respects_window(self, make_response, make_transport):
+        """Test entries older than the stale_if_error window are not served."""
+        cache = MemoryCache(default_ttl=None, ttls={})
+        cache.set_entry("x.json", CacheEntry({"v": "old"}, stored_at=time.time() - 120, ttl=60))
+        transport = make_transport(make_response(status_code=503))
+        service = DummyService("https://api.example.com", cache=cache, transport=transport,
+                               stale_if_error=30)
+
+        with pytest.raises(Exception, match="Failed to GET /x"):
+            service._get("/x", cache_key="x.json")
+
+
+class TestClientResilience:
+    """Test cases for VillaClient resilience wiring."""
+
+    def test_services_share_breaker_and_policy(self):
+        """Test every service gets the client's policy and breaker."""
+        policy = RetryPolicy(max_attempts=5)
+        client = VillaClient(use_s3_cache=False, retry_policy=policy, stale_if_error=600)
+
+        assert client.products_service.retry_policy is policy
+        assert client.payment_service.circuit_breaker is client.circuit_breaker
+        assert client.inventory_service.stale_if_error == 600
+        assert client.payment_service.stale_if_error == 0
+        assert client.get_circuit_states() == {}
+
+    def test_defaults(self):
+        """Test retries and circuit breaking are on by default and stale-on-error is opt-in."""
+        client = VillaClient(use_s3_cache=False)
+
+        assert isinstance(client.retry_policy, RetryPolicy)
+        assert client.retry_policy is not VillaClient(use_s3_cache=False).retry_policy
+        assert client.products_service.stale_if_error == 0
+
+    def test_can_disable(self):
+        """Test retries and circuit breaking can be turned off."""
+        client = VillaClient(use_s3_cache=False, retry_policy=False, circuit_breaker=False)
+
+        assert client.payment_service.retry_policy is None
+        assert client.payment_service.circuit_breaker is None
+        assert client.get_circuit_states() == {}
@@ -0,0 +1,111 @@
+"""Tests for declared record schemas and typed DataFrames."""
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.client import VillaClient
+from villa_ecommerce_sdk.inventory import InventoryService
+from villa_ecommerce_sdk.products import ProductsService
+from villa_ecommerce_sdk.schema import INVENTORY_SCHEMA, PRODUCT_SCHEMA, MemoryReport, RecordSchema
+
+
+PRODUCTS = [
+    {"id": "P1", "name": "Milk", "category": "Dairy", "price": 45.5, "unit": "ea",
+     "inStock": True, "quantity": 12, "updatedAt": "2026-10-01T08:00:00Z"},
+    {"id": "P2", "name": "Bread", "category": "Bakery", "price": 39.0, "unit": "ea",
+     "inStock": False, "quantity": None, "updatedAt": "2026-10-02T08:00:00+07:00"},
+    {"id": "P3", "name": "Cheese", "category": "Dairy", "price": 250.25, "unit": "kg",
+     "inStock": True, "quantity": 3, "updatedAt": None},
+]
+
+
+class TestRecordSchema:
+    """Test cases for RecordSchema."""
+
+    def test_declared_dtypes(self):
+        """Test product columns are converted to their declared dtypes."""
+        frame = PRODUCT_SCHEMA.build(PRODUCTS)
+
+        assert frame["category"].dtype == "category"
+        assert frame["unit"].dtype == "category"
+        assert frame["price"].dtype == "float32"
+        assert frame["quantity"].dtype == "Int32"
+        assert frame["inStock"].dtype == "boolean"
+        assert str(frame["updatedAt"].dtype).startswith("datetime64")
+        assert frame["quantity"].isna().tolist() == [False, True, False]
+        assert frame["updatedAt"][1] == pd.Timestamp("2026-10-02T01:00:00Z")
+        assert round(float(frame["price"][2]), 2) == 250.25
+
+    def test_values_that_do_not_fit_are_kept(self):
+        """Test columns are left unchanged rather than losing data."""
+        frame = PRODUCT_SCHEMA.build([
+            {"quantity": 1.5, "price": 250000.99, "updatedAt": "not a date", "inStock": "yes"},
+            {"quantity": 2, "price": 1.0, "updatedAt": "2026-10-01", "inStock": "no"},
+        ])
+
+        assert frame["quantity"].dtype == "float64"
+        assert frame["price"].dtype == "float64"
+        assert frame["updatedAt"].tolist() == ["not a date", "2026-10-01"]
+        assert frame["inStock"].tolist() == ["yes", "no"]
+
+    def test_numeric_ids_stay_numeric(self):
+        """Test the string dtype only applies to text columns."""
+        frame = INVENTORY_SCHEMA.build([{"id": 1, "sku": "A", "branch": 1000}])
+        assert frame["id"].tolist() == [1]
+        assert frame["branch"].dtype == "Int32"
+
+    def test_apply_is_idempotent(self):
+        """Test applying a schema twice returns the same frame."""
+        frame = PRODUCT_SCHEMA.build(PRODUCTS)
+        assert PRODUCT_SCHEMA.apply(frame) is frame
+
+    def test_custom_schema(self):
+        """Test undeclared and missing columns are ignored."""
+        schema = RecordSchema("custom", {"a": "Int64", "missing": "category"})
+        frame = schema.build([{"a": 1, "b": 2.5}])
+        assert dict(frame.dtypes.astype(str)) == {"a": "Int64", "b": "float64"}
+
+
+class TestTypedServices:
+    """Test cases for typed frames in the products and inventory services."""
+
+    def test_memory_report_per_branch(self):
+        """Test get_* records the memory saved for each branch."""
+        service = ProductsService(base_url="https://api.example.com", report_memory=True)
+        service._get = Mock(return_value={"products": PRODUCTS * 200})
+
+        frame = service.get_product_list(branch=1000)
+
+        report = service.memory_reports["products/1000"]
+        assert report.rows == len(frame) == 600
+        assert 0 < report.bytes_after < report.bytes_before
+        assert 0 < report.saved_ratio < 1
+
+    def test_typed_frames_can_be_disabled(self):
+        """Test typed_frames=False keeps the dtypes pandas infers."""
+        service = InventoryService(base_url="https://api.example.com", typed_frames=False)
+        service._get = Mock(return_value={"inventory": [{"quantity": 1, "branch": 2000}]})
+
+        frame = service.get_inventory(branch=2000)
+        assert frame["quantity"].dtype == "int64"
+        assert service.memory_reports == {}
+
+    def test_client_memory_report(self):
+        """Test the client merges the reports of its catalogue services."""
+        client = VillaClient(use_s3_cache=False, report_memory=True)
+        assert client.get_memory_report() == {}
+
+        client.inventory_service._get = Mock(return_value={"inventory": [{"quantity": 1}]})
+        client.get_inventory(branch=2000)
+
+        report = client.get_memory_report()
+        assert list(report) == ["inventory/2000"]
+        assert isinstance(report["inventory/2000"], MemoryReport)
+
+
+def test_memory_report_ratio():
+    """Test MemoryReport derived values."""
+    report = MemoryReport(rows=1, bytes_before=200, bytes_after=50)
+    assert report.saved_bytes == 150
+    assert report.saved_ratio == pytest.approx(0.75)
+    assert MemoryReport().saved_ratio == 0.0
@@ -0,0 +1,191 @@
+"""Tests for cache payload codecs."""
+
+import io
+import pytest
+from villa_ecommerce_sdk.serialization import (
+    Codec, JSONCodec, GzipCodec, get_codec, DEFAULT_CODEC
+)
+
+
+DATA = {
+    "products": [{"sku": f"SKU{i}", "price": i * 1.5, "name": "ไข่ไก่"} for i in range(50)]
+}
+
+
+class _ChunkedStream(io.RawIOBase):
+    """Binary stream that hands out at most chunk_size bytes per read."""
+
+    def __init__(self, payload, chunk_size=64):
+        self._buffer = io.BytesIO(payload)
+        self.chunk_size = chunk_size
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        self.reads += 1
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        return self._buffer.read(size)
+
+    def readinto(self, b):
+        chunk = self.read(len(b))
+        b[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestGetCodec:
+    """Test cases for codec name resolution."""
+
+    def test_default(self):
+        """Test the default codec is gzip-compressed JSON."""
+        assert get_codec().name == DEFAULT_CODEC == "json"
+
+    def test_names(self):
+        """Test composed codec names resolve to nested codecs."""
+        codec = get_codec("json+gzip")
+        assert isinstance(codec, GzipCodec)
+        assert isinstance(codec.inner, JSONCodec)
+        assert codec.content_type == "application/json"
+        assert codec.content_encoding == "gzip"
+
+    def test_instance_passthrough(self):
+        """Test codec instances are returned unchanged."""
+        codec = JSONCodec()
+        assert get_codec(codec) is codec
+
+    def test_unknown(self):
+        """Test unknown names are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("xml")
+        with pytest.raises(ValueError):
+            get_codec("json+brotli")
+
+
+class TestCodecs:
+    """Test cases for codec round trips."""
+
+    @pytest.mark.parametrize("name", ["json", "json+gzip"])
+    def test_roundtrip(self, name):
+        """Test stdlib codecs round-trip data."""
+        codec = get_codec(name)
+        assert codec.decode_bytes(codec.encode(DATA)) == DATA
+
+    def test_zstd_roundtrip(self):
+        """Test zstd codecs round-trip data."""
+        pytest.importorskip("zstandard")
+        for name in ("json+zstd", "msgpack+zstd"):
+            if name.startswith("msgpack"):
+                pytest.importorskip("msgpack")
+            codec = get_codec(name)
+            assert codec.content_encoding == "zstd"
+            assert codec.decode_bytes(codec.encode(DATA)) == DATA
+
+    def test_msgpack_roundtrip(self):
+        """Test msgpack round-trips data and stringifies unknown types."""
+        pytest.importorskip("msgpack")
+        from decimal import Decimal
+        codec = get_codec("msgpack")
+        assert codec.decode_bytes(codec.encode(DATA)) == DATA
+        assert codec.decode_bytes(codec.encode({"v": Decimal("1.5")})) == {"v": "1.5"}
+
+    @pytest.mark.parametrize("name", ["json", "json+gzip", "json+zstd", "msgpack", "msgpack+zstd"])
+    def test_decode_bytes_accepts_buffers(self, name):
+        """Test payloads decode from a memoryview (e.g. over a memory map) without copying it first."""
+        if "zstd" in name:
+            pytest.importorskip("zstandard")
+        if name.startswith("msgpack"):
+            pytest.importorskip("msgpack")
+        codec = get_codec(name)
+        payload = b"header\n" + codec.encode(DATA)
+        with memoryview(payload) as view, view[7:] as body:
+            assert codec.decode_bytes(body) == DATA
+
+    @pytest.mark.parametrize("name", ["json+gzip", "json+zstd", "msgpack+zstd"])
+    def test_stream_decode_reads_in_chunks(self, name):
+        """Test compressed payloads decode from a chunked stream."""
+        pytest.importorskip("zstandard")
+        if name.startswith("msgpack"):
+            pytest.importorskip("msgpack")
+        codec = get_codec(name)
+        stream = _ChunkedStream(codec.encode(DATA))
+        assert codec.decode(stream) == DATA
+        assert stream.reads > 1
+
+    def test_compression_shrinks_payload(self):
+        """Test compressed codecs produce smaller payloads than plain JSON."""
+        plain = get_codec("json").encode(DATA)
+        assert len(get_codec("json+gzip").encode(DATA)) < len(plain) / 3
+
+    def test_base_codec_is_abstract(self):
+        """Test the base codec does not implement encoding."""
+        with pytest.raises(NotImplementedError):
+            Codec().encode({})
+
+
+class TestJSONBackends:
+    """Test cases for the pluggable JSON backend."""
+
+    @pytest.fixture(autouse=True)
+    def restore_backend(self):
+        from villa_ecommerce_sdk import serialization
+        previous = serialization.json_backend()
+        yield
+        serialization.set_json_backend(previous)
+
+    def _available(self):
+        from villa_ecommerce_sdk import serialization
+        names = []
+        for name in serialization.JSON_BACKENDS:
+            try:
+                serialization.set_json_backend(name)
+            except ImportError:
+                continue
+            names.append(name)
+        return names
+
+    def test_backends_agree(self):
+        """Test every installed backend round-trips the same data, also across backends."""
+        from villa_ecommerce_sdk import serialization
+        payloads = {}
+        for name in self._available():
+            serialization.set_json_backend(name)
+            payloads[name] = serialization.json_dumps(DATA)
+            assert serialization.json_loads(payloads[name]) == DATA
+        for name in self._available():
+            serialization.set_json_backend(name)
+            for payload in payloads.values():
+                assert serialization.json_loads(payload) == DATA
+                assert JSONCodec().decode_bytes(payload) == DATA
+
+    def test_stdlib_compatible_edge_cases(self):
+        """Test values outside plain JSON behave like json.dumps(default=str)."""
+        import datetime
+        from villa_ecommerce_sdk import serialization
+        data = {1: "int key", "big": 2 ** 70, "when": datetime.date(2026, 1, 2)}
+        expected = {"1": "int key", "big": 2 ** 70, "when": "2026-01-02"}
+        for name in self._available():
+            serialization.set_json_backend(name)
+            assert serialization.json_loads(serialization.json_dumps(data)) == expected
+            assert serialization.json_loads(b'{"n": NaN}')["n"] != 0
+            assert serialization.json_loads(memoryview(b'{"n": NaN}'))["n"] != 0
+
+    def test_auto_selection_and_errors(self):
+        """Test auto-selection prefers a fast backend and bad names are rejected."""
+        from villa_ecommerce_sdk import serialization
+        assert serialization.set_json_backend(None) == self._available()[0]
+        with pytest.raises(ValueError):
+            serialization.set_json_backend("yaml")
+
+    def test_decode_json_response(self):
+        """Test response bodies are decoded from content, falling back to json()."""
+        from unittest.mock import Mock
+        from villa_ecommerce_sdk.serialization import decode_json_response
+        response = Mock(content=b'{"ok": true}')
+        assert decode_json_response(response) == {"ok": True}
+        response.json.assert_not_called()
+
+        fallback = Mock(content='﻿{"ok": 1}'.encode('utf-16'))
+        fallback.json.return_value = {"ok": 1}
+        assert decode_json_response(fallback) == {"ok": 1}
@@ -0,0 +1,104 @@
+"""Tests for SingleFlight request coalescing."""
+
+import threading
+import pytest
+from villa_ecommerce_sdk.singleflight import SingleFlight
+
+
+def _run_concurrently(flight, key, fn, callers):
+    """Start callers threads on flight.do(key, fn) and collect results/errors."""
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_sequential_calls_each_execute(self):
+        """Test calls that do not overlap are not coalesced."""
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+
+        stats = flight.stats()
+        assert stats.calls == 2
+        assert stats.executions == 2
+        assert stats.coalesced == 0
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test concurrent callers with the same key share the leader's result."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        executions = []
+
+        def fetch():
+            executions.append(1)
+            started.set()
+            release.wait(2)
+            return {"v": 1}
+
+        leader, leader_results, _ = _run_concurrently(flight, "k", fetch, 1)
+        assert started.wait(2)
+        followers, results, errors = _run_concurrently(flight, "k", fetch, 4)
+        while flight.stats().calls < 5:
+            pass
+        release.set()
+        for t in leader + followers:
+            t.join(2)
+
+        assert len(executions) == 1
+        assert results == [{"v": 1}] * 4
+        assert leader_results == [{"v": 1}]
+        assert errors == []
+        stats = flight.stats()
+        assert stats.executions == 1
+        assert stats.coalesced == 4
+        assert flight.in_flight() == 0
+
+    def test_error_propagates_to_followers(self):
+        """Test a failing leader raises in every waiting caller."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(2)
+            raise ValueError("upstream down")
+
+        leader, _, leader_errors = _run_concurrently(flight, "k", fetch, 1)
+        assert started.wait(2)
+        followers, _, errors = _run_concurrently(flight, "k", fetch, 2)
+        while flight.stats().calls < 3:
+            pass
+        release.set()
+        for t in leader + followers:
+            t.join(2)
+
+        assert len(leader_errors + errors) == 3
+        assert all(isinstance(e, ValueError) for e in leader_errors + errors)
+
+    def test_different_keys_do_not_coalesce(self):
+        """Test distinct keys run independently."""
+        flight = SingleFlight()
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+        assert flight.stats().coalesced == 0
+
+    def test_key_released_after_error(self):
+        """Test a failed call does not block later calls for the key."""
+        flight = SingleFlight()
+        with pytest.raises(RuntimeError):
+            flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+        assert flight.do("k", lambda: "ok") == "ok"
@@ -0,0 +1,227 @@
+"""Tests for state-aware status caching and status waiters."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.cache import CacheEntry
+from villa_ecommerce_sdk.memory_cache import MemoryCache
+from villa_ecommerce_sdk.payments import PaymentService
+from villa_ecommerce_sdk.status import (
+    TERMINAL_PAYMENT_STATUSES,
+    StatusTTL,
+    extract_status,
+    wait_for_statuses
+)
+
+
+def _service(transport):
+    """Build a PaymentService over a memory cache and the given transport."""
+    cache = MemoryCache(default_ttl=None, ttls={})
+    return PaymentService("https://api.example.com", cache=cache, transport=transport), cache, transport
+
+
+class TestStatusTTL:
+    """Test cases for extract_status and StatusTTL."""
+
+    def test_extract_status(self):
+        """Test statuses are found at the top level or in a data envelope."""
+        assert extract_status({"status": "COMPLETED"}) == "completed"
+        assert extract_status({"data": {"paymentStatus": "Pending"}}) == "pending"
+        assert extract_status({"id": "P1"}) is None
+        assert extract_status(["pending"]) is None
+
+    def test_terminal_statuses_cached_long(self):
+        """Test terminal statuses get the terminal TTL and others the pending TTL."""
+        policy = StatusTTL(TERMINAL_PAYMENT_STATUSES, terminal_ttl=3600, pending_ttl=0)
+        assert policy({"status": "failed"}) == 3600
+        assert policy({"status": "pending"}) == 0
+        assert policy({}) == 0
+
+
+class TestStatusCaching:
+    """Test cases for status caching through PaymentService."""
+
+    def test_terminal_status_served_from_cache(self, make_transport):
+        """Test a completed payment is cached with the terminal TTL."""
+        service, cache, transport = _service(make_transport({"status": "completed"}))
+
+        assert service.get_payment_status("P1") == {"status": "completed"}
+        assert service.get_payment_status("P1") == {"status": "completed"}
+        assert transport.request.call_count == 1
+        assert cache.get_entry("payments/P1.json").ttl == 86400.0
+
+    def test_pending_status_expires_quickly(self, make_transport):
+        """Test a pending status is cached only briefly, then refetched."""
+        service, cache, transport = _service(
+
+            make_transport({"status": "pending"}, {"status": "completed"})
+
+        )
+
+        service.get_payment_status("P1")
+        entry = cache.get_entry("payments/P1.json")
+        assert entry.ttl == 5.0
+        cache.set_entry("payments/P1.json", CacheEntry(entry.data, stored_at=time.time() - 6, ttl=5.0))
+
+        assert service.get_payment_status("P1") == {"status": "completed"}
+        assert transport.request.call_count == 2
+
+    def test_policy_rejudges_entries_cached_forever(self, make_transport):
+        """Test pending entries written without a TTL are no longer served forever."""
+        service, cache, transport = _service(make_transport({"status": "completed"}))
+        cache.set_entry("refunds/R1.json", CacheEntry({"status": "processing"}, stored_at=time.time() - 60))
+
+        assert service.get_refund_status("R1") == {"status": "completed"}
+        transport.request.assert_called_once()
+
+    def test_refresh_bypasses_cache_and_writes_through(self, make_transport):
+        """Test refresh=True always asks the API and updates the cache."""
+        service, cache, transport = _service(make_transport({"status": "refunded"}))
+        cache.set_entry("payments/P1.json", CacheEntry({"status": "completed"}, stored_at=time.time(), ttl=None))
+
+        assert service.get_payment_status("P1", refresh=True) == {"status": "refunded"}
+        assert cache.get_entry("payments/P1.json").data == {"status": "refunded"}
+
+
+class TestWaitForStatuses:
+    """Test cases for the shared status scheduler."""
+
+    def test_backoff_and_reset_on_progress(self, clock):
+        """Test intervals grow while a status is unchanged and reset when it moves."""
+        states = iter(["pending", "pending", "pending", "processing", "processing", "completed"])
+        fetch = Mock(side_effect=lambda item_id: {"status": next(states)})
+
+        results = wait_for_statuses(
+            fetch, ["P1"], lambda d: d["status"] == "completed",
+            initial_interval=1.0, max_interval=10.0, backoff=2.0, clock=clock, sleep=clock.sleep
+        )
+
+        assert results == {"P1": {"status": "completed"}}
+        assert [round(s) for s in clock.sleeps] == [1, 2, 4, 1, 2]
+
+    def test_many_ids_share_a_bounded_pool(self):
+        """Test many IDs are polled by one scheduler with bounded concurrency."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "polls": {}}
+
+        def fetch(item_id):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                state["polls"][item_id] = state["polls"].get(item_id, 0) + 1
+            time.sleep(0.002)
+            with lock:
+                state["active"] -= 1
+            return {"status": "completed" if state["polls"][item_id] >= 2 else "pending"}
+
+        threads_before = threading.active_count()
+        ids = [f"P{i}" for i in range(100)] + ["P0"]
+        results = wait_for_statuses(
+            fetch, ids, lambda d: d["status"] == "completed",
+            initial_interval=0.01, max_interval=0.05, max_workers=4
+        )
+
+        assert len(results) == 100
+        assert all(d == {"status": "completed"} for d in results.values())
+        assert state["peak"] <= 4
+        assert threading.active_count() <= threads_before + 4
+
+    def test_timeout_returns_last_data_and_survives_errors(self, clock):
+        """Test IDs still pending at the deadline keep their last data; errors are retried."""
+        calls = {"n": 0}
+
+        def fetch(item_id):
+            calls["n"] += 1
+            if item_id == "P2":
+                raise Exception("Failed to GET /api/payment/status/P2: 503")
+            return {"status": "pending"}
+
+        results = wait_for_statuses(
+            fetch, ["P1", "P2"], lambda d: False, timeout=10.0,
+            initial_interval=1.0, max_interval=4.0, backoff=2.0,
+            max_workers=1, clock=clock, sleep=clock.sleep
+        )
+
+        assert results == {"P1": {"status": "pending"}, "P2": None}
+        assert clock.now < 10.0
+        assert calls["n"] == 8  # t = 0, 1, 3, 7 for each ID
+
+    def test_invalid_arguments(self):
+        """Test intervals, backoff and max_workers are validated."""
+        with pytest.raises(ValueError):
+            wait_for_statuses(Mock(), ["P1"], bool, initial_interval=0)
+        with pytest.raises(ValueError):
+            wait_for_statuses(Mock(), ["P1"], bool, backoff=0.5)
+
+
+class TestPaymentWaiters:
+    """Test cases for PaymentService waiters."""
+
+    def test_wait_for_payment_status_polls_fresh(self, make_transport):
+        """Test the waiter bypasses cached pending data and stops at a terminal status."""
+        service, cache, transport = _service(
+
+            make_transport({"status": "pending"}, {"status": "captured"})
+
+        )
+        cache.set_entry("payments/P1.json", CacheEntry({"status": "pending"}, stored_at=time.time(), ttl=60))
+
+        result = service.wait_for_payment_status("P1", initial_interval=0.01)
+
+        assert result == {"status": "captured"}
+        assert transport.request.call_count == 2
+        assert cache.get_entry("payments/P1.json").data == {"status": "captured"}
+
+    def test_wait_for_refund_status_custom_target(self, make_transport):
+        """Test extra target statuses end the wait for several IDs."""
+        service, _, _ = _service(make_transport())
+        service.get_refund_status = Mock(side_effect=lambda refund_id, refresh: {"status": "Approved"})
+
+        results = service.wait_for_refund_status(["R1", "R2"], statuses={"approved"})
+
+        assert results == {"R1": {"status": "Approved"}, "R2": {"status": "Approved"}}
+        assert service.get_refund_status.call_count == 2
+
+
+class TestBatchStatuses:
+    """Test cases for batched status lookups."""
+
+    def test_cached_terminal_states_skip_the_api(self, make_response, make_transport):
+        """Test IDs are de-duplicated, terminal cache hits are reused and the rest fetched."""
+        service, cache, transport = _service(make_transport())
+        now = time.time()
+        cache.set_entry("payments/P1.json", CacheEntry({"status": "completed", "amount": 10}, stored_at=now, ttl=None))
+        cache.set_entry("payments/P2.json", CacheEntry({"status": "pending"}, stored_at=now, ttl=5))
+        cache.get_entries = Mock(wraps=cache.get_entries)
+
+        def request(method, url, **kwargs):
+            payment_id = url.rsplit("/", 1)[1]
+            if payment_id == "P4":
+                raise Exception("boom")
+            return make_response({"data": {"status": "captured", "amount": int(payment_id[1:])}})
+
+        transport.request.side_effect = request
+
+        frame = service.get_payment_statuses(["P1", "P2", "P1", "P3", "P4"], max_workers=4)
+
+        cache.get_entries.assert_called_once()
+        assert transport.request.call_count == 3
+        assert list(frame.index) == ["P1", "P2", "P3", "P4"]
+        assert frame.index.name == "payment_id"
+        assert frame.loc["P1", "status"] == "completed"
+        assert frame.loc["P2", "status"] == "captured"
+        assert frame.loc["P3", "amount"] == 3
+        assert frame["error"].isna().tolist() == [True, True, True, False]
+        assert cache.get_entry("payments/P3.json").data["data"]["status"] == "captured"
+
+    def test_refund_statuses_without_cache(self):
+        """Test refund lookups work without a cache backend."""
+        service = PaymentService("https://api.example.com")
+        service.get_refund_status = Mock(side_effect=lambda refund_id, refresh: {"status": "refunded"})
+
+        frame = service.get_refund_statuses(["R1", "R2", "R2"])
+
+        assert frame.index.name == "refund_id"
+        assert frame["status"].tolist() == ["refunded", "refunded"]
+        assert service.get_refund_status.call_count == 2
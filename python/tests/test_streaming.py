@@ -0,0 +1,205 @@
+"""Tests for incremental JSON record parsing and streamed responses."""
+
+import json
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from villa_ecommerce_sdk.inventory import InventoryService
+from villa_ecommerce_sdk.products import ProductsService
+from villa_ecommerce_sdk.streaming import chunked, iter_json_records
+from villa_ecommerce_sdk.transport import HTTPTransport
+
+
+def _split(payload, size):
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+def _streamed(payload, size=7, status_code=200):
+    """Build a mock transport whose response streams payload in chunks."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.iter_content.side_effect = lambda chunk_size: iter(_split(payload, size))
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    transport = Mock(spec=HTTPTransport)
+    transport.request.return_value = response
+    return transport, response
+
+
+class TestIterJsonRecords:
+    """Test cases for iter_json_records."""
+
+    RECORDS = [{"id": i, "name": "ผลิตภัณฑ์" * i, "price": i * 1.25, "tags": [i, None, True]}
+               for i in range(20)]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 64, 1 << 16])
+    def test_any_chunk_boundary(self, size):
+        """Test records survive chunk splits inside strings, numbers and UTF-8 sequences."""
+        payload = json.dumps({"count": 20, "products": self.RECORDS, "next": None},
+                             ensure_ascii=False).encode()
+        assert list(iter_json_records(_split(payload, size), "products")) == self.RECORDS
+
+    def test_record_locations(self):
+        """Test records are found the same way extract_records finds them."""
+        assert list(iter_json_records([b'[1, 2', b'3]'], "x")) == [1, 23]
+        assert list(iter_json_records([b'{"meta": {"a": 1}, "items": [{"b": 2}]}'], "x")) == [{"b": 2}]
+        assert list(iter_json_records([b'{"data": {"a": 1}}'], "x")) == [{"a": 1}]
+        assert list(iter_json_records([b'{"a": 1, "b": [2]}'], "x")) == [{"a": 1, "b": [2]}]
+        assert list(iter_json_records([b'{}'], "x")) == [{}]
+        assert list(iter_json_records([b' [ ] '], "x")) == []
+        assert list(iter_json_records([b'42'], "x")) == [42]
+
+    def test_key_priority_matches_extract_records(self):
+        """Test list_key beats 'data', which beats 'items', wherever they appear."""
+        from villa_ecommerce_sdk.base import extract_records
+        for payload in (
+            {"data": {"a": 1}, "products": [{"b": 2}]},
+            {"items": [1], "data": [2, 3], "next": None},
+            {"items": [1], "meta": {"n": 1}},
+        ):
+            body = json.dumps(payload).encode()
+            assert list(iter_json_records(_split(body, 4), "products")) == \
+                extract_records(payload, "products")
+
+    def test_large_value_decoded_in_linear_time(self):
+        """Test a value spanning many chunks is not re-parsed once per chunk."""
+        from villa_ecommerce_sdk import streaming
+        payload = json.dumps({"data": [{"id": i} for i in range(5000)]}).encode()
+        decoder = Mock(wraps=streaming._decoder)
+        with patch.object(streaming, "_decoder", decoder):
+            records = list(iter_json_records(_split(payload, 64), "products"))
+
+        assert len(records) == 5000
+        assert decoder.raw_decode.call_count < 50
+
+    def test_reads_lazily(self):
+        """Test records are yielded before the whole body has been read."""
+        consumed = []
+
+        def chunks():
+            for chunk in [b'{"products": [', b'{"id": 1},', b'{"id": 2},', b'{"id": 3}]}']:
+                consumed.append(chunk)
+                yield chunk
+
+        records = iter_json_records(chunks(), "products")
+        assert next(records) == {"id": 1}
+        assert len(consumed) < 4
+
+    def test_invalid_json_raises(self):
+        """Test malformed or truncated bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_records([b'{"products": [{"id": 1} {"id": 2}]}'], "products"))
+        with pytest.raises(ValueError):
+            list(iter_json_records([b'{"products": [{"id": 1}, {"id"'], "products"))
+
+    def test_chunked(self):
+        """Test records are grouped into fixed-size lists."""
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 2)) == []
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestStreamedServices:
+    """Test cases for streaming product and inventory responses."""
+
+    def test_stream_product_list_chunks(self):
+        """Test products are yielded as bounded DataFrame chunks."""
+        payload = json.dumps({"products": [{"id": i, "name": f"p{i}"} for i in range(5)]}).encode()
+        transport, response = _streamed(payload)
+        service = ProductsService(base_url="https://api.example.com", transport=transport)
+
+        frames = list(service.stream_product_list(branch=1000, chunk_size=2))
+
+        assert [len(f) for f in frames] == [2, 2, 1]
+        assert list(frames[2]["id"]) == [4]
+        args, kwargs = transport.request.call_args
+        assert args == ("GET", "https://api.example.com/api/product/productlist/onlineData/1000")
+        assert kwargs["stream"] is True
+        response.close.assert_called_once()
+
+    def test_stream_bypasses_cache(self):
+        """Test streamed responses are neither read from nor written to the cache."""
+        payload = json.dumps({"inventory": [{"sku": "a"}]}).encode()
+        transport, _ = _streamed(payload)
+        cache = Mock()
+        service = InventoryService(base_url="https://api.example.com", transport=transport,
+                                   cache=cache)
+
+        frames = list(service.stream_inventory(branch=2000))
+
+        assert list(frames[0]["sku"]) == ["a"]
+        cache.get_entry.assert_not_called()
+        cache.set_entry.assert_not_called()
+
+    def test_stream_http_error(self):
+        """Test HTTP errors surface like regular requests."""
+        transport, response = _streamed(b"", status_code=500)
+        service = ProductsService(base_url="https://api.example.com", transport=transport)
+
+        with pytest.raises(Exception, match="Failed to GET"):
+            list(service.stream_product_list())
+
+    def test_stream_parse_error_closes_response(self):
+        """Test a malformed body raises and still releases the connection."""
+        transport, response = _streamed(b'{"products": [1, oops]}')
+        service = ProductsService(base_url="https://api.example.com", transport=transport)
+
+        with pytest.raises(Exception, match="Error processing response"):
+            list(service.stream_product_list())
+        response.close.assert_called_once()
+
+
+class TestIterChunks:
+    """Test cases for iter_products / iter_inventory."""
+
+    def test_iter_products_from_network_stream(self):
+        """Test chunks are streamed from the network on a cache miss."""
+        payload = json.dumps({"products": [{"id": i} for i in range(5)]}).encode()
+        transport, _ = _streamed(payload)
+        service = ProductsService(base_url="https://api.example.com", transport=transport)
+
+        records = list(service.iter_products(branch=1000, chunk_size=2, as_records=True))
+        assert records == [[{"id": 0}, {"id": 1}], [{"id": 2}, {"id": 3}], [{"id": 4}]]
+        assert transport.request.call_args[1]["stream"] is True
+
+    def test_iter_inventory_from_fresh_cache(self):
+        """Test a fresh cached response is chunked without a request."""
+        from villa_ecommerce_sdk.memory_cache import MemoryCache
+        cache = MemoryCache()
+        cache.set_cached("inventory/2000.json", {"inventory": [{"sku": s} for s in "abc"]}, ttl=60)
+        transport = Mock(spec=HTTPTransport)
+        service = InventoryService(base_url="https://api.example.com", transport=transport,
+                                   cache=cache)
+
+        frames = list(service.iter_inventory(branch=2000, chunk_size=2))
+        assert [list(f["sku"]) for f in frames] == [["a", "b"], ["c"]]
+        transport.request.assert_not_called()
+
+    def test_iter_products_from_frame_cache(self, tmp_path):
+        """Test the frame cache is preferred and yields typed records."""
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+        from villa_ecommerce_sdk.frame_cache import ParquetFrameCache
+        frame_cache = ParquetFrameCache(directory=str(tmp_path))
+        frame_cache.set_frame("products/1000.parquet",
+                              pd.DataFrame({"id": [1, 2, 3], "price": [1.5, 2.0, 3.0]}))
+        transport = Mock(spec=HTTPTransport)
+        service = ProductsService(base_url="https://api.example.com", transport=transport,
+                                  frame_cache=frame_cache)
+
+        records = list(service.iter_products(chunk_size=2, as_records=True))
+        assert records == [[{"id": 1, "price": 1.5}, {"id": 2, "price": 2.0}],
+                           [{"id": 3, "price": 3.0}]]
+        assert type(records[0][0]["id"]) is int
+        transport.request.assert_not_called()
+
+    def test_invalid_chunk_size(self):
+        """Test chunk_size must be positive."""
+        service = ProductsService(base_url="https://api.example.com",
+                                  transport=Mock(spec=HTTPTransport))
+        with pytest.raises(ValueError):
+            next(service.iter_products(chunk_size=0))
@@ -0,0 +1,123 @@
+"""Tests for journaled bulk submissions."""
+
+import json
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.payments import PaymentService
+from villa_ecommerce_sdk.resilience import RetryPolicy
+from villa_ecommerce_sdk.submissions import SubmissionJournal, idempotency_keys, submit_many
+
+
+class TestIdempotencyKeys:
+    """Test cases for idempotency key assignment."""
+
+    def test_keys_are_stable_per_run(self):
+        """Test keys depend on run and payload, and equal payloads get distinct keys."""
+        items = [{"payment_id": "P1", "amount": 5}, {"amount": 5, "payment_id": "P1"}, {"payment_id": "P2"}]
+        keys = idempotency_keys("run-1", "process_refund", items)
+
+        assert keys == idempotency_keys("run-1", "process_refund", items)
+        assert len(set(keys)) == 3
+        assert keys != idempotency_keys("run-2", "process_refund", items)
+
+    def test_explicit_keys_kept_and_unique(self):
+        """Test caller keys are used as-is and duplicates are rejected."""
+        assert idempotency_keys("r", "op", [{"idempotency_key": "K1"}]) == ["K1"]
+        with pytest.raises(ValueError):
+            idempotency_keys("r", "op", [{"idempotency_key": "K1"}, {"idempotency_key": "K1"}])
+
+
+class TestSubmitMany:
+    """Test cases for submit_many and SubmissionJournal."""
+
+    def test_bounded_concurrency_and_errors(self):
+        """Test at most max_workers items run at once and failures do not stop the batch."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def send(item, key):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.005)
+            with lock:
+                state["active"] -= 1
+            if item["n"] == 7:
+                raise Exception("declined")
+            return {"n": item["n"]}
+
+        result = submit_many(send, [{"n": n} for n in range(40)], "op", max_workers=4)
+
+        assert state["peak"] <= 4
+        assert len(result.results) == 39
+        assert not result.ok
+        assert str(result.errors[result.keys[7]]) == "declined"
+        assert result.results[result.keys[3]] == {"n": 3}
+
+    def test_resume_skips_completed_items(self, tmp_path):
+        """Test a rerun with the same journal re-sends only unfinished items, under the same keys."""
+        journal = tmp_path / "refunds.jsonl"
+        items = [{"payment_id": f"P{n}"} for n in range(5)]
+
+        def first(item, key):
+            if item["payment_id"] == "P3":
+                raise Exception("Failed to POST /api/payment/refund: 502")
+            return {"ok": item["payment_id"]}
+
+        run1 = submit_many(first, items, "process_refund", journal=journal)
+        assert list(run1.errors) == [run1.keys[3]]
+        # Simulate a crash while a record was being written
+        with open(journal, "a") as f:
+            f.write('{"key": "torn')
+
+        second = Mock(side_effect=lambda item, key: {"ok": item["payment_id"]})
+        run2 = submit_many(second, items, "process_refund", journal=journal)
+
+        assert run2.keys == run1.keys
+        second.assert_called_once_with({"payment_id": "P3"}, run1.keys[3])
+        assert run2.ok and len(run2.resumed) == 4
+        assert run2.results[run1.keys[0]] == {"ok": "P0"}
+        lines = journal.read_text().splitlines()
+        assert json.loads(lines[0])["operation"] == "process_refund"
+        assert json.loads(lines[-1])["state"] == "succeeded"
+
+        with pytest.raises(ValueError, match="process_refund"):
+            SubmissionJournal(journal, "create_payment")
+
+
+class TestPaymentBulkSubmission:
+    """Test cases for PaymentService bulk submission."""
+
+    def test_process_refunds_sends_idempotency_keys(self, make_response, make_transport):
+        """Test each refund carries its key, which also makes 503s retryable."""
+        transport = make_transport(
+            make_response({}, status_code=503), {"refundId": "R1"}, {"refundId": "R2"}
+        )
+        service = PaymentService(
+            "https://api.example.com", transport=transport,
+            retry_policy=RetryPolicy(backoff_base=0, sleep=lambda s: None)
+        )
+
+        result = service.process_refunds(
+            [{"payment_id": "P1", "amount": 10.0}, {"payment_id": "P2", "idempotency_key": "K2"}],
+            max_workers=1
+        )
+
+        assert result.ok
+        assert result.keys[1] == "K2"
+        sent = [c[1]["headers"]["Idempotency-Key"] for c in transport.request.call_args_list]
+        assert sent == [result.keys[0], result.keys[0], "K2"]
+        assert transport.request.call_args[1]["json"] == {"paymentId": "P2"}
+
+    def test_create_payments_passes_items(self):
+        """Test payment items are forwarded to create_payment with their key."""
+        service = PaymentService("https://api.example.com")
+        service.create_payment = Mock(side_effect=lambda **kwargs: {"orderId": kwargs["order_id"]})
+
+        result = service.create_payments([{"order_id": "O1", "amount": 100.0}])
+
+        key = result.keys[0]
+        service.create_payment.assert_called_once_with(order_id="O1", amount=100.0, idempotency_key=key)
+        assert result.results == {key: {"orderId": "O1"}}
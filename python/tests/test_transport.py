@@ -0,0 +1,102 @@
+"""Tests for pooled HTTP transport."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from unittest.mock import Mock
+from villa_ecommerce_sdk.transport import HTTPTransport, TransportStats
+from villa_ecommerce_sdk.products import ProductsService
+from villa_ecommerce_sdk.inventory import InventoryService
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    """Keep-alive capable handler returning a small JSON list."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps([{"id": 1, "path": self.path}]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Run a local HTTP/1.1 server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPTransport:
+    """Test cases for HTTPTransport."""
+
+    def test_stats_ratio(self):
+        """Test derived reuse counters."""
+        stats = TransportStats(requests=10, connections_opened=2)
+        assert stats.connections_reused == 8
+        assert stats.reuse_ratio == 0.8
+        assert TransportStats().reuse_ratio == 0.0
+
+    def test_connection_reuse(self, server_url):
+        """Test sequential requests share one keep-alive connection."""
+        with HTTPTransport() as transport:
+            for _ in range(5):
+                response = transport.request("GET", f"{server_url}/ping")
+                assert response.status_code == 200
+
+            stats = transport.stats()
+            assert stats.requests == 5
+            assert stats.connections_opened == 1
+            assert stats.connections_reused == 4
+
+    def test_keep_alive_disabled(self, server_url):
+        """Test every request opens a new connection without keep-alive."""
+        with HTTPTransport(keep_alive=False) as transport:
+            for _ in range(3):
+                transport.request("GET", f"{server_url}/ping")
+
+            assert transport.stats().connections_opened == 3
+
+    def test_tcp_keepalive_socket_option(self, server_url):
+        """Test TCP keep-alive transport still serves requests."""
+        with HTTPTransport(tcp_keepalive=True) as transport:
+            response = transport.request("GET", f"{server_url}/ping")
+            assert response.json()[0]["path"] == "/ping"
+
+    def test_services_share_transport(self, server_url):
+        """Test services created with one transport reuse its connections."""
+        with HTTPTransport() as transport:
+            products = ProductsService(base_url=server_url, transport=transport)
+            inventory = InventoryService(base_url=server_url, transport=transport)
+
+            assert len(products.get_product_list(branch=1000)) == 1
+            assert len(inventory.get_inventory(branch=1000)) == 1
+
+            stats = transport.stats()
+            assert stats.requests == 2
+            assert stats.connections_opened == 1
+
+    def test_base_service_uses_transport(self):
+        """Test _make_request sends through the configured transport."""
+        response = Mock()
+        response.json.return_value = {"ok": True}
+        transport = Mock(spec=HTTPTransport)
+        transport.request.return_value = response
+
+        service = ProductsService(base_url="https://api.example.com", transport=transport)
+        result = service._get("/api/test")
+
+        assert result == {"ok": True}
+        transport.request.assert_called_once()
+        assert transport.request.call_args[0] == ("GET", "https://api.example.com/api/test")